@@ -0,0 +1,260 @@
+import logging
+import warnings
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# cara menggabungkan nilai anak ke wilayah induk
+AGREGASI = ("sum", "mean")
+
+
+def _agregat_metrik(arr):
+    # arr: (wilayah, tahun) -> agregat satu metrik
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        mean_provinsi = np.nanmean(arr, axis=1)
+        return {
+            "total_tahun": np.nansum(arr, axis=0),
+            "mean_tahun": np.nanmean(arr, axis=0),
+            "total_provinsi": np.nansum(arr, axis=1),
+            "mean_provinsi": mean_provinsi,
+            "mean_nasional": np.nanmean(mean_provinsi),
+        }
+
+
+def _indeks_peringkat(arr):
+    # arr: (wilayah, tahun) -> urutan naik/turun per tahun (NaN di belakang),
+    # posisi tiap wilayah di kedua urutan, dan persentil; dihitung sekali per metrik
+    valid = ~np.isnan(arr)
+    n_valid = valid.sum(axis=0)
+    naik = np.argsort(np.where(valid, arr, np.inf), axis=0, kind="stable")
+    turun = np.argsort(np.where(valid, -arr, np.inf), axis=0, kind="stable")
+
+    nomor = np.broadcast_to(np.arange(1, arr.shape[0] + 1, dtype=float)[:, None], arr.shape)
+    posisi_naik = np.empty(arr.shape)
+    posisi_turun = np.empty(arr.shape)
+    np.put_along_axis(posisi_naik, naik, nomor, axis=0)
+    np.put_along_axis(posisi_turun, turun, nomor, axis=0)
+
+    # persentil = % wilayah bernilai <= nilai sendiri; nilai kembar memakai
+    # posisi terakhir kelompoknya (akhir kelompok dicari mundur, tanpa loop)
+    urut = np.take_along_axis(np.where(valid, arr, np.inf), naik, axis=0)
+    akhir = np.ones(arr.shape, dtype=bool)
+    akhir[:-1] = urut[1:] != urut[:-1]
+    ujung = np.where(akhir, nomor, np.inf)
+    ujung = np.minimum.accumulate(ujung[::-1], axis=0)[::-1]
+    persentil = np.empty(arr.shape)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        np.put_along_axis(persentil, naik, ujung / n_valid * 100, axis=0)
+
+    kosong = ~valid
+    posisi_naik[kosong] = np.nan
+    posisi_turun[kosong] = np.nan
+    persentil[kosong] = np.nan
+    return {
+        "naik": naik,
+        "turun": turun,
+        "n_valid": n_valid,
+        "posisi_naik": posisi_naik,
+        "posisi_turun": posisi_turun,
+        "persentil": persentil,
+    }
+
+
+def rollup_array(arr, induk, n_induk, agregasi="sum"):
+    # arr: (anak, tahun); induk: indeks induk tiap anak. Satu bincount untuk semua tahun.
+    n_tahun = arr.shape[1]
+    valid = ~np.isnan(arr)
+    pos = (np.asarray(induk)[:, None] * n_tahun + np.arange(n_tahun)).ravel()
+    ukuran = n_induk * n_tahun
+    jumlah = np.bincount(pos, weights=np.where(valid, arr, 0.0).ravel(), minlength=ukuran)
+    cacah = np.bincount(pos, weights=valid.ravel(), minlength=ukuran)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        hasil = jumlah / cacah if agregasi == "mean" else np.where(cacah > 0, jumlah, np.nan)
+    return hasil.reshape(n_induk, n_tahun)
+
+
+# ================================================================
+# KUBUS AGREGAT PROVINSI × TAHUN × METRIK
+# ================================================================
+class AggregateCube:
+    # values: array (metrik, provinsi, tahun), NaN = data kosong
+
+    def __init__(self, kode, nama, tahun, values, label=None):
+        self.kode = np.asarray(kode)
+        self.nama = np.asarray(nama, dtype=object)
+        self.tahun = np.asarray(tahun)
+        self.metrik = []
+        self.values = np.empty((0, len(self.kode), len(self.tahun)))
+        self.label = dict(label or {})
+        self._index_metrik = {}
+        self._index_tahun = {int(t): i for i, t in enumerate(self.tahun)}
+        self._agregat = {k: [] for k in ("total_tahun", "mean_tahun", "total_provinsi", "mean_provinsi", "mean_nasional")}
+        # indeks peringkat per metrik (urutan, posisi, persentil per tahun)
+        self._peringkat = []
+        # kubus induk hasil rollup: (kubus, indeks induk per baris, agregasi per metrik)
+        self._induk = []
+        for nama_metrik, arr in values.items():
+            self.tambah_metrik(nama_metrik, arr)
+
+    @classmethod
+    def dari_frame(cls, df, kolom_tahun, metrik, kolom_nama, kolom_label=(), kolom_kode="kode_provinsi"):
+        kode = np.sort(df[kolom_kode].unique())
+        tahun = np.sort(df[kolom_tahun].unique())
+        pi = np.searchsorted(kode, df[kolom_kode].to_numpy())
+        yi = np.searchsorted(tahun, df[kolom_tahun].to_numpy())
+
+        nama = np.empty(len(kode), dtype=object)
+        nama[pi] = df[kolom_nama].to_numpy()
+
+        # baris ganda (wilayah, tahun) digabung dengan max seperti groupby(...).max()
+        # versi lama, dan dilaporkan supaya tidak diam-diam mengubah KPI
+        sel = pi * len(tahun) + yi
+        ganda = pd.Series(sel).duplicated(keep=False).to_numpy()
+        if ganda.any():
+            contoh = sorted({(kode[p], tahun[y]) for p, y in zip(pi[ganda], yi[ganda])})
+            logger.warning(
+                "%d baris ganda (%s, %s) digabung dengan max: %s",
+                int(ganda.sum()), kolom_kode, kolom_tahun,
+                ", ".join(f"{int(k)}/{int(t)}" for k, t in contoh[:10]),
+            )
+
+        values = {}
+        for kolom in metrik:
+            arr = np.full((len(kode), len(tahun)), np.nan)
+            nilai = pd.to_numeric(df[kolom], errors="coerce").to_numpy(dtype=float)
+            if ganda.any():
+                # fmax mengabaikan NaN, sama dengan max pandas
+                np.fmax.at(arr, (pi, yi), nilai)
+            else:
+                arr[pi, yi] = nilai
+            values[kolom] = arr
+
+        label = {}
+        for kolom in kolom_label:
+            arr = np.full((len(kode), len(tahun)), None, dtype=object)
+            arr[pi, yi] = df[kolom].to_numpy()
+            label[kolom] = arr
+
+        return cls(kode, nama, tahun, values, label)
+
+    # ================= MENAMBAH / MEMPERBARUI METRIK =================
+    def tambah_metrik(self, nama, arr):
+        arr = np.asarray(arr, dtype=float).reshape(1, len(self.kode), len(self.tahun))
+        self._index_metrik[nama] = len(self.metrik)
+        self.metrik.append(nama)
+        self.values = np.concatenate([self.values, arr])
+
+        # agregat nasional & indeks peringkat hanya dihitung untuk metrik baru, bukan per rerun
+        for k, v in _agregat_metrik(arr[0]).items():
+            self._agregat[k].append(v)
+        self._susun_agregat()
+        self._peringkat.append(_indeks_peringkat(arr[0]))
+
+        for induk, gi, agregasi in self._induk:
+            induk.tambah_metrik(nama, rollup_array(arr[0], gi, len(induk.kode), agregasi.get(nama, "sum")))
+
+    def perbarui_irisan(self, metrik, tahun, nilai):
+        # ganti satu irisan (metrik, tahun); agregat & kubus induk ikut diperbarui
+        m, y = self.m(metrik), self.y(tahun)
+        self.values[m, :, y] = np.asarray(nilai, dtype=float)
+        for k, v in _agregat_metrik(self.values[m]).items():
+            self._agregat[k][m] = v
+        self._susun_agregat()
+        self._peringkat[m] = _indeks_peringkat(self.values[m])
+
+        for induk, gi, agregasi in self._induk:
+            kolom = self.values[m, :, y:y + 1]
+            baru = rollup_array(kolom, gi, len(induk.kode), agregasi.get(metrik, "sum"))[:, 0]
+            induk.perbarui_irisan(metrik, tahun, baru)
+
+    def _susun_agregat(self):
+        self.total_tahun = np.array(self._agregat["total_tahun"]).reshape(-1, len(self.tahun))
+        self.mean_tahun = np.array(self._agregat["mean_tahun"]).reshape(-1, len(self.tahun))
+        self.total_provinsi = np.array(self._agregat["total_provinsi"]).reshape(-1, len(self.kode))
+        self.mean_provinsi = np.array(self._agregat["mean_provinsi"]).reshape(-1, len(self.kode))
+        self.mean_nasional = np.array(self._agregat["mean_nasional"])
+        self.total_nasional = self.total_tahun.sum(axis=1)
+
+    # ================= ROLL-UP KE WILAYAH INDUK =================
+    def rollup(self, kode_induk, nama_induk=None, agregasi=None):
+        # kode_induk: kode wilayah induk untuk tiap baris (mis. kabupaten -> provinsi)
+        agregasi = dict(agregasi or {})
+        kode, gi = np.unique(np.asarray(kode_induk), return_inverse=True)
+        if nama_induk is None:
+            nama = kode.astype(str)
+        else:
+            nama = pd.Series(nama_induk).reindex(kode).fillna("").to_numpy(dtype=object)
+
+        values = {
+            metrik: rollup_array(self.values[i], gi, len(kode), agregasi.get(metrik, "sum"))
+            for i, metrik in enumerate(self.metrik)
+        }
+        induk = AggregateCube(kode, nama, self.tahun, values)
+        # didaftarkan supaya metrik / irisan baru di tingkat bawah ikut naik
+        self._induk.append((induk, gi, agregasi))
+        return induk
+
+    # ================= LOOKUP =================
+    def m(self, metrik):
+        return self._index_metrik[metrik]
+
+    def y(self, tahun):
+        return self._index_tahun[int(tahun)]
+
+    def irisan(self, metrik, tahun):
+        return self.values[self.m(metrik), :, self.y(tahun)]
+
+    def total(self, metrik):
+        return self.total_nasional[self.m(metrik)]
+
+    def rata_rata_provinsi(self, metrik):
+        return self.mean_nasional[self.m(metrik)]
+
+    def total_per_tahun(self, metrik):
+        return self.total_tahun[self.m(metrik)]
+
+    def total_per_provinsi(self, metrik):
+        return self.total_provinsi[self.m(metrik)]
+
+    # ================= TOP / BOTTOM N (DARI INDEKS PERINGKAT) =================
+    def urutan(self, metrik, tahun, n=10, terbesar=False):
+        indeks, y = self._peringkat[self.m(metrik)], self.y(tahun)
+        urut = indeks["turun" if terbesar else "naik"][:, y]
+        return urut[:min(n, indeks["n_valid"][y])]
+
+    def posisi(self, metrik, tahun, terbesar=False):
+        # peringkat tiap wilayah (1 = terkecil, atau terbesar), NaN = data kosong
+        indeks = self._peringkat[self.m(metrik)]
+        return indeks["posisi_turun" if terbesar else "posisi_naik"][:, self.y(tahun)]
+
+    def persentil(self, metrik, tahun):
+        # % wilayah dengan nilai <= nilai wilayah ini
+        return self._peringkat[self.m(metrik)]["persentil"][:, self.y(tahun)]
+
+    def perubahan_peringkat(self, metrik, dari, ke, terbesar=False):
+        # positif = naik posisi (angka peringkat mengecil) dari tahun `dari` ke `ke`
+        return self.posisi(metrik, dari, terbesar) - self.posisi(metrik, ke, terbesar)
+
+    def peringkat_frame(self, metrik, tahun, n=10, terbesar=False, kolom_nama="provinsi", kolom_kode="kode_provinsi"):
+        idx = self.urutan(metrik, tahun, n, terbesar)
+        df = pd.DataFrame({
+            kolom_kode: self.kode[idx],
+            kolom_nama: self.nama[idx],
+            metrik: self.irisan(metrik, tahun)[idx],
+        })
+        for kolom, arr in self.label.items():
+            df[kolom] = arr[idx, self.y(tahun)]
+        return df
+
+    def posisi_frame(self, metrik, tahun, terbesar=False, sejak=None, kolom_nama="provinsi", kolom_kode="kode_provinsi"):
+        # semua wilayah berurutan dengan peringkat, persentil dan perubahan peringkat sejak tahun `sejak`
+        idx = self.urutan(metrik, tahun, len(self.kode), terbesar)
+        df = self.peringkat_frame(metrik, tahun, len(self.kode), terbesar, kolom_nama, kolom_kode)
+        df["peringkat"] = self.posisi(metrik, tahun, terbesar)[idx].astype(int)
+        df["persentil"] = self.persentil(metrik, tahun)[idx]
+        if sejak is not None:
+            df[f"perubahan_peringkat_sejak_{int(sejak)}"] = self.perubahan_peringkat(metrik, sejak, tahun, terbesar)[idx]
+        return df
@@ -0,0 +1,165 @@
+import hashlib
+import json
+
+from data_store import dataset_version
+from dataset import (
+    load_cube_gizi,
+    load_cube_produksi,
+    load_panel_geospasial,
+    versi_gizi,
+)
+from kabupaten import load_cube_kabupaten, versi_kabupaten
+from produksi import versi_produksi
+
+# ================================================================
+# ANALITIK TANPA UI (DIPAKAI SLIDE & API JSON)
+# ================================================================
+# Semua fungsi mengembalikan struktur Python biasa (dict/list/float/int)
+# yang langsung bisa di-JSON-kan; angka sama persis dengan yang tampil di
+# dashboard karena memakai kubus & panel tercache yang sama.
+KOMODITAS = {"padi": "produksi_padi", "jagung": "produksi_jagung"}
+
+TINGKAT = ("provinsi", "kabupaten")
+
+
+def versi():
+    # versi gabungan semua sumber (CSV, slice produksi, data kabupaten)
+    bagian = f"{dataset_version()}:{versi_produksi()}:{versi_kabupaten()}"
+    return hashlib.sha1(bagian.encode("utf-8")).hexdigest()[:16]
+
+
+def _records(df):
+    # NaN -> null, numpy -> tipe Python; nilai asal float32 (skema) dibulatkan
+    # supaya 70.16 tidak keluar sebagai 70.1600036621
+    pecahan = df.select_dtypes("floating").columns
+    if len(pecahan):
+        df = df.assign(**{k: df[k].astype("float64").round(4) for k in pecahan})
+    return json.loads(df.to_json(orient="records", force_ascii=False))
+
+
+def _angka(x):
+    x = float(x)
+    return None if x != x else x
+
+
+def _kubus_produksi(tingkat="provinsi"):
+    if tingkat not in TINGKAT:
+        raise ValueError(f"tingkat harus salah satu dari {', '.join(TINGKAT)}")
+    if tingkat == "provinsi":
+        return load_cube_produksi(versi_produksi()), "provinsi"
+    kubus = load_cube_kabupaten(versi_kabupaten())
+    if kubus is None:
+        raise LookupError("data kabupaten/kota belum tersedia")
+    return kubus[0], "kabupaten_kota"
+
+
+def _kolom_komoditas(komoditas):
+    if komoditas not in KOMODITAS:
+        raise ValueError(f"komoditas harus salah satu dari {', '.join(KOMODITAS)}")
+    return KOMODITAS[komoditas]
+
+
+def _cek_n(n):
+    n = int(n)
+    if n < 1:
+        raise ValueError("n harus bilangan bulat >= 1")
+    return n
+
+
+def _cek_tahun(cube, tahun):
+    tahun = int(tahun)
+    if tahun not in cube._index_tahun:
+        raise LookupError(f"tahun {tahun} tidak tersedia ({', '.join(map(str, cube.tahun))})")
+    return tahun
+
+
+# ================================================================
+# PRODUKSI (SLIDE 1)
+# ================================================================
+def kpi_produksi():
+    cube, _ = _kubus_produksi()
+    return {
+        "tahun_awal": int(cube.tahun.min()),
+        "tahun_akhir": int(cube.tahun.max()),
+        "total_padi": _angka(cube.total("produksi_padi")),
+        "total_jagung": _angka(cube.total("produksi_jagung")),
+        "rata_rata_padi_per_provinsi": _angka(cube.rata_rata_provinsi("produksi_padi")),
+        "rata_rata_jagung_per_provinsi": _angka(cube.rata_rata_provinsi("produksi_jagung")),
+        "jumlah_provinsi": int(len(cube.kode)),
+    }
+
+
+def tren_produksi():
+    cube, _ = _kubus_produksi()
+    return {
+        "tahun": [int(t) for t in cube.tahun],
+        **{k: [_angka(v) for v in cube.total_per_tahun(kolom)] for k, kolom in KOMODITAS.items()},
+    }
+
+
+def produksi_terendah(tahun, komoditas="padi", n=10, tingkat="provinsi"):
+    cube, label = _kubus_produksi(tingkat)
+    kolom = _kolom_komoditas(komoditas)
+    tahun = _cek_tahun(cube, tahun)
+    kode = "kode_provinsi" if tingkat == "provinsi" else "kode_kabkota"
+    df = cube.peringkat_frame(kolom, tahun, n=_cek_n(n), kolom_nama=label, kolom_kode=kode)
+    return {"tahun": tahun, "komoditas": komoditas, "tingkat": tingkat, "data": _records(df)}
+
+
+def posisi_produksi(tahun, komoditas="padi", kode=None, sejak=None, tingkat="provinsi"):
+    # peringkat (1 = produksi terkecil), persentil & perubahan peringkat semua
+    # wilayah, atau satu wilayah jika `kode` diisi
+    cube, label = _kubus_produksi(tingkat)
+    kolom = _kolom_komoditas(komoditas)
+    tahun = _cek_tahun(cube, tahun)
+    sejak = _cek_tahun(cube, sejak) if sejak is not None else int(cube.tahun.min())
+    kode_kolom = "kode_provinsi" if tingkat == "provinsi" else "kode_kabkota"
+    df = cube.posisi_frame(kolom, tahun, sejak=sejak, kolom_nama=label, kolom_kode=kode_kolom)
+    df = df.rename(columns={f"perubahan_peringkat_sejak_{sejak}": "perubahan_peringkat"})
+    jumlah = len(df)
+    if kode is not None:
+        df = df[df[kode_kolom] == int(kode)]
+        if df.empty:
+            raise LookupError(f"kode {kode} tidak punya data {komoditas} tahun {tahun}")
+    return {
+        "tahun": tahun, "sejak": sejak, "komoditas": komoditas, "tingkat": tingkat,
+        "jumlah_wilayah": jumlah,
+        "data": _records(df),
+    }
+
+
+# ================================================================
+# IKP × BENCANA × PASAR (SLIDE 3)
+# ================================================================
+def panel_ikp(tahun=None):
+    panel = load_panel_geospasial()
+    tahun_list = [int(t) for t in panel.index.unique()]
+    if tahun is None:
+        tahun = max(tahun_list)
+    tahun = int(tahun)
+    if tahun not in tahun_list:
+        raise LookupError(f"tahun {tahun} tidak tersedia ({', '.join(map(str, tahun_list))})")
+
+    irisan = panel.loc[[tahun]]
+    kolom = [
+        "kode_provinsi", "Province", "IKP", "Kerentanan Area", "Kategori Bencana", "Kategori Pasar",
+        "Total_Disaster", "Total_Flood", "Total_Drought", "Jumlah",
+        "Pasar Tradisional", "Pusat Perbelanjaan", "Toko Swalayan",
+    ]
+    return {
+        "tahun": tahun,
+        "rata_rata_pasar_nasional": _angka(irisan["Rata-rata Jumlah Nasional"].iloc[0]),
+        "data": _records(irisan[[k for k in kolom if k in irisan.columns]]),
+    }
+
+
+# ================================================================
+# GIZI & KESEHATAN (SLIDE 4)
+# ================================================================
+def stunting_tertinggi(tahun, n=10):
+    cube = load_cube_gizi(versi_gizi())
+    tahun = _cek_tahun(cube, tahun)
+    df = cube.peringkat_frame(
+        "prevalensi_balita_stunting", tahun, n=_cek_n(n), terbesar=True, kolom_nama="PROVINSI"
+    )
+    return {"tahun": tahun, "data": _records(df)}
@@ -0,0 +1,153 @@
+import argparse
+import hashlib
+import json
+import logging
+import sys
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+import analitik
+from instrumen import daftarkan_lru, span
+from lru import LRUCache
+
+# ================================================================
+# KONFIGURASI API JSON LOKAL
+# ================================================================
+HOST = "127.0.0.1"
+PORT = 8502
+
+# batas total ukuran respons JSON di cache (dipakai bersama semua klien)
+MAX_RESPONS_BYTES = 16 * 1024 * 1024
+
+# dinaikkan saat bentuk respons berubah, supaya ETag lama klien tidak berlaku
+VERSI_API = 1
+
+# path -> (fungsi analitik, parameter query yang diterima)
+RUTE = {
+    "/api/versi": (lambda: {"versi": analitik.versi()}, ()),
+    "/api/produksi/kpi": (analitik.kpi_produksi, ()),
+    "/api/produksi/tren": (analitik.tren_produksi, ()),
+    "/api/produksi/terendah": (analitik.produksi_terendah, ("tahun", "komoditas", "n", "tingkat")),
+    "/api/produksi/peringkat": (analitik.posisi_produksi, ("tahun", "komoditas", "kode", "sejak", "tingkat")),
+    "/api/ikp/panel": (analitik.panel_ikp, ("tahun",)),
+    "/api/gizi/stunting": (analitik.stunting_tertinggi, ("tahun", "n")),
+}
+
+
+# ================================================================
+# CACHE RESPONS + ETAG PER VERSI DATASET
+# ================================================================
+respons_cache = LRUCache(MAX_RESPONS_BYTES)
+daftarkan_lru("api", respons_cache)
+
+
+def etag(versi, path, query):
+    # ETag hanya bergantung pada versi dataset & permintaan, jadi 304
+    # bisa dijawab tanpa menghitung atau membaca cache respons
+    kunci = f"{VERSI_API}|{versi}|{path}|{sorted(query.items())}"
+    return '"' + hashlib.sha1(kunci.encode("utf-8")).hexdigest()[:20] + '"'
+
+
+def jawab(path, query):
+    # (body bytes, etag) untuk satu permintaan; error dilempar ke handler
+    fungsi, parameter = RUTE[path]
+    asing = set(query) - set(parameter)
+    if asing:
+        raise ValueError(f"parameter tidak dikenal: {', '.join(sorted(asing))}")
+
+    tag = etag(analitik.versi(), path, query)
+    body = respons_cache.get(tag)
+    if body is None:
+        hasil = fungsi(**query)
+        body = json.dumps(hasil, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        respons_cache.put(tag, body)
+    return body, tag
+
+
+# ================================================================
+# HANDLER HTTP
+# ================================================================
+class Handler(BaseHTTPRequestHandler):
+
+    server_version = "DashboardPanganAPI/1.0"
+
+    def _kirim(self, status, body=b"", tag=None):
+        self.send_response(status)
+        if tag:
+            self.send_header("ETag", tag)
+            self.send_header("Cache-Control", "no-cache")
+        if status != 304:
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if status != 304 and self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _error(self, status, pesan):
+        self._kirim(status, json.dumps({"error": pesan}, ensure_ascii=False).encode("utf-8"))
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        path = url.path.rstrip("/") or "/"
+        if path not in RUTE:
+            self._error(404, f"endpoint tidak ditemukan: {path}")
+            return
+        query = dict(parse_qsl(url.query))
+
+        with span(f"api {path}"):
+            try:
+                # cek 304 dulu: cukup hitung ETag dari versi dataset
+                tag = etag(analitik.versi(), path, query)
+                if tag in _daftar_tag(self.headers.get("If-None-Match", "")):
+                    self._kirim(304, tag=tag)
+                    return
+                body, tag = jawab(path, query)
+            except (ValueError, TypeError) as e:
+                self._error(400, str(e))
+                return
+            except LookupError as e:
+                self._error(404, str(e))
+                return
+            except Exception:
+                # bug di analitik tidak boleh memutus koneksi tanpa jawaban
+                logging.getLogger("api").exception("galat tak terduga di %s", path)
+                self._error(500, "galat internal server")
+                return
+        self._kirim(200, body, tag)
+
+    do_HEAD = do_GET
+
+    def log_message(self, format, *args):
+        logging.getLogger("api").info("%s %s", self.address_string(), format % args)
+
+
+def _daftar_tag(header):
+    return {t.strip().removeprefix("W/") for t in header.split(",") if t.strip()}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="API JSON lokal untuk angka-angka dashboard.")
+    parser.add_argument("--host", default=HOST, help=f"alamat bind (default {HOST})")
+    parser.add_argument("--port", type=int, default=PORT, help=f"port (default {PORT})")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    # loader tercache memakai st.cache_*; di luar `streamlit run` Streamlit
+    # memberi peringatan "missing ScriptRunContext" per thread, tidak perlu ditampilkan
+    from streamlit.logger import set_log_level
+
+    set_log_level("error")
+
+    server = ThreadingHTTPServer((args.host, args.port), Handler)
+    print(f"API berjalan di http://{args.host}:{args.port} ({', '.join(RUTE)})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
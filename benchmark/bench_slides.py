@@ -0,0 +1,253 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# ================================================================
+# KONFIGURASI BENCHMARK
+# ================================================================
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_PATH = os.path.join(BASE_DIR, "app_eda.py")
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+# widget yang disapu per slide: (jenis, label widget, nama interaksi)
+SKENARIO = {
+    1: [
+        ("selectbox", "Pilih Tahun:", "tahun_pilih"),
+        ("selectbox", "Pilih Tahun", "tahun_pilih_peta"),
+        ("radio", "Pilih Komoditas", "komoditas"),
+    ],
+    2: [
+        ("selectbox", "Pilih PROVINSI", "selected_prov"),
+        ("selectbox", "Pilih TAHUN", "selected_year"),
+        ("selectbox", "Pilih Faktor", "selected_factor"),
+    ],
+    3: [
+        ("selectbox", "Pilih Tahun IKP", "selected_year"),
+    ],
+    4: [
+        ("selectbox", "Pilih Tahun:", "tahun_pilih"),
+    ],
+    5: [
+        ("selectbox", "Pilih Tahun Analisis:", "tahun_pilih"),
+    ],
+}
+
+# batas regresi terhadap baseline
+THRESHOLD = {
+    "wall_ms": {"rasio": 1.5, "toleransi": 100},
+    "peak_rss_mb": {"rasio": 1.25, "toleransi": 20},
+    "figures": {"rasio": 1.0, "toleransi": 0},
+    "payload_bytes": {"rasio": 1.10, "toleransi": 2048},
+}
+
+
+# ================================================================
+# PENGUKURAN (DIJALANKAN DI PROSES ANAK PER SLIDE)
+# ================================================================
+class _Penghitung:
+
+    def __init__(self):
+        self.figures = 0
+        self.media_bytes = 0
+
+    def pasang(self):
+        import matplotlib.figure
+        from streamlit.runtime.memory_media_file_storage import MemoryMediaFileStorage
+
+        penghitung = self
+        init_asli = matplotlib.figure.Figure.__init__
+        simpan_asli = MemoryMediaFileStorage.load_and_get_id
+
+        def init(fig, *args, **kwargs):
+            penghitung.figures += 1
+            init_asli(fig, *args, **kwargs)
+
+        def simpan(storage, path_or_data, *args, **kwargs):
+            if isinstance(path_or_data, (bytes, bytearray)):
+                penghitung.media_bytes += len(path_or_data)
+            return simpan_asli(storage, path_or_data, *args, **kwargs)
+
+        matplotlib.figure.Figure.__init__ = init
+        MemoryMediaFileStorage.load_and_get_id = simpan
+
+    def reset(self):
+        self.figures = 0
+        self.media_bytes = 0
+
+
+def _payload_bytes(node):
+    total = 0
+    proto = getattr(node, "proto", None)
+    if proto is not None and hasattr(proto, "ByteSize"):
+        total += proto.ByteSize()
+    for child in getattr(node, "children", {}).values():
+        total += _payload_bytes(child)
+    return total
+
+
+def _peak_rss_mb():
+    if resource is None:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _jalankan(at, penghitung, aksi):
+    penghitung.reset()
+    t0 = time.perf_counter()
+    aksi()
+    wall_ms = (time.perf_counter() - t0) * 1000
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+    return {
+        "wall_ms": round(wall_ms, 1),
+        "peak_rss_mb": _peak_rss_mb(),
+        "figures": penghitung.figures,
+        "plotly_charts": len(at.get("plotly_chart")),
+        "payload_bytes": _payload_bytes(at._tree) + penghitung.media_bytes,
+    }
+
+
+def _widget(at, jenis, label):
+    for w in getattr(at, jenis):
+        if w.label == label:
+            return w
+    raise LookupError(f"widget {jenis} '{label}' tidak ditemukan")
+
+
+def ukur_slide(slide, maks_nilai=None):
+    from streamlit.testing.v1 import AppTest
+
+    penghitung = _Penghitung()
+    penghitung.pasang()
+
+    at = AppTest.from_file(APP_PATH, default_timeout=300)
+    hasil = []
+
+    # buka aplikasi (landing di slide 1), lalu pindah lewat tombol sidebar
+    if slide == 1:
+        hasil.append(("buka", _jalankan(at, penghitung, at.run)))
+    else:
+        at.run()
+        tombol = at.sidebar.button[slide - 1]
+        hasil.append(("buka", _jalankan(at, penghitung, lambda: tombol.click().run())))
+
+    hasil.append(("rerun", _jalankan(at, penghitung, at.run)))
+
+    for jenis, label, nama in SKENARIO[slide]:
+        awal = _widget(at, jenis, label).value
+        nilai_list = [v for v in _widget(at, jenis, label).options if v != awal]
+        if maks_nilai:
+            nilai_list = nilai_list[:maks_nilai]
+        for nilai in nilai_list + [awal]:
+            w = _widget(at, jenis, label)
+            hasil.append((f"{nama}={nilai}", _jalankan(at, penghitung, lambda: w.set_value(nilai).run())))
+
+    return [{"slide": slide, "interaksi": nama, **r} for nama, r in hasil]
+
+
+# ================================================================
+# RINGKASAN & PERBANDINGAN BASELINE
+# ================================================================
+def ringkas(baris):
+    # satu angka per (slide, jenis interaksi): median waktu, maks lainnya
+    grup = {}
+    for r in baris:
+        jenis = r["interaksi"].split("=")[0]
+        grup.setdefault(f"slide{r['slide']}:{jenis}", []).append(r)
+
+    ringkasan = {}
+    for kunci, rs in sorted(grup.items()):
+        rss = [r["peak_rss_mb"] for r in rs if r["peak_rss_mb"] is not None]
+        ringkasan[kunci] = {
+            "n": len(rs),
+            "wall_ms": round(statistics.median(r["wall_ms"] for r in rs), 1),
+            "wall_ms_maks": max(r["wall_ms"] for r in rs),
+            "peak_rss_mb": round(max(rss), 1) if rss else None,
+            "figures": max(r["figures"] for r in rs),
+            "payload_bytes": max(r["payload_bytes"] for r in rs),
+        }
+    return ringkasan
+
+
+def bandingkan(ringkasan, baseline):
+    regresi = []
+    for kunci, base in baseline.items():
+        now = ringkasan.get(kunci)
+        if now is None:
+            continue
+        for metrik, batas in THRESHOLD.items():
+            b, n = base.get(metrik), now.get(metrik)
+            if b is None or n is None:
+                continue
+            if n > b * batas["rasio"] + batas["toleransi"]:
+                regresi.append(f"{kunci} {metrik}: {b} -> {n}")
+    return regresi
+
+
+def _jalankan_anak(slide, maks_nilai):
+    cmd = [sys.executable, os.path.abspath(__file__), "--anak", str(slide)]
+    if maks_nilai:
+        cmd += ["--maks-nilai", str(maks_nilai)]
+    out = subprocess.run(cmd, cwd=BASE_DIR, capture_output=True, text=True)
+    if out.returncode != 0:
+        raise RuntimeError(f"slide {slide} gagal:\n{out.stderr[-2000:]}")
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark rerun per slide dashboard secara headless.")
+    parser.add_argument("--slide", type=int, action="append", help="slide yang diukur (default semua)")
+    parser.add_argument("--maks-nilai", type=int, default=None, help="batasi jumlah nilai per widget")
+    parser.add_argument("--update-baseline", action="store_true", help="simpan hasil sebagai baseline baru")
+    parser.add_argument("--output", help="simpan hasil mentah per interaksi ke file JSON")
+    parser.add_argument("--anak", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.anak:
+        print(json.dumps(ukur_slide(args.anak, args.maks_nilai)))
+        return 0
+
+    baris = []
+    for slide in args.slide or sorted(SKENARIO):
+        # proses terpisah supaya peak RSS per slide tidak tercampur
+        baris.extend(_jalankan_anak(slide, args.maks_nilai))
+
+    ringkasan = ringkas(baris)
+    for kunci, r in ringkasan.items():
+        print(
+            f"{kunci:<32} n={r['n']:<3} {r['wall_ms']:>8.1f} ms (maks {r['wall_ms_maks']:.1f})"
+            f"  rss={r['peak_rss_mb']} MB  fig={r['figures']}  payload={r['payload_bytes']:,} B"
+        )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(baris, f, indent=2)
+
+    if args.update_baseline:
+        with open(BASELINE_PATH, "w", encoding="utf-8") as f:
+            json.dump(ringkasan, f, indent=2, sort_keys=True)
+        print(f"Baseline disimpan ke {BASELINE_PATH}")
+        return 0
+
+    if not os.path.exists(BASELINE_PATH):
+        print("Belum ada baseline, jalankan dengan --update-baseline.")
+        return 0
+
+    with open(BASELINE_PATH, encoding="utf-8") as f:
+        regresi = bandingkan(ringkasan, json.load(f))
+    for r in regresi:
+        print(f"REGRESI {r}")
+    return 1 if regresi else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
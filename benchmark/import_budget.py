@@ -0,0 +1,80 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+# ================================================================
+# BUDGET WAKTU IMPORT PER HALAMAN
+# ================================================================
+# Waktu diukur SETELAH modul dasar (streamlit, pandas, numpy) dimuat,
+# jadi angka ini adalah biaya tambahan membuka halaman tersebut.
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODUL_DASAR = ["streamlit", "pandas", "numpy"]
+MODUL_BERAT = ["matplotlib", "seaborn", "sklearn", "statsmodels", "plotly"]
+
+BUDGET = {
+    "provinsi": {"max_ms": 150, "dilarang": MODUL_BERAT},
+    "halaman.slide1": {"max_ms": 900, "dilarang": ["seaborn", "sklearn", "statsmodels"]},
+    "halaman.slide2": {"max_ms": 300, "dilarang": ["matplotlib", "seaborn", "sklearn", "statsmodels"]},
+    "halaman.slide3": {"max_ms": 300, "dilarang": ["matplotlib", "seaborn", "sklearn", "statsmodels"]},
+    # seaborn ikut memuat statsmodels saat import
+    "halaman.slide4": {"max_ms": 2000, "dilarang": ["sklearn", "plotly"]},
+    "halaman.slide5": {"max_ms": 2000, "dilarang": ["sklearn", "plotly"]},
+}
+
+_SKRIP_UKUR = """
+import json, sys, time
+for m in {dasar!r}:
+    __import__(m)
+sebelum = set(sys.modules)
+t0 = time.perf_counter()
+__import__({modul!r})
+ms = (time.perf_counter() - t0) * 1000
+baru = {{m.split(".")[0] for m in set(sys.modules) - sebelum}}
+print(json.dumps({{"ms": ms, "modul": sorted(baru)}}))
+"""
+
+
+def ukur(modul, ulang=3):
+    hasil = []
+    for _ in range(ulang):
+        out = subprocess.run(
+            [sys.executable, "-c", _SKRIP_UKUR.format(dasar=MODUL_DASAR, modul=modul)],
+            cwd=BASE_DIR, capture_output=True, text=True, check=True
+        )
+        hasil.append(json.loads(out.stdout.strip().splitlines()[-1]))
+    # median dari beberapa proses dingin
+    hasil.sort(key=lambda h: h["ms"])
+    return hasil[len(hasil) // 2]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Cek budget waktu import per halaman dashboard.")
+    parser.add_argument("--ulang", type=int, default=3, help="jumlah proses dingin per modul")
+    parser.add_argument("--json", action="store_true", help="cetak hasil sebagai JSON")
+    args = parser.parse_args(argv)
+
+    laporan = {}
+    gagal = False
+    for modul, budget in BUDGET.items():
+        h = ukur(modul, args.ulang)
+        berat = sorted(set(h["modul"]) & set(budget["dilarang"]))
+        lolos = h["ms"] <= budget["max_ms"] and not berat
+        gagal = gagal or not lolos
+        laporan[modul] = {"ms": round(h["ms"], 1), "max_ms": budget["max_ms"], "modul_dilarang": berat, "lolos": lolos}
+
+    if args.json:
+        print(json.dumps(laporan, indent=2))
+    else:
+        for modul, r in laporan.items():
+            status = "OK  " if r["lolos"] else "GAGAL"
+            extra = f"  dilarang: {', '.join(r['modul_dilarang'])}" if r["modul_dilarang"] else ""
+            print(f"{status} {modul:<16} {r['ms']:>8.1f} ms / {r['max_ms']} ms{extra}")
+
+    return 1 if gagal else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,544 @@
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+from bench_slides import APP_PATH, BASE_DIR, SKENARIO
+
+try:
+    import websockets
+except ImportError:  # hanya dibutuhkan uji beban
+    websockets = None
+
+# ================================================================
+# KONFIGURASI UJI BEBAN
+# ================================================================
+HOST = "127.0.0.1"
+PORT = 8599
+
+# jumlah sesi browser bersamaan per tahap, dinaikkan bertahap
+LEVEL_SESI = [1, 2, 4, 8, 16]
+DURASI = 30  # detik per tahap
+JEDA = 1.0  # rata-rata jeda berpikir antar klik (detik, eksponensial)
+SLO_P95_MS = 1000  # batas p95 latensi rerun untuk angka kapasitas
+TIMEOUT = 120  # detik menunggu satu rerun selesai
+INTERVAL_SAMPEL = 0.5  # detik antar sampel RSS / CPU server
+
+# widget bertahun disapu semua opsinya, widget lain (provinsi, faktor,
+# komoditas) diambil acak sebanyak ini per kunjungan slide
+MAKS_PILIHAN = 3
+
+# delta_path[0]: 0 = area utama, 1 = sidebar (tombol navigasi slide)
+SIDEBAR = 1
+
+SELESAI = {
+    ForwardMsg.FINISHED_SUCCESSFULLY,
+    ForwardMsg.FINISHED_FRAGMENT_RUN_SUCCESSFULLY,
+}
+
+
+# ================================================================
+# KLIEN WEBSOCKET STREAMLIT (SATU SESI BROWSER)
+# ================================================================
+class KlienStreamlit:
+    # meniru frontend: kirim BackMsg rerun_script berisi semua nilai widget,
+    # baca ForwardMsg sampai script_finished; widget di dalam fragmen
+    # dijalankan ulang dengan fragment_id seperti di browser
+
+    def __init__(self, url, timeout=TIMEOUT):
+        self.url = url
+        self.timeout = timeout
+        self.ws = None
+        self.page_hash = ""
+        self.slide = 1
+        self.widget = {}  # label -> {"id", "opsi", "fragmen"}
+        self.nilai = {}  # id widget -> nilai string yang sedang dipilih
+        self.tombol_slide = []
+
+    async def buka(self):
+        self.ws = await websockets.connect(
+            self.url, subprotocols=["streamlit"], max_size=None, open_timeout=self.timeout,
+        )
+        return await self._rerun()
+
+    async def tutup(self):
+        if self.ws is not None:
+            await self.ws.close()
+
+    def opsi(self, label):
+        return self.widget[label]["opsi"]
+
+    def terpilih(self, label):
+        w = self.widget[label]
+        return self.nilai.get(w["id"], w["default"])
+
+    async def klik_slide(self, slide):
+        hasil = await self._rerun(pemicu=self.tombol_slide[slide - 1])
+        self.slide = slide
+        return hasil
+
+    async def pilih(self, label, nilai):
+        w = self.widget[label]
+        self.nilai[w["id"]] = nilai
+        return await self._rerun(fragmen=w["fragmen"])
+
+    def _catat_elemen(self, msg, dilihat):
+        delta = msg.delta
+        if delta.WhichOneof("type") != "new_element":
+            return None
+        elemen = delta.new_element
+        jenis = elemen.WhichOneof("type")
+        if jenis == "exception":
+            return elemen.exception.message or "exception"
+        if jenis == "button" and msg.metadata.delta_path[:1] == [SIDEBAR]:
+            self.tombol_slide.append(elemen.button.id)
+        elif jenis in ("selectbox", "radio"):
+            w = getattr(elemen, jenis)
+            opsi = list(w.options)
+            default = opsi[w.default] if w.HasField("default") and w.default < len(opsi) else None
+            self.widget[w.label] = {"id": w.id, "opsi": opsi, "default": default, "fragmen": delta.fragment_id}
+            dilihat.add(w.id)
+        return None
+
+    async def _rerun(self, pemicu=None, fragmen=""):
+        back = BackMsg()
+        rerun = back.rerun_script
+        rerun.query_string = ""
+        rerun.page_script_hash = self.page_hash
+        if fragmen:
+            rerun.fragment_id = fragmen
+        for wid, nilai in self.nilai.items():
+            state = rerun.widget_states.widgets.add()
+            state.id = wid
+            state.string_value = nilai
+        if pemicu:
+            state = rerun.widget_states.widgets.add()
+            state.id = pemicu
+            state.trigger_value = True
+
+        if not fragmen:
+            # run penuh: daftar widget & tombol disusun ulang dari elemen yang tampil
+            self.tombol_slide = []
+        dilihat, galat, n_byte = set(), None, 0
+        t0 = time.perf_counter()
+        await self.ws.send(back.SerializeToString())
+        while True:
+            sisa = self.timeout - (time.perf_counter() - t0)
+            data = await asyncio.wait_for(self.ws.recv(), timeout=max(sisa, 0.001))
+            n_byte += len(data)
+            msg = ForwardMsg()
+            msg.ParseFromString(data)
+            jenis = msg.WhichOneof("type")
+            if jenis == "new_session":
+                self.page_hash = msg.new_session.page_script_hash
+            elif jenis == "delta":
+                galat = self._catat_elemen(msg, dilihat) or galat
+            elif jenis == "script_finished":
+                if msg.script_finished not in SELESAI:
+                    galat = galat or f"script_finished={msg.script_finished}"
+                break
+        ms = (time.perf_counter() - t0) * 1000
+
+        if not fragmen:
+            # widget yang tidak tampil lagi (pindah slide) dibuang, seperti di browser
+            self.nilai = {k: v for k, v in self.nilai.items() if k in dilihat}
+            self.widget = {k: w for k, w in self.widget.items() if w["id"] in dilihat}
+        return {"ms": round(ms, 1), "bytes": n_byte, "fragmen": bool(fragmen), "galat": galat}
+
+
+# ================================================================
+# JALUR KLIK PENGGUNA
+# ================================================================
+def _sapuan(rng, klien, label):
+    # tahun disapu berurutan (year sweep), lainnya dipilih acak
+    opsi = [v for v in klien.opsi(label) if v != klien.terpilih(label)]
+    if "tahun" in label.lower():
+        return opsi
+    return rng.sample(opsi, min(MAKS_PILIHAN, len(opsi)))
+
+
+async def jalur_slide(klien, slide, rng, catat, jeda, batas=None):
+    # satu kunjungan: pindah slide lalu sapu widget skenario benchmark
+    if klien.slide != slide:
+        await asyncio.sleep(rng.expovariate(1 / jeda) if jeda else 0)
+        catat(slide, "pindah_slide", await klien.klik_slide(slide))
+    for _, label, nama in SKENARIO[slide]:
+        if label not in klien.widget:
+            continue
+        for nilai in _sapuan(rng, klien, label):
+            if batas is not None and time.monotonic() >= batas:
+                return
+            await asyncio.sleep(rng.expovariate(1 / jeda) if jeda else 0)
+            catat(slide, nama, await klien.pilih(label, nilai))
+
+
+async def sesi_pengguna(url, batas, rng, catat, jeda):
+    await asyncio.sleep(rng.uniform(0, jeda))
+    while time.monotonic() < batas:
+        klien = KlienStreamlit(url)
+        try:
+            catat(1, "buka", await klien.buka())
+            while time.monotonic() < batas:
+                await jalur_slide(klien, rng.choice(sorted(SKENARIO)), rng, catat, jeda, batas)
+        except (asyncio.TimeoutError, websockets.exceptions.ConnectionClosed, OSError) as e:
+            # sesi putus / macet: dicatat sebagai galat lalu sambung ulang
+            catat(klien.slide, "galat", {"ms": None, "bytes": 0, "fragmen": False,
+                                          "galat": f"{type(e).__name__}: {e}"})
+            await asyncio.sleep(1)
+        finally:
+            await klien.tutup()
+
+
+async def pemanasan(url):
+    # satu sesi menyapu semua slide & widget: cache loader, kubus dan figure terisi
+    baris = []
+    klien = KlienStreamlit(url)
+    rng = random.Random(0)
+    try:
+        baris.append(await klien.buka())
+        for slide in sorted(SKENARIO):
+            await jalur_slide(klien, slide, rng, lambda s, a, r: baris.append(r), jeda=0)
+    finally:
+        await klien.tutup()
+    return baris
+
+
+# ================================================================
+# SAMPEL SERVER: RSS, CPU, METRIK INSTRUMEN
+# ================================================================
+def _baca_proses(pid):
+    # (detik CPU, RSS MB) proses server dari /proc; None di luar Linux
+    try:
+        with open(f"/proc/{pid}/stat") as f:
+            bagian = f.read().rsplit(")", 1)[1].split()
+        with open(f"/proc/{pid}/status") as f:
+            rss = next(int(b.split()[1]) for b in f if b.startswith("VmRSS:")) / 1024
+    except (OSError, ValueError, StopIteration):
+        return None
+    return (int(bagian[11]) + int(bagian[12])) / os.sysconf("SC_CLK_TCK"), rss
+
+
+def _baca_cpu_sistem():
+    # (jiffy sibuk, jiffy total) semua inti
+    try:
+        with open("/proc/stat") as f:
+            angka = [int(x) for x in f.readline().split()[1:]]
+    except (OSError, ValueError):
+        return None
+    idle = angka[3] + (angka[4] if len(angka) > 4 else 0)
+    return sum(angka) - idle, sum(angka)
+
+
+async def sampel_server(pid, level, sampel, berhenti, t_mulai):
+    # t = detik sejak uji dimulai (RSS dari waktu ke waktu)
+    t0 = time.perf_counter()
+    awal, sistem, klien = _baca_proses(pid), _baca_cpu_sistem(), os.times()
+    while not berhenti.is_set():
+        try:
+            await asyncio.wait_for(berhenti.wait(), timeout=INTERVAL_SAMPEL)
+        except asyncio.TimeoutError:
+            pass
+        t1 = time.perf_counter()
+        kini, sistem_kini, klien_kini = _baca_proses(pid), _baca_cpu_sistem(), os.times()
+        if kini is None or awal is None:
+            continue
+        dt = t1 - t0
+        baris = {
+            "t": round(t1 - t_mulai, 2),
+            "sesi": level,
+            "rss_mb": round(kini[1], 1),
+            # % satu inti; skrip Streamlit berjalan di bawah satu GIL, jadi ~100% = jenuh
+            "cpu_server": round((kini[0] - awal[0]) / dt * 100, 1),
+            # proses uji beban ini sendiri (ikut berebut CPU jika satu mesin)
+            "cpu_generator": round((klien_kini.user + klien_kini.system - klien.user - klien.system) / dt * 100, 1),
+        }
+        if sistem and sistem_kini and sistem_kini[1] > sistem[1]:
+            baris["cpu_sistem"] = round((sistem_kini[0] - sistem[0]) / (sistem_kini[1] - sistem[1]) * 100, 1)
+        sampel.append(baris)
+        t0, awal, sistem, klien = t1, kini, sistem_kini, klien_kini
+
+
+def baca_prometheus(path):
+    # counter cache dari metrics.prom instrumen.py: {(metrik, cache): nilai}
+    nilai = {}
+    try:
+        with open(path, encoding="utf-8") as f:
+            for baris in f:
+                m = re.match(r'(dashboard_(?:cache|lru)_\w+)\{cache="([^"]*)"\} (\S+)', baris)
+                if m:
+                    nilai[(m[1], m[2])] = float(m[3])
+    except OSError:
+        pass
+    return nilai
+
+
+def rasio_hit(awal, akhir):
+    beda = {k: v - awal.get(k, 0) for k, v in akhir.items()}
+    hasil = {}
+    panggilan = sum(v for (m, _), v in beda.items() if m == "dashboard_cache_calls_total")
+    miss = sum(v for (m, _), v in beda.items() if m == "dashboard_cache_misses_total")
+    if panggilan:
+        hasil["loader"] = round(1 - miss / panggilan, 4)
+    for (m, cache), hit in beda.items():
+        if m != "dashboard_lru_hits_total":
+            continue
+        total = hit + beda.get(("dashboard_lru_misses_total", cache), 0)
+        if total:
+            hasil[cache] = round(hit / total, 4)
+    return hasil
+
+
+def baca_run_server(path, offset):
+    # durasi run di sisi server (spans.jsonl) sejak offset byte; tanpa antrean
+    ms = []
+    try:
+        with open(path, encoding="utf-8") as f:
+            f.seek(offset)
+            for baris in f:
+                try:
+                    ms.append(json.loads(baris)["ms"])
+                except (ValueError, KeyError):
+                    continue
+            return ms, f.tell()
+    except OSError:
+        return ms, offset
+
+
+# ================================================================
+# SERVER STREAMLIT LOKAL
+# ================================================================
+def mulai_server(port, metrik_dir, log_path):
+    # interval 0: metrics.prom & spans.jsonl ditulis tiap run, dibaca tepat di batas tahap
+    env = dict(os.environ, DASHBOARD_METRIK="1", DASHBOARD_METRIK_INTERVAL="0", DASHBOARD_METRIK_DIR=metrik_dir)
+    cmd = [
+        sys.executable, "-m", "streamlit", "run", APP_PATH,
+        "--server.headless", "true",
+        "--server.address", HOST,
+        "--server.port", str(port),
+        "--server.fileWatcherType", "none",
+        "--browser.gatherUsageStats", "false",
+    ]
+    log = open(log_path, "w", encoding="utf-8")
+    proses = subprocess.Popen(cmd, cwd=BASE_DIR, env=env, stdout=log, stderr=subprocess.STDOUT)
+    batas = time.monotonic() + 60
+    while time.monotonic() < batas:
+        if proses.poll() is not None:
+            break
+        try:
+            with urllib.request.urlopen(f"http://{HOST}:{port}/_stcore/health", timeout=1) as r:
+                if r.status == 200:
+                    return proses
+        except OSError:
+            time.sleep(0.3)
+    proses.kill()
+    with open(log_path, encoding="utf-8") as f:
+        raise RuntimeError(f"server Streamlit gagal jalan di port {port}:\n{f.read()[-2000:]}")
+
+
+def henti_server(proses):
+    proses.terminate()
+    try:
+        proses.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        proses.kill()
+
+
+# ================================================================
+# RINGKASAN PER TAHAP
+# ================================================================
+def persentil(data, p):
+    # nearest-rank
+    if not data:
+        return None
+    urut = sorted(data)
+    return urut[max(math.ceil(p / 100 * len(urut)) - 1, 0)]
+
+
+def _latensi(ms):
+    return {"n": len(ms), **{f"p{p}": persentil(ms, p) for p in (50, 95, 99)}}
+
+
+def ringkas_tahap(level, durasi, baris, sampel, hit, server_ms):
+    ok = [r for r in baris if not r["galat"]]
+    ms = [r["ms"] for r in ok]
+    per_slide = {}
+    for slide in sorted(SKENARIO):
+        per_slide[f"slide{slide}"] = _latensi([r["ms"] for r in ok if r["slide"] == slide])
+    fragmen = [r["ms"] for r in ok if r["fragmen"]]
+    cpu = [s["cpu_server"] for s in sampel]
+    rss = [s["rss_mb"] for s in sampel]
+    return {
+        "sesi": level,
+        **_latensi(ms),
+        "galat": len(baris) - len(ok),
+        "rerun_per_detik": round(len(ok) / durasi, 2),
+        "p95_fragmen": persentil(fragmen, 95),
+        "server_p50": persentil(server_ms, 50),
+        "server_p95": persentil(server_ms, 95),
+        "rss_awal_mb": rss[0] if rss else None,
+        "rss_maks_mb": max(rss) if rss else None,
+        "rss_akhir_mb": rss[-1] if rss else None,
+        "cpu_server_rata": round(statistics.mean(cpu), 1) if cpu else None,
+        "cpu_server_maks": max(cpu) if cpu else None,
+        "cpu_sistem_rata": round(statistics.mean(s["cpu_sistem"] for s in sampel if "cpu_sistem" in s), 1)
+        if any("cpu_sistem" in s for s in sampel) else None,
+        "cpu_generator_rata": round(statistics.mean(s["cpu_generator"] for s in sampel), 1) if sampel else None,
+        "hit": hit,
+        "per_slide": per_slide,
+        "galat_contoh": sorted({r["galat"] for r in baris if r["galat"]})[:5],
+    }
+
+
+def kapasitas(tahap, slo):
+    # sesi terbanyak berturut-turut dari tahap terkecil dengan p95 <= SLO tanpa galat
+    lolos = None
+    for t in tahap:
+        if t["galat"] or t["p95"] is None or t["p95"] > slo:
+            break
+        lolos = t["sesi"]
+    return lolos
+
+
+def slide_pertama_lambat(tahap, slo):
+    # slide yang p95-nya paling awal melewati SLO; jika belum ada, p95 tertinggi di tahap terakhir
+    for t in tahap:
+        lewat = [(r["p95"], s) for s, r in t["per_slide"].items() if r["p95"] is not None and r["p95"] > slo]
+        if lewat:
+            p95, slide = max(lewat)
+            return {"slide": slide, "sesi": t["sesi"], "p95": p95, "lewat_slo": True}
+    if not tahap:
+        return None
+    akhir = [(r["p95"], s) for s, r in tahap[-1]["per_slide"].items() if r["p95"] is not None]
+    if not akhir:
+        return None
+    p95, slide = max(akhir)
+    return {"slide": slide, "sesi": tahap[-1]["sesi"], "p95": p95, "lewat_slo": False}
+
+
+def _ms(x):
+    return "-" if x is None else f"{x:.0f}"
+
+
+def cetak_tahap(t):
+    hit = "  ".join(f"{k} {v:.0%}" for k, v in sorted(t["hit"].items()))
+    print(
+        f"N={t['sesi']:<3} rerun={t['n']:<5} galat={t['galat']:<3} {t['rerun_per_detik']:>6.2f}/s"
+        f"  p50 {_ms(t['p50']):>6} ms  p95 {_ms(t['p95']):>6} ms  p99 {_ms(t['p99']):>6} ms"
+        f"  (server p95 {_ms(t['server_p95'])} ms)"
+    )
+    print(
+        f"      rss {_ms(t['rss_awal_mb'])}→{_ms(t['rss_maks_mb'])} MB"
+        f"  cpu server {_ms(t['cpu_server_rata'])}% (maks {_ms(t['cpu_server_maks'])}%)"
+        f"  sistem {_ms(t['cpu_sistem_rata'])}%  generator {_ms(t['cpu_generator_rata'])}%"
+        f"  hit {hit or '-'}"
+    )
+    for slide, r in t["per_slide"].items():
+        if r["n"]:
+            print(f"      {slide:<7} n={r['n']:<4} p50 {_ms(r['p50']):>6}  p95 {_ms(r['p95']):>6}  p99 {_ms(r['p99']):>6} ms")
+    for g in t["galat_contoh"]:
+        print(f"      GALAT {g}")
+
+
+# ================================================================
+# MAIN
+# ================================================================
+async def uji_beban(args, proses, metrik_dir):
+    url = f"ws://{HOST}:{args.port}/_stcore/stream"
+    prom_path = os.path.join(metrik_dir, "metrics.prom")
+    spans_path = os.path.join(metrik_dir, "spans.jsonl")
+
+    t0 = time.perf_counter()
+    hangat = await pemanasan(url)
+    print(f"Pemanasan: {len(hangat)} rerun dalam {time.perf_counter() - t0:.1f} s "
+          f"(rerun terlama {max(r['ms'] for r in hangat):.0f} ms)")
+    _, offset = baca_run_server(spans_path, 0)
+
+    tahap, semua_sampel, mentah = [], [], []
+    for level in args.sesi:
+        baris = []
+
+        def catat(slide, aksi, hasil, level=level):
+            baris.append({"sesi": level, "slide": slide, "aksi": aksi, **hasil})
+
+        prom_awal = baca_prometheus(prom_path)
+        sampel, berhenti = [], asyncio.Event()
+        pencatat = asyncio.create_task(sampel_server(proses.pid, level, sampel, berhenti, t0))
+        batas = time.monotonic() + args.durasi
+        await asyncio.gather(*(
+            sesi_pengguna(url, batas, random.Random(args.seed * 1000 + level * 100 + i), catat, args.jeda)
+            for i in range(level)
+        ))
+        berhenti.set()
+        await pencatat
+
+        server_ms, offset = baca_run_server(spans_path, offset)
+        hit = rasio_hit(prom_awal, baca_prometheus(prom_path))
+        t = ringkas_tahap(level, args.durasi, baris, sampel, hit, server_ms)
+        cetak_tahap(t)
+        tahap.append(t)
+        semua_sampel.extend(sampel)
+        mentah.extend(baris)
+
+    return {"pemanasan": hangat, "tahap": tahap, "sampel": semua_sampel, "rerun": mentah}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Uji beban: N sesi browser simulasi (websocket) ke `streamlit run app_eda.py` lokal."
+    )
+    parser.add_argument("--sesi", type=int, nargs="+", default=LEVEL_SESI, help=f"jumlah sesi bersamaan per tahap (default {LEVEL_SESI})")
+    parser.add_argument("--durasi", type=float, default=DURASI, help=f"detik per tahap (default {DURASI})")
+    parser.add_argument("--jeda", type=float, default=JEDA, help=f"rata-rata jeda antar klik per sesi, detik (default {JEDA})")
+    parser.add_argument("--slo", type=float, default=SLO_P95_MS, help=f"batas p95 latensi rerun untuk kapasitas, ms (default {SLO_P95_MS})")
+    parser.add_argument("--port", type=int, default=PORT, help=f"port server uji (default {PORT})")
+    parser.add_argument("--seed", type=int, default=0, help="seed jalur klik")
+    parser.add_argument("--output", help="simpan ringkasan, sampel RSS/CPU dan rerun mentah ke file JSON")
+    args = parser.parse_args(argv)
+
+    if websockets is None:
+        print("Uji beban butuh paket `websockets` (pip install websockets).")
+        return 1
+
+    with tempfile.TemporaryDirectory(prefix="uji_beban_") as metrik_dir:
+        proses = mulai_server(args.port, metrik_dir, os.path.join(metrik_dir, "server.log"))
+        try:
+            print(f"Server pid {proses.pid} di http://{HOST}:{args.port}, {os.cpu_count()} inti CPU")
+            hasil = asyncio.run(uji_beban(args, proses, metrik_dir))
+        finally:
+            henti_server(proses)
+
+    tahap = hasil["tahap"]
+    maks = kapasitas(tahap, args.slo)
+    lambat = slide_pertama_lambat(tahap, args.slo)
+    print()
+    if maks is None:
+        print(f"Kapasitas per replika: tidak tercapai (N={args.sesi[0]} sudah p95 > {args.slo:.0f} ms atau ada galat)")
+    elif maks == tahap[-1]["sesi"]:
+        print(f"Kapasitas per replika: ≥ {maks} sesi bersamaan (p95 ≤ {args.slo:.0f} ms di semua tahap; naikkan --sesi)")
+    else:
+        print(f"Kapasitas per replika: {maks} sesi bersamaan (p95 ≤ {args.slo:.0f} ms, jeda klik {args.jeda} s)")
+    if lambat:
+        status = "pertama melewati SLO" if lambat["lewat_slo"] else "paling lambat (belum melewati SLO)"
+        print(f"Slide {status}: {lambat['slide']} (p95 {lambat['p95']:.0f} ms pada N={lambat['sesi']})")
+
+    if args.output:
+        hasil.update({"kapasitas": maks, "slide_lambat": lambat, "slo_p95_ms": args.slo, "jeda": args.jeda})
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(hasil, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
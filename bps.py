@@ -0,0 +1,131 @@
+import csv
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from data_store import DATASET_DIR, dataset_path, file_stamp, snapshot_frame
+from instrumen import tercache
+from provinsi import nama_provinsi, pasang_kode
+
+# ================================================================
+# FILE MENTAH BPS "LUAS PANEN, PRODUKTIVITAS, DAN PRODUKSI"
+# ================================================================
+# contoh: "Luas Panen, Produktivitas, dan Produksi Padi Menurut Provinsi, 2021.csv"
+#         "Luas Panen, Produksi, dan Produktivitas Jagung Menurut Provinsi, 2024.csv"
+POLA_FILE = re.compile(
+    r"Luas Panen, Produk\w+, dan Produk\w+ (?P<komoditas>\w+) Menurut Provinsi, (?P<tahun>\d{4})\.csv"
+)
+
+# naikkan jika hasil parser berubah, supaya snapshot lama tidak dipakai
+VERSI_PARSER = "bps-1"
+
+KOLOM = ["provinsi", "tahun", "komoditas", "luas_panen", "produktivitas", "produksi"]
+
+
+def temukan_file_bps():
+    hasil = []
+    for name in sorted(os.listdir(DATASET_DIR)):
+        cocok = POLA_FILE.fullmatch(name)
+        if cocok:
+            hasil.append((name, cocok["komoditas"].lower(), int(cocok["tahun"])))
+    return hasil
+
+
+def _kolom_metrik(judul):
+    judul = judul.lower()
+    # "produktivitas" dicek dulu karena juga mengandung "produk"
+    if "produktivitas" in judul:
+        return "produktivitas"
+    if "luas panen" in judul:
+        return "luas_panen"
+    if "produksi" in judul:
+        return "produksi"
+    return None
+
+
+def _angka(teks):
+    teks = teks.strip()
+    if teks in ("", "-", "…", "..."):
+        return np.nan
+    return float(teks)
+
+
+# ================================================================
+# PARSER STREAMING (BARIS PER BARIS)
+# ================================================================
+def parse_file_bps(name, komoditas, tahun):
+    posisi = None
+    baris = []
+
+    with open(dataset_path(name), "r", encoding="utf-8-sig", newline="") as f:
+        for row in csv.reader(f):
+            if posisi is None:
+                # cari baris judul kolom (header 1 baris padi / 4 baris jagung)
+                kolom = [_kolom_metrik(c) for c in row]
+                if {"luas_panen", "produktivitas", "produksi"} <= set(kolom):
+                    posisi = {k: i for i, k in enumerate(kolom) if k}
+                continue
+
+            if not row or not row[0].strip():
+                # baris tahun di bawah header jagung, atau baris kosong sebelum catatan
+                if baris:
+                    break
+                continue
+            if row[0].strip().lower() == "catatan":
+                break
+
+            baris.append((
+                row[0].strip(),
+                _angka(row[posisi["luas_panen"]]),
+                _angka(row[posisi["produktivitas"]]),
+                _angka(row[posisi["produksi"]]),
+            ))
+
+    if posisi is None:
+        raise ValueError(f"Header BPS tidak dikenali: {name}")
+
+    df = pd.DataFrame(baris, columns=["provinsi", "luas_panen", "produktivitas", "produksi"])
+    df.insert(1, "tahun", tahun)
+    df.insert(2, "komoditas", komoditas)
+    return df[KOLOM]
+
+
+def _frame_bps(info):
+    name, komoditas, tahun = info
+    # snapshot per file: file tahun lama tidak diparse ulang saat file baru masuk
+    return snapshot_frame(name, VERSI_PARSER, lambda: parse_file_bps(name, komoditas, tahun))
+
+
+# ================================================================
+# TABEL PANJANG TERCACHE
+# ================================================================
+# frame dipakai bersama semua sesi tanpa disalin (cache_resource): pemanggil
+# hanya membaca / membuat frame baru, tidak mengubahnya
+@tercache(st.cache_resource, show_spinner=False)
+def _load_produksi_bps(stamps):
+    files = temukan_file_bps()
+    if not files:
+        return pd.DataFrame(columns=["kode_provinsi"] + KOLOM)
+
+    with ThreadPoolExecutor(max_workers=min(8, len(files))) as pool:
+        frames = list(pool.map(_frame_bps, files))
+
+    df = pd.concat(frames, ignore_index=True)
+
+    # pencocokan provinsi sekali untuk semua file (nama unik saja)
+    df = pasang_kode(df, "provinsi", "File BPS Luas Panen/Produksi")
+    df["provinsi"] = df["kode_provinsi"].map(nama_provinsi())
+
+    return df[["kode_provinsi"] + KOLOM].sort_values(
+        ["komoditas", "tahun", "kode_provinsi"], ignore_index=True
+    )
+
+
+def load_produksi_bps():
+    # stamp semua file yang cocok pola: file baru / berubah -> cache invalid
+    stamps = tuple((name, file_stamp(name)) for name, _, _ in temukan_file_bps())
+    return _load_produksi_bps(stamps)
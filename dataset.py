@@ -0,0 +1,223 @@
+import pandas as pd
+import streamlit as st
+
+from agregat import AggregateCube
+from data_store import dataset_version, read_dataset
+from instrumen import tercache
+from produksi import SUMBER_WIDE, load_produksi_long, versi_produksi
+from provinsi import catat_tidak_cocok, nama_provinsi, pasang_kode
+from regresi import RegressionTable
+
+# ================================================================
+# FRAME BERSAMA (READ-ONLY)
+# ================================================================
+# Loader di bawah memakai st.cache_resource: satu objek frame per versi
+# dataset dipakai bersama semua sesi & rerun, tanpa pickle/unpickle per
+# panggilan. Konsekuensinya frame yang dikembalikan TIDAK boleh diubah
+# (tambah kolom, isi ulang nilai); kolom turunan dihitung di loader atau
+# di frame baru hasil filter/assign.
+FILE_IKP = "Indeks Ketahanan Pangan.csv"
+FILE_GIZI = "Analisis_gizi_dan_kesehata_keluarga.csv"
+FILE_SOSIAL = "Sosial Budaya - Dataset Utama.csv"
+FILE_PASAR = "Pasar_34_provinsi.csv"
+FILE_BENCANA = "merged_disaster_flood_drought.csv"
+
+
+# ================================================================
+# LOAD DATA
+# ================================================================
+def load_data():
+    # tahun ditemukan otomatis; slice baru ditambahkan tanpa mengolah ulang yang lama
+    return _pivot_produksi(versi_produksi())
+
+
+@tercache(st.cache_resource, show_spinner=False)
+def _pivot_produksi(versi):
+    long = load_produksi_long()
+    df = long.pivot_table(
+        index=["kode_provinsi", "tahun"], columns="komoditas", values="produksi", aggfunc="first"
+    )
+    # urutan kolom mengikuti SUMBER_WIDE (padi, jagung), komoditas lain di belakang
+    urutan = [k for k in SUMBER_WIDE if k in df.columns] + sorted(set(df.columns) - set(SUMBER_WIDE))
+    df = df[urutan].rename(columns=lambda k: f"produksi_{k}").reset_index()
+    df.columns.name = None
+
+    nama = long.drop_duplicates("kode_provinsi").set_index("kode_provinsi")["provinsi"]
+    df.insert(1, "provinsi", df["kode_provinsi"].map(nama))
+    return df
+
+
+def versi_gizi():
+    # versi frame gizi; kubus & tabel regresi turunannya wajib memakai versi yang sama
+    return dataset_version(FILE_GIZI, FILE_IKP)
+
+
+def load_gizi_data():
+    return _load_gizi_data(versi_gizi())
+
+
+@tercache(st.cache_resource, show_spinner=False)
+def _load_gizi_data(versi):
+    data = read_dataset(FILE_GIZI)
+    return pasang_kode(data, "PROVINSI", FILE_GIZI)
+
+
+# ================================================================
+# KUBUS AGREGAT (DIBANGUN SEKALI PER VERSI DATASET)
+# ================================================================
+@tercache(st.cache_resource)
+def load_cube_produksi(versi):
+    return AggregateCube.dari_frame(
+        load_data(), "tahun", ["produksi_padi", "produksi_jagung"], "provinsi"
+    )
+
+
+@tercache(st.cache_resource)
+def load_cube_gizi(versi):
+    return AggregateCube.dari_frame(
+        load_gizi_data(),
+        "TAHUN",
+        [
+            "IKP", "prevalensi_balita_stunting", "Konsumsi Protein (gram/kap/hari)",
+            "Produksi (ton)", "Import_Non_Migas"
+        ],
+        "PROVINSI",
+        ["Kerentanan Area"]
+    )
+
+
+# ================================================================
+# TABEL REGRESI (OLS ANALITIK, DIHITUNG SEKALI PER VERSI DATASET)
+# ================================================================
+@tercache(st.cache_resource)
+def load_regresi_stunting(versi):
+    return RegressionTable.dari_frame(
+        load_gizi_data(), "TAHUN", ["IKP"], "prevalensi_balita_stunting"
+    )
+
+
+@tercache(st.cache_resource)
+def load_regresi_impor(versi):
+    # baris yang sama dengan slide 5: produksi, impor, dan IKP lengkap
+    data = load_gizi_data()
+    kolom = ["Produksi (ton)", "Import_Non_Migas", "IKP"]
+    data = data[data[kolom].apply(pd.to_numeric, errors="coerce").notna().all(axis=1)]
+    return RegressionTable.dari_frame(data, "TAHUN", ["Import_Non_Migas"], "IKP")
+
+
+@tercache(st.cache_resource)
+def load_regresi_sosial(versi, faktor):
+    # semua faktor × tahun sekaligus untuk pilihan "Indonesia"
+    return RegressionTable.dari_frame(load_sosial_data(), "TAHUN", list(faktor), "IKP")
+
+
+@tercache(st.cache_resource)
+def load_regresi_sosial_provinsi(versi, faktor):
+    # satu provinsi hanya punya satu baris per tahun: dihitung lintas tahun
+    return RegressionTable.dari_frame(load_sosial_data(), "PROVINSI", list(faktor), "IKP")
+
+
+# ================================================================
+# SLIDE 2 — SOSIAL BUDAYA
+# ================================================================
+def versi_sosial():
+    # versi frame sosial; tabel regresi turunannya wajib memakai versi yang sama
+    return dataset_version(FILE_SOSIAL, FILE_IKP)
+
+
+def load_sosial_data():
+    return _load_sosial_data(versi_sosial())
+
+
+@tercache(st.cache_resource, show_spinner=False)
+def _load_sosial_data(versi):
+    # desimal koma & tipe kolom sudah ditangani skema saat parsing
+    df = read_dataset(FILE_SOSIAL)
+    df = pasang_kode(df, "PROVINSI", FILE_SOSIAL)
+    # ejaan lama (KEP. RIAU, dst.) disatukan ke nama kanonik
+    df["PROVINSI"] = df["kode_provinsi"].map(nama_provinsi()).astype("category")
+    return df
+
+
+# ================================================================
+# SLIDE 3 — LINGKUNGAN & GEOSPASIAL
+# ================================================================
+KATEGORI_BENCANA = ["Rendah", "Sedang", "Tinggi"]
+KATEGORI_PASAR = ["Akses Rendah", "Akses Sedang", "Akses Tinggi"]
+
+def load_ikp_data():
+    return _load_ikp_data(dataset_version(FILE_IKP))
+
+
+@tercache(st.cache_resource, show_spinner=False)
+def _load_ikp_data(versi):
+    df_ikp = read_dataset(FILE_IKP)
+    df_ikp = df_ikp.rename(columns={'Kode Provinsi': 'kode_provinsi'})
+    df_ikp['Province'] = df_ikp['kode_provinsi'].map(nama_provinsi()).astype('category')
+    return df_ikp.drop(columns=['PROVINSI'])
+
+def load_geospatial_data():
+    return _load_geospatial_data(dataset_version(FILE_PASAR, FILE_BENCANA, FILE_IKP))
+
+
+@tercache(st.cache_resource, show_spinner=False)
+def _load_geospatial_data(versi):
+    df_pasar = read_dataset(FILE_PASAR)
+    df_disaster = read_dataset(FILE_BENCANA)
+    df_ikp = load_ikp_data()
+
+    # === KODE PROVINSI KANONIK ===
+    df_pasar = pasang_kode(df_pasar, 'Provinsi', FILE_PASAR)
+    df_disaster = pasang_kode(df_disaster, 'Province', FILE_BENCANA)
+
+    # Baris rusak ("-") sudah menjadi NaN lewat skema
+    df_pasar = df_pasar[df_pasar['Jumlah'].notna()]
+
+    # Rata-rata IKP per provinsi (2019–2024)
+    df_ikp_avg = df_ikp.groupby('kode_provinsi')['IKP'].mean().reset_index()
+
+    # Kerentanan Area tahun terbaru (2024)
+    df_ikp_latest = df_ikp[df_ikp['TAHUN'] == 2024][['kode_provinsi', 'Kerentanan Area']]
+
+    # === MERGE SEMUA DATA (JOIN INTEGER) ===
+    df = df_disaster.drop(columns=['Province'])
+    df = df.merge(df_pasar.drop(columns=['Provinsi']), on='kode_provinsi', how='left')
+    df = df.merge(df_ikp_avg, on='kode_provinsi', how='left')
+    df = df.merge(df_ikp_latest, on='kode_provinsi', how='left')
+    df.insert(0, 'Province', df['kode_provinsi'].map(nama_provinsi()))
+
+    # Provinsi yang tidak lengkap datanya dilaporkan, lalu dibuang
+    wajib = ['IKP', 'Jumlah', 'Total_Disaster', 'Kerentanan Area']
+    tidak_lengkap = df[wajib].isna().any(axis=1)
+    if tidak_lengkap.any():
+        catat_tidak_cocok("Slide 3 (data tidak lengkap)", df.loc[tidak_lengkap, 'Province'])
+    df = df[~tidak_lengkap]
+
+    # === KOLOM TURUNAN (DIHITUNG SEKALI, BUKAN DI HALAMAN) ===
+    df = df.assign(**{
+        'Kategori Bencana': pd.qcut(df['Total_Disaster'], q=3, labels=KATEGORI_BENCANA),
+        'Kategori Pasar': pd.qcut(df['Jumlah'], q=3, labels=KATEGORI_PASAR),
+    })
+
+    return df
+
+
+def load_panel_geospasial():
+    return _load_panel_geospasial(dataset_version(FILE_PASAR, FILE_BENCANA, FILE_IKP))
+
+
+@tercache(st.cache_resource, show_spinner=False)
+def _load_panel_geospasial(versi):
+    # panel provinsi × tahun: bencana & pasar (tetap) + IKP per tahun, diindeks TAHUN;
+    # ganti tahun di slide 3 cukup panel.loc[[tahun]], tanpa merge/dropna/qcut ulang
+    df_geo = load_geospatial_data()
+    df_ikp = load_ikp_data()[['TAHUN', 'kode_provinsi', 'IKP', 'Kerentanan Area']]
+
+    panel = df_geo.drop(columns=['IKP', 'Kerentanan Area']).merge(df_ikp, on='kode_provinsi', how='inner')
+    panel = panel.dropna(subset=['IKP', 'Jumlah', 'Total_Disaster', 'Kerentanan Area'])
+
+    # garis "Rata-rata Nasional" per tahun (provinsi yang tampil di tahun itu)
+    panel['Rata-rata Jumlah Nasional'] = panel.groupby('TAHUN')['Jumlah'].transform('mean')
+
+    # urutan provinsi di dalam tiap tahun mengikuti df_geo (sort stabil)
+    return panel.sort_values('TAHUN', kind='stable').set_index('TAHUN')
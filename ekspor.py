@@ -0,0 +1,262 @@
+import argparse
+import hashlib
+import html
+import itertools
+import multiprocessing
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+# ================================================================
+# KONFIGURASI EKSPOR LAPORAN
+# ================================================================
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+APP_PATH = os.path.join(BASE_DIR, "app_eda.py")
+OUTPUT_DIR = os.path.join(BASE_DIR, "laporan")
+
+# dimensi yang disapu per slide: nama dimensi -> widget yang diset ke nilai sama
+DIMENSI = {
+    1: {
+        "tahun": [("selectbox", "Pilih Tahun:"), ("selectbox", "Pilih Tahun")],
+        "komoditas": [("radio", "Pilih Komoditas")],
+    },
+    2: {"tahun": [("selectbox", "Pilih TAHUN")]},
+    3: {"tahun": [("selectbox", "Pilih Tahun IKP")]},
+    4: {"tahun": [("selectbox", "Pilih Tahun:")]},
+    5: {"tahun": [("selectbox", "Pilih Tahun Analisis:")]},
+}
+
+JUDUL_SLIDE = {
+    1: "Full Dashboard",
+    2: "Sosial Ekonomi",
+    3: "Lingkungan & Geospasial",
+    4: "Gizi & Kesehatan",
+    5: "Produksi & Supply Chain",
+}
+
+CSS = """
+body{font-family:sans-serif;max-width:1200px;margin:24px auto;padding:0 16px;color:#222}
+.kolom{display:flex;gap:16px}.kolom>div{flex:1;min-width:0}
+.metric{display:inline-block;margin:4px 16px 4px 0}.metric span{display:block;font-size:.85em;color:#666}
+.metric b{font-size:1.4em}.alert{padding:10px 14px;border-radius:6px;margin:8px 0}
+.warning{background:#fff8e1}.success{background:#e8f5e9}.info{background:#e3f2fd}.error{background:#ffebee}
+.filter{color:#555;font-size:.9em}.caption{color:#777;font-size:.85em}img{max-width:100%}
+table{border-collapse:collapse;font-size:.8em}td,th{border:1px solid #ddd;padding:2px 6px}
+"""
+
+
+# ================================================================
+# ELEMEN STREAMLIT -> HTML
+# ================================================================
+def _markdown(teks):
+    if teks.strip() == "---":
+        return "<hr>"
+    teks = html.escape(teks.strip())
+    teks = re.sub(r"\*\*(.+?)\*\*", r"<b>\1</b>", teks)
+    baris = [b.strip() for b in teks.splitlines()]
+    if baris and all(b.startswith("- ") or not b for b in baris):
+        return "<ul>" + "".join(f"<li>{b[2:]}</li>" for b in baris if b) + "</ul>"
+    return "<p>" + "<br>".join(baris) + "</p>"
+
+
+class _Penulis:
+
+    def __init__(self, out_dir, nama, gambar, plotly_png=False):
+        self.out_dir = out_dir
+        self.nama = nama
+        # bytes dari render.tampilkan_figure, urutannya sama dengan elemen image di pohon
+        self.gambar = iter(gambar)
+        self.plotly_png = plotly_png
+        self.n_plotly = 0
+
+    def simpan_gambar(self):
+        chart_id, fmt, data = next(self.gambar)
+        # nama file = chart + hash isi, gambar yang sama dipakai ulang antar halaman
+        rel = f"img/{chart_id}-{hashlib.sha1(data).hexdigest()[:12]}.{fmt}"
+        path = os.path.join(self.out_dir, rel)
+        if not os.path.exists(path):
+            with open(path, "wb") as f:
+                f.write(data)
+        return f'<img src="{rel}">'
+
+    def plotly(self, proto):
+        self.n_plotly += 1
+        div = f"{self.nama}-plotly-{self.n_plotly}"
+        if self.plotly_png:
+            import plotly.io as pio
+
+            pio.from_json(proto.spec).write_image(os.path.join(self.out_dir, f"{div}.png"))
+        # spec dari Streamlit dipakai apa adanya, tanpa membangun ulang figure
+        return (
+            f'<div id="{div}"></div><script>(function(){{var s={proto.spec};'
+            f'Plotly.newPlot("{div}",s.data,s.layout,Object.assign({{responsive:true}},{proto.config or "{}"}));}})();</script>'
+        )
+
+    def elemen(self, node):
+        jenis = getattr(node, "type", None)
+        anak = list(getattr(node, "children", {}).values())
+
+        if jenis == "title":
+            return f"<h1>{html.escape(node.value)}</h1>"
+        if jenis == "header":
+            return f"<h2>{html.escape(node.value)}</h2>"
+        if jenis == "subheader":
+            return f"<h3>{html.escape(node.value)}</h3>"
+        if jenis == "markdown":
+            return _markdown(node.value)
+        if jenis == "caption":
+            return f'<p class="caption">{html.escape(node.value)}</p>'
+        if jenis == "metric":
+            return f'<div class="metric"><span>{html.escape(node.label)}</span><b>{html.escape(str(node.value))}</b></div>'
+        if jenis in ("warning", "success", "info", "error"):
+            return f'<div class="alert {jenis}">{html.escape(node.value)}</div>'
+        if jenis in ("selectbox", "radio"):
+            return f'<p class="filter">{html.escape(node.label)} <b>{html.escape(str(node.value))}</b></p>'
+        if jenis == "image":
+            return "".join(self.simpan_gambar() for _ in node.proto.imgs)
+        if jenis == "plotly_chart":
+            return self.plotly(node.proto)
+        if jenis == "dataframe":
+            return node.value.to_html(index=False, max_rows=200, na_rep="")
+        if jenis == "expander":
+            isi = "".join(self.elemen(c) for c in anak)
+            return f"<details><summary>{html.escape(node.label)}</summary>{isi}</details>"
+        if jenis == "flex_container" and anak and all(getattr(c, "type", None) == "column" for c in anak):
+            return '<div class="kolom">' + "".join(f"<div>{self.elemen(c)}</div>" for c in anak) + "</div>"
+        return "".join(self.elemen(c) for c in anak)
+
+
+def _halaman(judul, isi):
+    return (
+        f'<!DOCTYPE html><html lang="id"><head><meta charset="utf-8"><title>{html.escape(judul)}</title>'
+        f'<style>{CSS}</style><script src="plotly.min.js"></script></head><body>{isi}</body></html>'
+    )
+
+
+# ================================================================
+# WORKER: SATU HALAMAN PER (SLIDE, KOMBINASI)
+# ================================================================
+_app = {}
+
+
+def _widget(at, jenis, label):
+    for w in getattr(at, jenis):
+        if w.label == label:
+            return w
+    raise LookupError(f"widget {jenis} '{label}' tidak ditemukan")
+
+
+def _jalankan(at):
+    # AppTest mengganti __main__ dengan app_eda; dikembalikan agar fungsi
+    # worker tetap bisa di-pickle/unpickle oleh ProcessPoolExecutor
+    utama = sys.modules["__main__"]
+    try:
+        at.run()
+    finally:
+        sys.modules["__main__"] = utama
+
+
+def _buka_slide(slide):
+    from streamlit.testing.v1 import AppTest
+
+    # satu AppTest per slide per proses, dipakai ulang untuk semua kombinasi
+    if slide not in _app:
+        at = AppTest.from_file(APP_PATH, default_timeout=300)
+        at.session_state["slide"] = slide
+        _jalankan(at)
+        _app[slide] = at
+    return _app[slide]
+
+
+def _nama_file(slide, kombinasi):
+    bagian = [f"slide{slide}"] + [re.sub(r"\W+", "_", str(v)).strip("_") for _, v in kombinasi]
+    return "_".join(bagian)
+
+
+def ekspor_halaman(slide, kombinasi, out_dir, plotly_png=False):
+    from render import rekam_gambar
+
+    t0 = time.perf_counter()
+    at = _buka_slide(slide)
+
+    for dimensi, nilai in kombinasi:
+        for jenis, label in DIMENSI[slide][dimensi]:
+            _widget(at, jenis, label).set_value(nilai)
+    with rekam_gambar() as gambar:
+        _jalankan(at)
+    if at.exception:
+        raise RuntimeError(f"slide {slide} {kombinasi}: {at.exception[0].message}")
+    n_image = sum(len(e.proto.imgs) for e in at.get("image"))
+    if n_image != len(gambar):
+        raise RuntimeError(f"slide {slide} {kombinasi}: {n_image} image, {len(gambar)} figure terekam")
+
+    nama = _nama_file(slide, kombinasi)
+    isi = _Penulis(out_dir, nama, gambar, plotly_png).elemen(at.main)
+    judul = f"Slide {slide} — {JUDUL_SLIDE[slide]} ({', '.join(str(v) for _, v in kombinasi)})"
+    with open(os.path.join(out_dir, f"{nama}.html"), "w", encoding="utf-8") as f:
+        f.write(_halaman(judul, isi))
+    return nama, judul, (time.perf_counter() - t0) * 1000
+
+
+# ================================================================
+# PROSES INDUK: HITUNG SEKALI, LALU SEBAR KE WORKER
+# ================================================================
+def siapkan(slides):
+    # menjalankan tiap slide sekali di proses induk: semua loader, kubus, tabel
+    # regresi, geometri & cache render terisi, lalu diwarisi worker (fork)
+    kombinasi = []
+    for slide in slides:
+        at = _buka_slide(slide)
+        pilihan = [
+            [(dimensi, v) for v in _widget(at, *widgets[0]).options]
+            for dimensi, widgets in DIMENSI[slide].items()
+        ]
+        kombinasi += [(slide, tuple(k)) for k in itertools.product(*pilihan)]
+    return kombinasi
+
+
+def tulis_index(out_dir, hasil):
+    baris = "".join(f'<li><a href="{nama}.html">{html.escape(judul)}</a></li>' for nama, judul, _ in hasil)
+    with open(os.path.join(out_dir, "index.html"), "w", encoding="utf-8") as f:
+        f.write(_halaman("Laporan Dashboard Ketahanan Pangan", f"<h1>Laporan Dashboard Ketahanan Pangan</h1><ul>{baris}</ul>"))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ekspor semua slide × tahun × komoditas ke HTML/PNG statis.")
+    parser.add_argument("--slide", type=int, action="append", help="slide yang diekspor (default semua)")
+    parser.add_argument("--output", default=OUTPUT_DIR, help="folder hasil (default: laporan/)")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count(), help="jumlah proses worker")
+    parser.add_argument("--plotly-png", action="store_true", help="simpan juga chart Plotly sebagai PNG (butuh kaleido)")
+    args = parser.parse_args(argv)
+
+    t0 = time.perf_counter()
+    out_dir = os.path.abspath(args.output)
+    os.makedirs(os.path.join(out_dir, "img"), exist_ok=True)
+
+    import plotly.offline
+
+    # plotly.js ditulis sekali, semua halaman memakainya tanpa internet
+    with open(os.path.join(out_dir, "plotly.min.js"), "w", encoding="utf-8") as f:
+        f.write(plotly.offline.get_plotlyjs())
+
+    slides = args.slide or sorted(DIMENSI)
+    tugas = siapkan(slides)
+    print(f"{len(tugas)} halaman, data disiapkan dalam {time.perf_counter() - t0:.1f} s")
+
+    # fork: worker mewarisi cache proses induk tanpa menghitung ulang
+    metode = "fork" if "fork" in multiprocessing.get_all_start_methods() else None
+    with ProcessPoolExecutor(max_workers=max(1, args.jobs), mp_context=multiprocessing.get_context(metode)) as pool:
+        futures = [pool.submit(ekspor_halaman, slide, k, out_dir, args.plotly_png) for slide, k in tugas]
+        hasil = [f.result() for f in futures]
+
+    tulis_index(out_dir, hasil)
+    for nama, _, ms in hasil:
+        print(f"{nama:<40} {ms:>8.1f} ms")
+    print(f"Selesai: {len(hasil)} halaman di {out_dir} ({time.perf_counter() - t0:.1f} s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,210 @@
+import json
+import logging
+import os
+
+import numpy as np
+import streamlit as st
+
+from instrumen import tercache
+from provinsi import alias_index, catat_tidak_cocok, normalisasi
+
+logger = logging.getLogger(__name__)
+
+# ================================================================
+# KONFIGURASI GEOMETRI
+# ================================================================
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+GEOJSON_PATH = os.path.join(BASE_DIR, "indonesia-province.json")
+# opsional: batas kabupaten/kota, properti berisi kode BPS 4 digit
+GEOJSON_KABUPATEN_PATH = os.path.join(BASE_DIR, "indonesia-kabupaten.json")
+PROPERTI_KODE_KABUPATEN = ("kode_kabkota", "KODE_KAB", "kode", "KODE")
+
+# toleransi Douglas-Peucker (derajat) per tingkat detail
+TOLERANSI = {
+    "rendah": 0.05,
+    "sedang": 0.02,
+    "tinggi": 0.005,
+}
+TINGKAT_DEFAULT = "sedang"
+
+# pembulatan koordinat (±100 m) supaya payload JSON lebih kecil
+DESIMAL = 3
+
+# ejaan nama provinsi versi file batas wilayah lama
+ALIAS_GEOJSON = {
+    "DI ACEH": "ACEH",
+    "NANGGROE ACEH DARUSSALAM": "ACEH",
+    "NUSATENGGARA BARAT": "NUSA TENGGARA BARAT",
+    "NUSATENGGARA TIMUR": "NUSA TENGGARA TIMUR",
+    "PROBANTEN": "BANTEN",
+    "IRIAN JAYA BARAT": "PAPUA BARAT",
+    "IRIAN JAYA TENGAH": "PAPUA",
+    "IRIAN JAYA TIMUR": "PAPUA",
+    "IRIAN JAYA": "PAPUA",
+}
+
+
+# ================================================================
+# SIMPLIFIKASI (DOUGLAS-PEUCKER)
+# ================================================================
+def _simplify_ring(ring, toleransi):
+    pts = np.asarray(ring, dtype=float)[:, :2]
+    n = len(pts)
+    if n <= 4:
+        return pts
+
+    keep = np.zeros(n, dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, n - 1)]
+
+    while stack:
+        awal, akhir = stack.pop()
+        if akhir - awal < 2:
+            continue
+        seg = pts[awal + 1:akhir]
+        a, b = pts[awal], pts[akhir]
+        d = b - a
+        panjang = np.hypot(d[0], d[1])
+        if panjang == 0:
+            jarak = np.hypot(seg[:, 0] - a[0], seg[:, 1] - a[1])
+        else:
+            jarak = np.abs(d[0] * (seg[:, 1] - a[1]) - d[1] * (seg[:, 0] - a[0])) / panjang
+        i = int(np.argmax(jarak))
+        if jarak[i] > toleransi:
+            tengah = awal + 1 + i
+            keep[tengah] = True
+            stack.append((awal, tengah))
+            stack.append((tengah, akhir))
+
+    return pts[keep]
+
+
+def _simplify_polygon(polygon, toleransi):
+    hasil = []
+    for ring in polygon:
+        ring_baru = _simplify_ring(ring, toleransi)
+        # ring yang kolaps (pulau kecil / lubang) dibuang
+        if len(ring_baru) >= 4:
+            hasil.append(np.round(ring_baru, DESIMAL).tolist())
+    return hasil
+
+
+def _luas(ring):
+    x, y = np.asarray(ring, dtype=float)[:, 0], np.asarray(ring, dtype=float)[:, 1]
+    return 0.5 * abs(np.dot(x, np.roll(y, 1)) - np.dot(y, np.roll(x, 1)))
+
+
+def _simplify_feature(polygons, toleransi):
+    hasil = [p for p in (_simplify_polygon(poly, toleransi) for poly in polygons) if p]
+    if not hasil:
+        # provinsi tidak boleh hilang: pakai poligon terbesar tanpa simplifikasi
+        terbesar = max(polygons, key=lambda poly: _luas(poly[0]))
+        hasil = [[np.round(np.asarray(r, dtype=float)[:, :2], DESIMAL).tolist() for r in terbesar]]
+    return {"type": "MultiPolygon", "coordinates": hasil}
+
+
+# ================================================================
+# LOAD & PRAPROSES GEOJSON (SEKALI PER PROSES)
+# ================================================================
+def _kode_feature(props, index):
+    kode = props.get("kode") or props.get("KODE_PROV")
+    try:
+        if int(kode) in index.values():
+            return int(kode)
+    except (TypeError, ValueError):
+        pass
+    nama = normalisasi(props.get("Propinsi") or props.get("PROVINSI") or "")
+    nama = ALIAS_GEOJSON.get(nama.replace(".", ""), nama)
+    return index.get(nama, index.get(nama.replace(".", "")))
+
+
+@tercache(st.cache_resource, show_spinner=False)
+def load_geometri():
+    if not os.path.exists(GEOJSON_PATH):
+        logger.warning("File GeoJSON tidak ditemukan: %s", GEOJSON_PATH)
+        return None
+
+    with open(GEOJSON_PATH, "r", encoding="utf-8") as f:
+        raw = json.load(f)
+
+    index = alias_index()
+    per_kode = {}
+    gagal = []
+    for feature in raw["features"]:
+        geom = feature.get("geometry") or {}
+        kode = _kode_feature(feature.get("properties") or {}, index)
+        if kode is None:
+            gagal.append((feature.get("properties") or {}).get("Propinsi", "?"))
+            continue
+        polygons = geom["coordinates"] if geom.get("type") == "MultiPolygon" else [geom.get("coordinates", [])]
+        # beberapa feature lama (mis. Irian Jaya) digabung ke satu kode provinsi
+        per_kode.setdefault(kode, []).extend(p for p in polygons if p)
+
+    if gagal:
+        catat_tidak_cocok("indonesia-province.json", gagal)
+
+    return _susun_geometri(per_kode)
+
+
+def _susun_geometri(per_kode):
+    semua = np.concatenate([np.asarray(r, dtype=float)[:, :2] for ps in per_kode.values() for p in ps for r in p])
+    bbox = semua.min(axis=0), semua.max(axis=0)
+
+    tingkat = {}
+    for nama, toleransi in TOLERANSI.items():
+        tingkat[nama] = {
+            "type": "FeatureCollection",
+            "features": [
+                {"type": "Feature", "id": kode, "properties": {}, "geometry": _simplify_feature(polygons, toleransi)}
+                for kode, polygons in sorted(per_kode.items())
+            ],
+        }
+
+    return {
+        "tingkat": tingkat,
+        "lonaxis_range": [float(bbox[0][0]) - 0.5, float(bbox[1][0]) + 0.5],
+        "lataxis_range": [float(bbox[0][1]) - 0.5, float(bbox[1][1]) + 0.5],
+    }
+
+
+@tercache(st.cache_resource, show_spinner=False)
+def load_geometri_kabupaten():
+    if not os.path.exists(GEOJSON_KABUPATEN_PATH):
+        return None
+
+    with open(GEOJSON_KABUPATEN_PATH, "r", encoding="utf-8") as f:
+        raw = json.load(f)
+
+    per_kode = {}
+    for feature in raw["features"]:
+        geom = feature.get("geometry") or {}
+        props = feature.get("properties") or {}
+        kode = next((props[k] for k in PROPERTI_KODE_KABUPATEN if props.get(k) not in (None, "")), None)
+        if kode is None:
+            continue
+        polygons = geom["coordinates"] if geom.get("type") == "MultiPolygon" else [geom.get("coordinates", [])]
+        per_kode.setdefault(int(kode), []).extend(p for p in polygons if p)
+
+    if not per_kode:
+        logger.warning("Tidak ada feature berkode kabupaten/kota di %s", GEOJSON_KABUPATEN_PATH)
+        return None
+    return _susun_geometri(per_kode)
+
+
+def geojson_kabupaten(tingkat=TINGKAT_DEFAULT):
+    geometri = load_geometri_kabupaten()
+    if geometri is None:
+        return None
+    return geometri["tingkat"][tingkat]
+
+
+def geojson_provinsi(tingkat=TINGKAT_DEFAULT):
+    geometri = load_geometri()
+    if geometri is None:
+        return None
+    return geometri["tingkat"][tingkat]
+
+
+def batas_peta():
+    geometri = load_geometri()
+    return geometri["lonaxis_range"], geometri["lataxis_range"]
@@ -0,0 +1,233 @@
+import threading
+
+import numpy as np
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import plotly.io as pio
+
+from data_store import versi_run
+from instrumen import daftarkan_lru, span
+from lru import LRUCache
+
+# ================================================================
+# KONFIGURASI RENDER SCATTER
+# ================================================================
+# di atas ambang ini scatter dikirim sebagai satu trace WebGL (scattergl)
+AMBANG_WEBGL = 200
+
+# jumlah titik maksimum yang dikirim ke browser; lebihnya di-binning di server
+BUDGET_TITIK = 20000
+
+# ukuran grid awal binning (sel per sumbu)
+GRID_BIN = 256
+
+# batas total ukuran JSON figure Plotly di cache (dipakai bersama semua sesi)
+MAX_FIGURE_BYTES = 32 * 1024 * 1024
+
+# perkiraan ukuran JSON per figure tanpa serialisasi: layout, properti per trace,
+# lalu byte per elemen array data (float64 dikirim sebagai base64, teks rata-rata)
+UKURAN_DASAR_FIGURE = 3 * 1024
+UKURAN_TRACE = 512
+BYTE_PER_ANGKA = 11
+BYTE_PER_TEKS = 24
+PROP_ARRAY = ("x", "y", "z", "labels", "values", "lat", "lon", "locations", "ids", "text", "hovertext", "customdata")
+
+# warna kategori IKP yang dipakai banyak chart
+WARNA_KERENTANAN = {
+    "Sangat Tahan": "#006400",
+    "Tahan": "#228B22",
+    "Agak Tahan": "#90EE90",
+    "Agak Rentan": "#FFD700",
+    "Rentan": "#FFA500",
+    "Sangat Rentan": "#FF4500",
+}
+
+
+# ================================================================
+# CACHE FIGURE JADI & TEMPLATE
+# ================================================================
+figure_cache = LRUCache(MAX_FIGURE_BYTES)
+daftarkan_lru("figure", figure_cache)
+
+_template = {}
+_template_lock = threading.Lock()
+
+# ukuran statis template yang dipakai build() figure yang sedang dibangun
+_bangun = threading.local()
+
+
+def _ukuran_array(nilai):
+    if nilai is None or isinstance(nilai, (str, int, float)):
+        return 0
+    if isinstance(nilai, np.ndarray) and nilai.dtype.kind in "biuf":
+        return nilai.size * BYTE_PER_ANGKA
+    return np.size(nilai) * BYTE_PER_TEKS
+
+
+def _ukuran_figure(fig):
+    # tanpa pio.to_json: st.plotly_chart sudah menserialisasi figure sekali lagi.
+    # getattr dengan default: properti yang tidak dimiliki jenis trace ini dilewati
+    ukuran = UKURAN_DASAR_FIGURE
+    for trace in fig.data:
+        ukuran += UKURAN_TRACE
+        for prop in PROP_ARRAY:
+            ukuran += _ukuran_array(getattr(trace, prop, None))
+        marker = getattr(trace, "marker", None)
+        if marker is not None:
+            ukuran += _ukuran_array(getattr(marker, "color", None)) + _ukuran_array(getattr(marker, "size", None))
+    return ukuran
+
+
+def figure(chart_id, kunci, build):
+    # figure jadi per (chart, filter, versi dataset); objek dipakai bersama,
+    # jadi pemanggil TIDAK boleh mengubahnya setelah dikembalikan
+    key = (chart_id, kunci, versi_run())
+    fig = figure_cache.get(key)
+    if fig is None:
+        _bangun.statis = 0
+        with span(f"build {chart_id}"):
+            fig = build()
+        figure_cache.put(key, fig, ukuran=_bangun.statis + _ukuran_figure(fig))
+    return fig
+
+
+def dari_template(nama, build):
+    # bagian statis (layout, geos, geojson, warna) dibangun sekali per proses;
+    # yang dikembalikan salinan, tinggal diisi array data. Ukuran JSON-nya
+    # diukur sekali di sini dan ikut dihitung ke figure yang memakainya
+    with _template_lock:
+        if nama not in _template:
+            fig = build()
+            _template[nama] = fig, len(pio.to_json(fig, validate=False))
+        fig, ukuran = _template[nama]
+    _bangun.statis = getattr(_bangun, "statis", 0) + ukuran
+    return go.Figure(fig)
+
+
+# ================================================================
+# WARNA KATEGORI
+# ================================================================
+def _peta_warna(kategori, color_discrete_map=None):
+    # urutan & warna mengikuti px: urutan kemunculan, palet default untuk sisanya
+    urutan = list(pd.unique(kategori))
+    palet = px.colors.qualitative.Plotly
+    peta = dict(color_discrete_map or {})
+    sisa = iter(palet * (len(urutan) // len(palet) + 1))
+    return urutan, {k: peta[k] if k in peta else next(sisa) for k in urutan}
+
+
+def _skala_diskrit(warna):
+    # kode kategori 0..n-1 -> warna tetap (colorscale bertingkat)
+    n = len(warna)
+    skala = []
+    for i, w in enumerate(warna):
+        skala += [[i / n, w], [(i + 1) / n, w]]
+    return skala
+
+
+# ================================================================
+# BINNING SISI SERVER
+# ================================================================
+def binning(x, y, kode, bobot=None, log_x=False, budget=BUDGET_TITIK, grid=GRID_BIN):
+    # satu titik wakil per (sel grid, kategori); wakil = titik dengan bobot terbesar
+    xv = np.log10(np.where(x > 0, x, np.nan)) if log_x else x.astype(float)
+    valid = ~(np.isnan(xv) | np.isnan(y))
+    idx_valid = np.flatnonzero(valid)
+    xv, yv, kv = xv[valid], y[valid].astype(float), kode[valid]
+    urut = np.argsort(-bobot[valid], kind="stable") if bobot is not None else np.arange(len(xv))
+
+    def skala(v, g):
+        rentang = v.max() - v.min() if len(v) else 0.0
+        if rentang == 0:
+            return np.zeros(len(v), dtype=np.int64)
+        return np.minimum(((v - v.min()) / rentang * g).astype(np.int64), g - 1)
+
+    while True:
+        sel = (skala(xv, grid) * grid + skala(yv, grid)) * (kv.max() + 1 if len(kv) else 1) + kv
+        _, pertama, cacah = np.unique(sel[urut], return_index=True, return_counts=True)
+        if len(pertama) <= budget or grid <= 2:
+            break
+        grid //= 2
+
+    return idx_valid[urut[pertama]], cacah
+
+
+# ================================================================
+# SCATTER / BUBBLE DENGAN MODE WEBGL
+# ================================================================
+def scatter(
+    df, x, y, color, size=None, hover_name=None, hover_data=None, color_discrete_map=None,
+    size_max=20, log_x=False, title=None, labels=None, ambang=AMBANG_WEBGL, budget=BUDGET_TITIK,
+):
+    # data kecil: px.scatter biasa (SVG, satu trace per kategori)
+    if len(df) <= ambang:
+        return px.scatter(
+            df, x=x, y=y, color=color, size=size, hover_name=hover_name, hover_data=hover_data,
+            color_discrete_map=color_discrete_map, size_max=size_max, log_x=log_x,
+            title=title, labels=labels,
+        )
+
+    df = df[df[color].notna()]
+    labels = labels or {}
+    hover_data = list(hover_data or [])
+    urutan, peta = _peta_warna(df[color], color_discrete_map)
+    kode = pd.Categorical(df[color], categories=urutan).codes.astype(np.int16)
+
+    xa = pd.to_numeric(df[x], errors="coerce").to_numpy(dtype=float)
+    ya = pd.to_numeric(df[y], errors="coerce").to_numpy(dtype=float)
+    sa = pd.to_numeric(df[size], errors="coerce").to_numpy(dtype=float) if size else None
+
+    if len(df) > budget:
+        pilih, cacah = binning(xa, ya, kode, sa, log_x, budget)
+    else:
+        pilih, cacah = np.arange(len(df)), np.ones(len(df), dtype=np.int64)
+
+    marker = {
+        "color": kode[pilih],
+        "colorscale": _skala_diskrit([peta[k] for k in urutan]),
+        "cmin": -0.5,
+        "cmax": len(urutan) - 0.5,
+        "opacity": 0.8,
+    }
+    if size:
+        s = np.nan_to_num(sa[pilih])
+        # sama dengan px: luas marker sebanding nilai, maksimum size_max px
+        marker.update(size=s, sizemode="area", sizeref=2.0 * max(s.max(), 1e-12) / size_max ** 2, sizemin=1)
+
+    # urutan tetap, tiap kolom sekali; x & y sudah tampil di baris sendiri
+    kolom_hover = [
+        k for k in dict.fromkeys([color] + hover_data + ([size] if size else []))
+        if k not in (x, y)
+    ]
+    customdata = np.column_stack([df[k].to_numpy(dtype=object)[pilih] for k in kolom_hover] + [cacah])
+    baris_hover = [f"{labels.get(k, k)}=%{{customdata[{i}]}}" for i, k in enumerate(kolom_hover)]
+    if len(df) > budget:
+        baris_hover.append(f"titik digabung=%{{customdata[{len(kolom_hover)}]}}")
+
+    fig = go.Figure(go.Scattergl(
+        x=xa[pilih],
+        y=ya[pilih],
+        mode="markers",
+        marker=marker,
+        customdata=customdata,
+        hovertext=df[hover_name].to_numpy(dtype=object)[pilih] if hover_name else None,
+        hovertemplate=(
+            ("<b>%{hovertext}</b><br>" if hover_name else "")
+            + f"{labels.get(x, x)}=%{{x}}<br>{labels.get(y, y)}=%{{y}}<br>"
+            + "<br>".join(baris_hover) + "<extra></extra>"
+        ),
+        showlegend=False,
+    ))
+
+    # legenda: satu entri kosong per kategori (datanya tetap satu trace)
+    for k in urutan:
+        fig.add_trace(go.Scattergl(
+            x=[None], y=[None], mode="markers", name=str(k),
+            marker={"color": peta[k], "size": 10}, hoverinfo="skip",
+        ))
+
+    fig.update_layout(title=title, legend_title_text=labels.get(color, color))
+    fig.update_xaxes(title_text=labels.get(x, x), type="log" if log_x else None)
+    fig.update_yaxes(title_text=labels.get(y, y))
+    return fig
@@ -0,0 +1,392 @@
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import matplotlib.pyplot as plt
+import streamlit as st
+
+import analitik
+import grafik
+import instrumen
+from bps import load_produksi_bps
+from dataset import load_cube_produksi, load_data
+from geo import batas_peta, geojson_kabupaten, geojson_provinsi
+from kabupaten import kode_provinsi_dari, load_cube_kabupaten, versi_kabupaten
+from produksi import versi_produksi
+from provinsi import nama_provinsi
+from render import tampilkan_figure
+
+
+# ================================================================
+# SLIDE 1 — FULL DASHBOARD 
+# ================================================================
+def render():
+    instrumen.bagian("Muat Data")
+    df = load_data()
+    cube = load_cube_produksi(versi_produksi())
+
+    rentang = f"{cube.tahun.min()}–{cube.tahun.max()}"
+
+    st.title(f"Dashboard Analisis Produksi dan Kerawanan Pangan di Indonesia Tahun {rentang}")
+    # ================= KPI OVERVIEW =================
+    instrumen.bagian("KPI Overview")
+    st.subheader(f"Overview KPI Produksi Pangan Nasional ({rentang})")
+
+    # angka yang sama dengan endpoint /api/produksi/kpi
+    kpi = analitik.kpi_produksi()
+
+    col1, col2, col3, col4, col5 = st.columns(5)
+
+    col1.metric("Total Produksi Padi", f"{kpi['total_padi']:,.0f} ton")
+    col2.metric("Total Produksi Jagung", f"{kpi['total_jagung']:,.0f} ton")
+    col3.metric("Rata-rata Produksi Padi per Provinsi", f"{kpi['rata_rata_padi_per_provinsi']:,.0f} ton")
+    col4.metric("Rata-rata Produksi Jagung per Provinsi", f"{kpi['rata_rata_jagung_per_provinsi']:,.0f} ton")
+    col5.metric("Jumlah Provinsi Terdata", f"{kpi['jumlah_provinsi']}")
+    st.markdown("---")
+
+    # ------------------------------------------------------------
+    # TREN 5 TAHUN NASIONAL
+    # ------------------------------------------------------------
+    instrumen.bagian("Tren Produksi Nasional")
+    st.header("Tren Produksi Nasional (5 Tahun Terakhir)")
+
+    nat_padi = cube.total_per_tahun("produksi_padi")
+    nat_jagung = cube.total_per_tahun("produksi_jagung")
+
+    tahun_list = list(cube.tahun)
+
+    colA, colB = st.columns(2)
+
+    with colA:
+        st.subheader("🌾 Produksi Padi Nasional")
+
+
+        def plot_tren_padi_nasional():
+            figA, axA = plt.subplots()
+            axA.plot(tahun_list, nat_padi, marker="o", color="#F39C12")
+            axA.set_xlabel("Tahun")
+            axA.set_ylabel("Produksi (ton)")
+            axA.set_xticks(tahun_list)
+            axA.set_xticklabels(tahun_list)
+            return figA
+
+        tampilkan_figure("tren_padi_nasional", (), plot_tren_padi_nasional)
+
+    with colB:
+        st.subheader("🌽 Produksi Jagung Nasional")
+
+
+        def plot_tren_jagung_nasional():
+            figB, axB = plt.subplots()
+            axB.plot(tahun_list, nat_jagung, marker="o", color="#F39C12")
+            axB.set_xlabel("Tahun")
+            axB.set_ylabel("Produksi (ton)")
+            axB.set_xticks(tahun_list)
+            axB.set_xticklabels(tahun_list)
+            return figB
+
+        tampilkan_figure("tren_jagung_nasional", (), plot_tren_jagung_nasional)
+
+    st.markdown("---")
+
+    # ------------------------------------------------------------
+    # FILTER TAHUN
+    # ------------------------------------------------------------
+    instrumen.bagian("Top 10 Produksi Terendah")
+    st.header("Analisis Provinsi Rawan Produksi Padi & Jagung per Tahun (Terendah)")
+
+    # tingkat kabupaten/kota hanya muncul jika datanya tersedia
+    kubus_kab = load_cube_kabupaten(versi_kabupaten())
+    ada_kabupaten = kubus_kab is not None and {"produksi_padi", "produksi_jagung"} <= set(kubus_kab[0].metrik)
+    tingkat = "Provinsi"
+    if ada_kabupaten:
+        tingkat = st.radio("Tingkat Wilayah", ["Provinsi", "Kabupaten/Kota"], horizontal=True)
+
+    if tingkat == "Provinsi":
+        cube_wilayah, label_wilayah = cube, "provinsi"
+    else:
+        cube_wilayah, label_wilayah = kubus_kab[0], "kabupaten_kota"
+
+    # tahun Top 10 diganti -> hanya fragmen ini yang dijalankan ulang
+    top10_produksi(cube_wilayah, label_wilayah, tingkat)
+
+    st.markdown("---")
+
+    # ------------------------------------------------------------
+    # PRODUKSI PER PROVINSI × TAHUN
+    # ------------------------------------------------------------
+    # tahun/komoditas peta atau klik wilayah -> peta, detail & bubble saja
+    peta_produksi(cube_wilayah, label_wilayah, tingkat)
+
+    st.markdown("---")
+
+    # ------------------------------------------------------------
+    # SHOW RAW DATA
+    # ------------------------------------------------------------
+    instrumen.bagian("Data Asli")
+    st.subheader("📄 Lihat Data Asli")
+
+    # --- Perbaikan format tahun ---
+    df_display = df.copy()
+    df_display["tahun"] = df_display["tahun"].astype(str)
+    # tahun baru bisa hanya ada untuk satu komoditas -> sel kosong, bukan error
+    for kolom in ["produksi_padi", "produksi_jagung"]:
+        df_display[kolom] = df_display[kolom].map(lambda v: "" if pd.isna(v) else str(int(v)))
+
+    st.dataframe(df_display)
+
+    # --- Data mentah BPS: luas panen, produktivitas, produksi ---
+    with st.expander("Data BPS: Luas Panen, Produktivitas, dan Produksi per Provinsi"):
+        df_bps = load_produksi_bps()
+        st.dataframe(
+            df_bps.drop(columns=["kode_provinsi"]),
+            use_container_width=True,
+            column_config={"tahun": st.column_config.NumberColumn(format="%d")}
+        )
+
+
+# ================================================================
+# FRAGMEN: TOP 10 PRODUKSI TERENDAH
+# ================================================================
+@instrumen.fragmen("top10_produksi")
+def top10_produksi(cube_wilayah, label_wilayah, tingkat):
+    tahun_pilih = st.selectbox("Pilih Tahun:", list(cube_wilayah.tahun))
+
+    col1, col2 = st.columns(2)
+
+    # ================= TOP 10 PRODUKSI RENDAH PADI =================
+    with col1:
+        st.subheader(f"🌾 Top 10 Produksi Padi Terendah — {tahun_pilih}")
+        df_low_padi = cube_wilayah.peringkat_frame("produksi_padi", tahun_pilih, kolom_nama=label_wilayah)
+
+        def plot_top10_padi_terendah():
+            fig1, ax1 = plt.subplots()
+            ax1.bar(df_low_padi[label_wilayah], df_low_padi["produksi_padi"], color="#F39C12")
+            ax1.tick_params(axis="x", rotation=45)
+            return fig1
+
+        tampilkan_figure("top10_padi_terendah", (tingkat, tahun_pilih), plot_top10_padi_terendah)
+
+    # ================= TOP 10 PRODUKSI RENDAH JAGUNG =================
+    with col2:
+        st.subheader(f"🌽 Top 10 Produksi Jagung Terendah — {tahun_pilih}")
+        df_low_jagung = cube_wilayah.peringkat_frame("produksi_jagung", tahun_pilih, kolom_nama=label_wilayah)
+
+        def plot_top10_jagung_terendah():
+            fig2, ax2 = plt.subplots()
+            ax2.bar(df_low_jagung[label_wilayah], df_low_jagung["produksi_jagung"], color="#F39C12")
+            ax2.tick_params(axis="x", rotation=45)
+            return fig2
+
+        tampilkan_figure("top10_jagung_terendah", (tingkat, tahun_pilih), plot_top10_jagung_terendah)
+
+    # ================= PERINGKAT LENGKAP & PERSENTIL =================
+    tahun_awal = int(cube_wilayah.tahun.min())
+    with st.expander(f"Lihat Peringkat Lengkap {tahun_pilih} (1 = produksi terendah)"):
+        # dari indeks peringkat kubus: tanpa sort ulang per rerun
+        for col, (judul, komoditas) in zip(st.columns(2), [("🌾 Padi", "produksi_padi"), ("🌽 Jagung", "produksi_jagung")]):
+            with col:
+                st.markdown(f"**{judul}**")
+                df_posisi = cube_wilayah.posisi_frame(komoditas, tahun_pilih, sejak=tahun_awal, kolom_nama=label_wilayah)
+                st.dataframe(
+                    df_posisi[[label_wilayah, komoditas, "peringkat", "persentil", f"perubahan_peringkat_sejak_{tahun_awal}"]]
+                    .rename(columns={f"perubahan_peringkat_sejak_{tahun_awal}": f"Δ peringkat sejak {tahun_awal}"})
+                    .round(1),
+                    hide_index=True,
+                    use_container_width=True
+                )
+
+
+# ================================================================
+# FRAGMEN: PETA + DETAIL WILAYAH + BUBBLE (CROSS-FILTER)
+# ================================================================
+def _kode_terpilih(event, cube_wilayah):
+    # klik wilayah di peta -> kode wilayah; tanpa pilihan = None (semua wilayah)
+    titik = (event or {}).get("selection", {}).get("points", [])
+    if not titik:
+        return None
+    lokasi = titik[0].get("location")
+    if lokasi is None and titik[0].get("point_index") is not None:
+        lokasi = cube_wilayah.kode[titik[0]["point_index"]]
+    try:
+        kode = int(lokasi)
+    except (TypeError, ValueError):
+        return None
+    return kode if kode in cube_wilayah.kode else None
+
+
+def _sorot_bubble(fig_dasar, x, y, nama):
+    # salinan figure bubble + cincin penanda wilayah terpilih
+    fig = go.Figure(fig_dasar)
+    fig.add_scatter(
+        x=[x], y=[y], mode="markers", hoverinfo="skip", showlegend=False,
+        marker={"size": 30, "color": "rgba(0,0,0,0)", "line": {"width": 3, "color": "black"}},
+    )
+    fig.add_annotation(x=x, y=y, text=f"<b>{nama}</b>", showarrow=True, arrowhead=2, ay=-40)
+    return fig
+
+
+@instrumen.fragmen("peta_produksi")
+def peta_produksi(cube_wilayah, label_wilayah, tingkat):
+    instrumen.bagian("Peta Produksi")
+    st.header("Peta Produksi Pangan Indonesia")
+
+    tahun_pilih = st.selectbox(
+        "Pilih Tahun",
+        list(cube_wilayah.tahun)
+    )
+
+    komoditas = st.radio(
+        "Pilih Komoditas",
+        ["produksi_padi", "produksi_jagung"],
+        horizontal=True
+    )
+
+    if tingkat == "Provinsi":
+        nama_wilayah = nama_provinsi().reindex(cube_wilayah.kode).values
+        # geometri sudah disederhanakan & di-cache sekali per proses
+        indo_geojson = geojson_provinsi()
+        file_geojson = "indonesia-province.json"
+    else:
+        nama_wilayah = cube_wilayah.nama
+        indo_geojson = geojson_kabupaten()
+        file_geojson = "indonesia-kabupaten.json"
+
+    kode_pilih = None
+    if indo_geojson is None:
+        st.warning(f"File {file_geojson} tidak ditemukan, peta tidak dapat ditampilkan.")
+    else:
+        def template_peta():
+            lonaxis_range, lataxis_range = batas_peta()
+            fig = go.Figure(go.Choropleth(
+                geojson=indo_geojson,
+                featureidkey="id",
+                coloraxis="coloraxis",
+            ))
+            # batas peta dihitung sekali dari geometri, tidak perlu fitbounds di browser
+            fig.update_geos(
+                visible=False,
+                lataxis_range=lataxis_range,
+                lonaxis_range=lonaxis_range
+            )
+            fig.update_layout(
+                height=800,
+                dragmode=False,
+                coloraxis={"colorscale": "YlOrBr"},
+                margin={"t": 60},
+            )
+            return fig
+
+        def build_peta():
+            # hanya array data & judul yang berubah per tahun / komoditas
+            fig = grafik.dari_template(("peta_produksi", tingkat), template_peta)
+            fig.update_traces(
+                locations=cube_wilayah.kode,
+                z=cube_wilayah.irisan(komoditas, tahun_pilih),
+                hovertext=nama_wilayah,
+                hovertemplate=f"<b>%{{hovertext}}</b><br><br>{komoditas}=%{{z:,.0f}}<extra></extra>",
+            )
+            fig.update_layout(
+                title_text=f"Peta Produksi {komoditas.replace('_',' ').title()} Indonesia Tahun {tahun_pilih}",
+                coloraxis_colorbar_title_text=komoditas,
+            )
+            return fig
+
+        fig = grafik.figure("peta_produksi", (tingkat, tahun_pilih, komoditas), build_peta)
+
+        # klik wilayah = pilihan; hanya fragmen ini yang dijalankan ulang
+        event = st.plotly_chart(
+            fig,
+            use_container_width=True,
+            config={
+                "scrollZoom": False,
+                "doubleClick": False,
+                "displayModeBar": False
+            },
+            on_select="rerun",
+            selection_mode="points",
+            key=f"pilih_peta_{tingkat}"
+        )
+        kode_pilih = _kode_terpilih(event, cube_wilayah)
+
+    # ------------------------------------------------------------
+    # DETAIL WILAYAH TERPILIH
+    # ------------------------------------------------------------
+    instrumen.bagian("Detail Wilayah")
+    if kode_pilih is None:
+        st.caption("Klik wilayah di peta untuk melihat tren, peringkat, dan persentilnya; bubble chart ikut menyorot wilayah terpilih.")
+    else:
+        i = int(np.flatnonzero(cube_wilayah.kode == kode_pilih)[0])
+        nama = nama_wilayah[i]
+        tahun_awal = int(cube_wilayah.tahun.min())
+        label_komoditas = komoditas.replace("_", " ").title()
+
+        st.subheader(f"📍 {nama}")
+        # nilai, peringkat & persentil dibaca dari kubus dan indeks peringkatnya
+        nilai = cube_wilayah.irisan(komoditas, tahun_pilih)[i]
+        posisi = cube_wilayah.posisi(komoditas, tahun_pilih)[i]
+        persentil = cube_wilayah.persentil(komoditas, tahun_pilih)[i]
+        perubahan = cube_wilayah.perubahan_peringkat(komoditas, tahun_awal, tahun_pilih)[i]
+        n_wilayah = int(np.count_nonzero(~np.isnan(cube_wilayah.irisan(komoditas, tahun_pilih))))
+
+        c1, c2, c3, c4 = st.columns(4)
+        c1.metric(f"{label_komoditas} {tahun_pilih}", "-" if np.isnan(nilai) else f"{nilai:,.0f} ton")
+        c2.metric("Peringkat (1 = terendah)", "-" if np.isnan(posisi) else f"{posisi:.0f} dari {n_wilayah}")
+        c3.metric("Persentil", "-" if np.isnan(persentil) else f"{persentil:.0f}")
+        c4.metric(f"Δ Peringkat sejak {tahun_awal}", "-" if np.isnan(perubahan) else f"{perubahan:+.0f}")
+
+        def plot_tren_wilayah():
+            fig6, ax6 = plt.subplots(1, 2, figsize=(12, 3.5))
+            for ax, (judul, kolom) in zip(ax6, [("Padi", "produksi_padi"), ("Jagung", "produksi_jagung")]):
+                m = cube_wilayah.m(kolom)
+                ax.plot(cube_wilayah.tahun, cube_wilayah.values[m, i], marker="o", color="#F39C12", label=nama)
+                ax.plot(cube_wilayah.tahun, cube_wilayah.mean_tahun[m], linestyle="--", color="gray", label="Rata-rata wilayah")
+                ax.set_title(f"Produksi {judul}")
+                ax.set_xticks(list(cube_wilayah.tahun))
+                ax.set_ylabel("Produksi (ton)")
+                ax.legend(fontsize=8)
+            fig6.tight_layout()
+            return fig6
+
+        tampilkan_figure("tren_wilayah", (tingkat, kode_pilih), plot_tren_wilayah)
+
+    # ------------------------------------------------------------
+    # BUBBLE CHART PRODUKSI vs ESTIMASI IKP
+    # ------------------------------------------------------------
+    instrumen.bagian("Bubble Chart Produksi")
+    st.header("Bubble Chart: Produksi vs Estimasi IKP per Provinsi")
+
+    def build_bubble():
+        # Buat IKP estimasi sederhana = total produksi / max produksi × 100
+        df_bubble = pd.DataFrame({
+            "provinsi": cube_wilayah.nama,
+            "produksi_padi": cube_wilayah.total_per_provinsi("produksi_padi"),
+            "produksi_jagung": cube_wilayah.total_per_provinsi("produksi_jagung"),
+        })
+        df_bubble["IKP_estimasi"] = (df_bubble["produksi_padi"] + df_bubble["produksi_jagung"]) / \
+                                    (df_bubble["produksi_padi"].sum() + df_bubble["produksi_jagung"].sum()) * 100
+
+        if tingkat != "Provinsi":
+            # ratusan kabupaten/kota: warna per provinsi induk, nama di hover
+            df_bubble = df_bubble.rename(columns={"provinsi": "kabupaten_kota"})
+            df_bubble["provinsi"] = nama_provinsi().reindex(kode_provinsi_dari(cube_wilayah.kode)).values
+
+        # di atas AMBANG_WEBGL titik otomatis dikirim sebagai satu trace scattergl
+        return grafik.scatter(df_bubble, x="produksi_padi", y="produksi_jagung",
+                              size="IKP_estimasi", color="provinsi",
+                              hover_name=None if tingkat == "Provinsi" else "kabupaten_kota",
+                              hover_data=["IKP_estimasi"],
+                              title="Produksi Padi vs Jagung (Ukuran Bubble = IKP Estimasi)",
+                              size_max=60)
+
+    fig5 = grafik.figure("bubble_produksi", (tingkat,), build_bubble)
+    if kode_pilih is not None:
+        fig5 = grafik.figure(
+            "bubble_produksi_sorot", (tingkat, kode_pilih),
+            lambda: _sorot_bubble(
+                fig5,
+                cube_wilayah.total_per_provinsi("produksi_padi")[i],
+                cube_wilayah.total_per_provinsi("produksi_jagung")[i],
+                nama,
+            ),
+        )
+    st.plotly_chart(fig5, use_container_width=True)
@@ -0,0 +1,247 @@
+import plotly.express as px
+import streamlit as st
+
+import grafik
+import instrumen
+from dataset import load_regresi_sosial, load_regresi_sosial_provinsi, load_sosial_data, versi_sosial
+
+
+# ================================================================
+# SLIDE 2 — ANALISIS SOSIAL EKONOMI / SOSIAL BUDAYA
+# ================================================================
+def render():
+    instrumen.bagian("Muat Data")
+    st.title("Dashboard Analisis Kerawanan Pangan Berdasarkan Sosial Ekonomi Rumah Tangga")
+    st.markdown("---")
+
+    df_sosial = load_sosial_data()
+
+    # ---------------------------------
+    # FILTER
+    # ---------------------------------
+    st.subheader("Filter Data")
+
+    prov_list = ["Indonesia"] + sorted(df_sosial["PROVINSI"].unique())
+    year_list = sorted(df_sosial["TAHUN"].unique(), reverse=True)
+
+    selected_prov = st.selectbox("Pilih PROVINSI", prov_list, index=prov_list.index("Indonesia"))
+    selected_year = st.selectbox("Pilih TAHUN", year_list, index=year_list.index(2024))
+
+    # Apply filter
+    filtered_df = df_sosial[df_sosial["TAHUN"] == selected_year]
+
+    if selected_prov != "Indonesia":
+        filtered_df = filtered_df[filtered_df["PROVINSI"] == selected_prov]
+
+    # ---------------------------------
+    # KPI SECTION
+    # ---------------------------------
+    instrumen.bagian("KPI Overview")
+    st.subheader("Overview (KPI)")
+
+    col1, col2, col3, col4, col5 = st.columns(5)
+
+    col1.metric("Indeks Ketahanan Pangan", f"{filtered_df['IKP'].mean():.2f}")
+    col2.metric("Rata-rata Kemiskinan", f"{filtered_df['P0'].mean():.2f}%")
+    col3.metric("Total Keluarga Penerima Manfaat", f"{filtered_df['KPM'].sum():,.0f}")
+    col4.metric("Rata-rata Lama Sekolah", f"{filtered_df['RLS'].mean():.2f}")
+    col5.metric("Persentase Rumah Tangga Lansia", f"{filtered_df['RTL'].mean():.2f}%")
+
+    # ---------------------------------
+    # PIE CHART – JENIS PEKERJAAN
+    # ---------------------------------
+    instrumen.bagian("Pie Jenis Pekerjaan")
+    st.subheader("Pie Chart: Jenis Pekerjaan")
+
+    job_cols = [
+        "Wirausaha", "Usaha Kecil", "Usaha Besar",
+        "Karyawan/Formal", "Lepas Pertanian",
+        "Lepas Non-Pertanian", "Pekerja Keluarga"
+    ]
+
+    job_data = filtered_df[job_cols].sum()
+
+    fig_job = grafik.figure(
+        "pie_job",
+        (selected_prov, selected_year),
+        lambda: px.pie(
+            names=job_data.index,
+            values=job_data.values,
+            title="Distribusi Jenis Pekerjaan"
+        ),
+    )
+    st.plotly_chart(fig_job, use_container_width=True)
+
+    # ---------------------------------
+    # PIE CHART – JUMLAH ANGGOTA KELUARGA
+    # ---------------------------------
+    instrumen.bagian("Pie Anggota Keluarga")
+    st.subheader("Pie Chart: Jumlah Anggota Keluarga")
+
+    fam_cols = ["1", "2-3", "4-5", "≥6"]
+    fam_data = filtered_df[fam_cols].mean()
+
+    fig_fam = grafik.figure(
+        "pie_fam",
+        (selected_prov, selected_year),
+        lambda: px.pie(
+            names=fam_data.index,
+            values=fam_data.values,
+            title="Distribusi Jumlah Anggota Keluarga"
+        ),
+    )
+    st.plotly_chart(fig_fam, use_container_width=True)
+
+    # ---------------------------------
+    # PIE CHART – PENGELUARAN PANGAN vs NONPANGAN
+    # ---------------------------------
+    instrumen.bagian("Pie Pengeluaran")
+    st.subheader("Pie Chart: Pengeluaran Pangan vs Nonpangan")
+
+    exp_cols = ["Pengeluaran Pangan", "Pengeluaran Nonpangan"]
+    exp_data = filtered_df[exp_cols].sum()
+
+    fig_exp = grafik.figure(
+        "pie_exp",
+        (selected_prov, selected_year),
+        lambda: px.pie(
+            names=exp_data.index,
+            values=exp_data.values,
+            title="Perbandingan Pengeluaran Pangan vs Nonpangan"
+        ),
+    )
+    st.plotly_chart(fig_exp, use_container_width=True)
+
+    # ---------------------------------
+    # PERINGKAT FAKTOR PENDORONG IKP
+    # ---------------------------------
+    instrumen.bagian("Peringkat Faktor")
+    st.subheader("Peringkat Faktor Sosial Budaya terhadap Ketahanan Pangan (IKP)")
+
+    rename_cols = {
+        "P0": "Persentase Kemiskinan",
+        "RTL": "Persentase Rumah Tangga Lansia",
+        "KPM": "Jumlah Keluarga Penerima Manfaat",
+        "RLS": "Rata-rata Lama Sekolah",
+        "1": "Jumlah Anggota Keluarga 1",
+        "2-3": "Jumlah Anggota Keluarga 2-3",
+        "4-5": "Jumlah Anggota Keluarga 4-5",
+        "≥6": "Jumlah Anggota Keluarga ≥6"
+    }
+
+    exclude_cols = ["TAHUN", "PROVINSI", "kode_provinsi", "IKP", "Kerentanan Area"]
+
+    factor_asal = [
+        col for col in df_sosial.columns
+        if col not in exclude_cols
+    ]
+    factor_candidates = [rename_cols.get(col, col) for col in factor_asal]
+
+    # semua faktor × tahun / provinsi dihitung sekali per versi dataset
+    regresi = load_regresi_sosial(versi_sosial(), tuple(factor_asal))
+
+    if selected_prov == "Indonesia":
+        # antar provinsi pada tahun terpilih
+        tabel_peringkat = regresi.peringkat(selected_year)
+        matriks = regresi.matriks()
+        st.caption(f"Korelasi antar provinsi pada tahun {selected_year}.")
+    else:
+        # satu provinsi hanya punya satu titik per tahun: korelasi lintas tahun
+        regresi_prov = load_regresi_sosial_provinsi(versi_sosial(), tuple(factor_asal))
+        tabel_peringkat = regresi_prov.peringkat(selected_prov)
+        matriks = regresi_prov.matriks()
+        st.caption(f"Korelasi lintas tahun {min(year_list)}–{max(year_list)} untuk {selected_prov}.")
+
+    tabel_peringkat["faktor"] = tabel_peringkat["faktor"].map(lambda c: rename_cols.get(c, c))
+
+    col_rank, col_heat = st.columns([2, 3])
+
+    with col_rank:
+        st.dataframe(
+            tabel_peringkat.rename(columns={
+                "faktor": "Faktor",
+                "pearson": "Pearson r",
+                "spearman": "Spearman ρ",
+                "slope": "Slope",
+                "r2": "R²",
+                "n": "n",
+            }),
+            hide_index=True,
+            use_container_width=True,
+            column_config={
+                "Pearson r": st.column_config.NumberColumn(format="%.3f"),
+                "Spearman ρ": st.column_config.NumberColumn(format="%.3f"),
+                "Slope": st.column_config.NumberColumn(format="%.4g"),
+                "R²": st.column_config.NumberColumn(format="%.3f"),
+            },
+        )
+
+    with col_heat:
+        def build_heat():
+            fig = px.imshow(
+                matriks.rename(columns=rename_cols),
+                color_continuous_scale="RdBu",
+                zmin=-1,
+                zmax=1,
+                aspect="auto",
+                labels={"color": "Pearson r"},
+                title="Heatmap Korelasi Faktor terhadap IKP"
+            )
+            fig.update_yaxes(type="category")
+            return fig
+
+        # matriks hanya berbeda antara mode nasional dan mode provinsi
+        fig_heat = grafik.figure("heatmap_faktor", (selected_prov == "Indonesia",), build_heat)
+        st.plotly_chart(fig_heat, use_container_width=True)
+
+    # ---------------------------------
+    # SCATTERPLOT PENGARUH FAKTOR TERHADAP IKP
+    # ---------------------------------
+    # faktor diganti -> hanya fragmen scatter yang dijalankan ulang
+    scatter_faktor(filtered_df, rename_cols, factor_asal, factor_candidates, regresi, selected_prov, selected_year)
+
+
+# ================================================================
+# FRAGMEN: SCATTER FAKTOR vs IKP
+# ================================================================
+@instrumen.fragmen("scatter_faktor")
+def scatter_faktor(filtered_df, rename_cols, factor_asal, factor_candidates, regresi, selected_prov, selected_year):
+    instrumen.bagian("Scatter Faktor vs IKP")
+    st.subheader("Scatterplot Pengaruh Faktor Sosial Budaya terhadap Ketahanan Pangan (IKP)")
+
+    df_renamed = filtered_df.rename(columns=rename_cols)
+
+    selected_factor = st.selectbox("Pilih Faktor", factor_candidates)
+
+    def build_scatter():
+        fig = px.scatter(
+            df_renamed,
+            x=selected_factor,
+            y="IKP",
+            title=f"Pengaruh {selected_factor} terhadap IKP"
+        )
+
+        # garis OLS diambil dari tabel regresi tercache (satu provinsi = satu titik, tanpa garis)
+        asal = factor_asal[factor_candidates.index(selected_factor)]
+        garis = regresi.garis(selected_year, asal) if selected_prov == "Indonesia" else None
+
+        if garis is not None:
+            koef = regresi.koef(selected_year, asal)
+            xs, yhat, _, _ = garis
+            fig.add_scatter(
+                x=xs,
+                y=yhat,
+                mode="lines",
+                name="OLS trendline",
+                showlegend=False,
+                hovertemplate=(
+                    f"<b>OLS trendline</b><br>IKP = {koef['slope']:.6g} * {selected_factor}"
+                    f" + {koef['intercept']:.6g}<br>R<sup>2</sup>={koef['r2']:.6f}<br><br>"
+                    f"{selected_factor}=%{{x}}<br>IKP=%{{y}} <b>(trend)</b><extra></extra>"
+                ),
+            )
+        return fig
+
+    fig_scatter = grafik.figure("scatter_faktor", (selected_prov, selected_year, selected_factor), build_scatter)
+
+    st.plotly_chart(fig_scatter, use_container_width=True)
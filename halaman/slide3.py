@@ -0,0 +1,196 @@
+import plotly.express as px
+import streamlit as st
+
+import grafik
+import instrumen
+from dataset import KATEGORI_PASAR, load_geospatial_data, load_panel_geospasial
+
+
+# ================================================================
+# SLIDE 3 — ANALISIS KERAWANAN PANGAN BERDASARKAN FAKTOR LINGKUNGAN & GEOSPASIAL
+# ================================================================
+def render():
+    instrumen.bagian("Muat Data")
+    st.title("Analisis Kerawanan Pangan Berdasarkan Faktor Lingkungan dan Geospasial")
+    st.markdown("---")
+
+    try:
+        df_geo = load_geospatial_data()
+        # ================= PANEL PROVINSI × TAHUN (IKP PER TAHUN) =================
+        panel = load_panel_geospasial()
+
+    except Exception as e:
+        st.error(f"Gagal memuat data: {e}")
+        st.stop()
+
+    # ================= OVERVIEW KPI =================
+    instrumen.bagian("KPI Overview")
+    st.subheader("Overview Ketahanan Pangan dari Aspek Lingkungan & Infrastruktur Pasar")
+    col1, col2, col3, col4, col5 = st.columns(5)
+    col1.metric("Rata-rata IKP Nasional", f"{df_geo['IKP'].mean():.2f}")
+    col2.metric("Provinsi Sangat Tahan", len(df_geo[df_geo['Kerentanan Area'] == 'Sangat Tahan']))
+    col3.metric("Provinsi Rentan/Sangat Rentan", len(df_geo[df_geo['Kerentanan Area'].isin(['Rentan', 'Sangat Rentan'])]))
+    col4.metric("Total Bencana Nasional", f"{df_geo['Total_Disaster'].sum():,}")
+    col5.metric("Rata-rata Pasar/Toko per Provinsi", f"{df_geo['Jumlah'].mean():.0f}")
+    st.markdown("---")
+
+    # ================= IKP VS BENCANA =================
+    instrumen.bagian("Box IKP vs Bencana")
+    st.subheader("Distribusi IKP Berdasarkan Intensitas Bencana")
+
+    # kategori bencana (tersil) sudah dihitung di loader; df_geo dipakai bersama, tidak diubah
+    fig2 = grafik.figure("box_ikp_bencana", (), lambda: px.box(
+        df_geo,
+        x="Kategori Bencana",
+        y="IKP",
+        color="Kategori Bencana",
+        title="Distribusi IKP Berdasarkan Intensitas Bencana",
+        labels={"IKP": "Indeks Ketahanan Pangan"}
+    ))
+
+    st.plotly_chart(fig2, use_container_width=True)
+
+    st.warning(
+        "Distribusi IKP antar kategori bencana menunjukkan bahwa provinsi dengan intensitas bencana tinggi "
+        "tidak selalu memiliki IKP yang lebih rendah. Hal ini menandakan bahwa ketahanan pangan dipengaruhi "
+        "oleh faktor lain seperti akses distribusi dan infrastruktur pasar."
+    )
+
+    # ================= IKP VS PASAR =================
+    instrumen.bagian("Box IKP vs Pasar")
+    st.subheader("Distribusi IKP Berdasarkan Akses Infrastruktur Pasar")
+
+    # kategori pasar (tersil) sudah dihitung di loader
+    kategori_order = KATEGORI_PASAR
+
+    fig_pasar_box = grafik.figure("box_ikp_pasar", (), lambda: px.box(
+        df_geo,
+        x="Kategori Pasar",
+        y="IKP",
+        color="Kategori Pasar",
+        category_orders={"Kategori Pasar": kategori_order},
+        title="Distribusi IKP Berdasarkan Tingkat Akses Pasar",
+        labels={"IKP": "Indeks Ketahanan Pangan"}
+    ))
+
+    st.plotly_chart(fig_pasar_box, use_container_width=True)
+
+
+    # ================= PENJELASAN =================
+    st.warning(
+        "Infrastruktur pasar berfungsi sebagai penyangga utama ketahanan pangan, terutama dalam menjamin kelancaran distribusi dan keterjangkauan pangan."
+    )
+
+    # ================= IKP PER TAHUN =================
+    # tahun IKP diganti -> hanya fragmen per tahun yang dijalankan ulang
+    ikp_per_tahun(panel)
+
+
+# ================================================================
+# FRAGMEN: SCATTER IKP PER TAHUN + TABEL DATA
+# ================================================================
+@instrumen.fragmen("ikp_per_tahun")
+def ikp_per_tahun(panel):
+    # ================= 1. IKP vs BENCANA (PER TAHUN) =================
+    instrumen.bagian("Scatter IKP vs Bencana")
+    st.header("Apakah Wilayah Rawan Banjir/Kekeringan = Rawan Pangan?")
+
+    # Filter tahun IKP
+    selected_year = st.selectbox(
+        "Pilih Tahun IKP",
+        sorted(panel.index.unique(), reverse=True)
+    )
+
+    # Irisan tahun terpilih (bencana, pasar, IKP tahun itu; baris kosong sudah dibuang)
+    df_scatter = panel.loc[[selected_year]]
+
+    # Scatter plot (scattergl + binning otomatis jika titik sangat banyak)
+    def build_ikp_bencana():
+        fig = grafik.scatter(
+            df_scatter,
+            x="Total_Disaster",
+            y="IKP",
+            size="Jumlah",
+            color="Kerentanan Area",
+            hover_name="Province",
+            size_max=70,
+            title=f"IKP vs Total Bencana Tahun {selected_year}",
+            labels={
+                "Total_Disaster": "Total Banjir + Kekeringan",
+                "IKP": f"Indeks Ketahanan Pangan ({selected_year})"
+            },
+            color_discrete_map=grafik.WARNA_KERENTANAN
+        )
+        fig.add_hline(y=60, line_dash="dash", line_color="gray", annotation_text="Batas Agak Tahan")
+        return fig
+
+    fig1 = grafik.figure("scatter_ikp_bencana", (selected_year,), build_ikp_bencana)
+    st.plotly_chart(fig1, use_container_width=True)
+
+    st.warning(
+        f"Analisis tahun {selected_year} menunjukkan bahwa tingginya frekuensi bencana "
+        "tidak selalu berbanding lurus dengan rendahnya IKP. "
+        "Akses distribusi dan infrastruktur pasar berperan besar dalam menjaga ketahanan pangan."
+    )
+
+    # ================= 2. IKP vs PASAR (PER TAHUN) =================
+    instrumen.bagian("Scatter IKP vs Pasar")
+    st.header("Pengaruh Infrastruktur Pasar terhadap Ketahanan Pangan")
+
+    def build_ikp_pasar():
+        fig = grafik.scatter(
+            df_scatter,
+            x="Jumlah",
+            y="IKP",
+            size="Total_Disaster",
+            color="Kerentanan Area",
+            hover_name="Province",
+            size_max=70,
+            log_x=True,
+            title=f"IKP vs Jumlah Pasar & Toko Tahun {selected_year} (Ukuran = Total Bencana)",
+            labels={
+                "Jumlah": "Total Fasilitas Pasar",
+                "IKP": f"Indeks Ketahanan Pangan ({selected_year})"
+            },
+            color_discrete_map=grafik.WARNA_KERENTANAN
+        )
+
+        fig.add_vline(
+            x=df_scatter['Rata-rata Jumlah Nasional'].iloc[0],
+            line_dash="dash",
+            line_color="orange",
+            annotation_text="Rata-rata Nasional"
+        )
+        return fig
+
+    fig2 = grafik.figure("scatter_ikp_pasar", (selected_year,), build_ikp_pasar)
+
+    st.plotly_chart(fig2, use_container_width=True)
+
+    st.success(
+        f"Pada tahun {selected_year}, provinsi dengan jumlah pasar dan toko yang lebih tinggi "
+        "cenderung memiliki IKP yang lebih baik. Infrastruktur distribusi terbukti menjadi "
+        "faktor kunci dalam menjaga ketahanan pangan."
+    )
+
+    # ================= KESIMPULAN =================
+    st.markdown("---")
+    st.subheader("Kesimpulan & Rekomendasi")
+    st.markdown("""
+    - **Kerawanan pangan TIDAK sebanding dengan tingkat bencana alam**  
+    - **Akses ke pasar & toko adalah prediktor terkuat ketahanan pangan**  
+    - **Indonesia Timur (Papua, Maluku, NTT) paling rentan karena minim infrastruktur distribusi**  
+    **Rekomendasi**: Bangun lebih banyak pasar tradisional, minimarket, dan jalur logistik di Indonesia Timur.
+    """)
+
+    # ================= DATA TABLE =================
+    instrumen.bagian("Tabel Data")
+    with st.expander(f"Lihat Data Lengkap Tahun {selected_year}"):
+        st.dataframe(
+            df_scatter[['Province', 'IKP', 'Kerentanan Area', 'Total_Disaster', 'Jumlah',
+                        'Pasar Tradisional', 'Pusat Perbelanjaan', 'Toko Swalayan']]
+            .sort_values('IKP', ascending=False)
+            .reset_index(drop=True)
+            .round(2),
+            use_container_width=True
+        )
@@ -0,0 +1,235 @@
+import matplotlib.pyplot as plt
+import seaborn as sns
+import streamlit as st
+
+import instrumen
+from dataset import load_cube_gizi, load_gizi_data, load_regresi_stunting, versi_gizi
+from nutrisi import PERBANDINGAN, pivot_tahun, status_tahun
+from render import tampilkan_figure
+from skema import buang_level_kosong
+
+
+# ================================================================
+# SLIDE 4 — ANALISIS KERAWANAN PANGAN
+# ================================================================
+def render():
+    st.title("Dashboard Analisis Kerawanan Pangan Berdasarkan Gizi dan Kesehatan Keluarga")
+    st.markdown("---")
+    st.header("Hubungan Stunting dengan Kerawanan Pangan")
+
+    # ================= LOAD DATA =================
+    instrumen.bagian("Muat Data")
+    data = load_gizi_data()
+    versi = versi_gizi()
+    cube_gizi = load_cube_gizi(versi)
+    regresi_stunting = load_regresi_stunting(versi)
+
+    # ================= PILIH TAHUN =================
+    tahun_list = sorted(data["TAHUN"].unique())
+    tahun_pilih = st.selectbox("Pilih Tahun:", tahun_list)
+
+    df_year = buang_level_kosong(data[data["TAHUN"] == tahun_pilih])
+
+    # ================= SCATTER PLOT 1 =================
+    instrumen.bagian("Scatter IKP vs Stunting")
+    st.subheader("Hubungan IKP dan Prevalensi Stunting")
+
+    def plot_ikp_stunting():
+        fig1, ax1 = plt.subplots(figsize=(7, 4))
+        sns.scatterplot(
+            data=df_year,
+            x="IKP",
+            y="prevalensi_balita_stunting",
+            hue="Kerentanan Area",
+            palette="Greens",
+            ax=ax1
+        )
+        ax1.set_title("Hubungan IKP dan Prevalensi Stunting")
+        ax1.set_xlabel("Indeks Ketahanan Pangan (IKP)")
+        ax1.set_ylabel("Prevalensi Stunting (%)")
+        ax1.grid(True)
+        return fig1
+
+    tampilkan_figure("ikp_stunting", (tahun_pilih,), plot_ikp_stunting)
+
+    # ================= SCATTER PLOT 2 + REGRESSION =================
+    instrumen.bagian("Tren IKP vs Stunting")
+    st.subheader("Tren Hubungan Kerawanan Pangan (IKP) vs Stunting")
+
+    def plot_tren_ikp_stunting():
+        fig2, ax2 = plt.subplots(figsize=(6, 4))
+        sns.scatterplot(
+            data=df_year,
+            x="IKP",
+            y="prevalensi_balita_stunting",
+            hue="Kerentanan Area",
+            palette="YlOrBr",
+            ax=ax2
+        )
+        # garis + pita 95% analitik (pengganti bootstrap regplot)
+        garis = regresi_stunting.garis(tahun_pilih, "IKP")
+        if garis is not None:
+            xs, yhat, lo, hi = garis
+            ax2.plot(xs, yhat, color="green")
+            ax2.fill_between(xs, lo, hi, color="green", alpha=0.15, linewidth=0)
+        ax2.set_title("Tren Hubungan Kerawanan Pangan (IKP) vs Stunting")
+        return fig2
+
+    tampilkan_figure("tren_ikp_stunting", (tahun_pilih,), plot_tren_ikp_stunting)
+
+    # ================= TOP 10 PROVINSI STUNTING =================
+    instrumen.bagian("Top 10 Stunting")
+    st.subheader(f"Top 10 Provinsi dengan Stunting Tertinggi (Tahun {tahun_pilih})")
+
+    top10_stunting = cube_gizi.peringkat_frame(
+        "prevalensi_balita_stunting", tahun_pilih, terbesar=True, kolom_nama="PROVINSI"
+    )
+
+    def plot_top10_stunting():
+        fig3, ax3 = plt.subplots(figsize=(8, 4))
+        sns.barplot(
+            data=top10_stunting,
+            x="PROVINSI",
+            y="prevalensi_balita_stunting",
+            hue="Kerentanan Area",
+            palette="YlGn",
+            ax=ax3
+        )
+        ax3.set_title(f"Top 10 Provinsi dengan Stunting Tertinggi (Tahun {tahun_pilih})")
+        ax3.set_xlabel("Provinsi")
+        ax3.set_ylabel("Prevalensi Stunting (%)")
+        plt.setp(ax3.get_xticklabels(), rotation=45, ha="right")
+        fig3.tight_layout()
+        return fig3
+
+    tampilkan_figure("top10_stunting", (tahun_pilih,), plot_top10_stunting)
+
+    # ============================================================
+    # ANALISIS TAMBAHAN — KONSUMSI GIZI
+    # ============================================================
+    st.markdown("---")
+    st.header("Analisis Konsumsi Nutrisi Berdasarkan Kelompok IKP")
+
+    # ================= DATA RADAR / HEATMAP =================
+    instrumen.bagian("Heatmap Nutrisi")
+    df_radar = data.groupby("Kelompok IKP")[
+        [
+            "Konsumsi Energi (kkal/kap/hari)",
+            "Konsumsi Protein (gram/kap/hari)",
+            "Konsumsi Kalori"
+        ]
+    ].mean().reset_index()
+
+    df_radar = df_radar.rename(columns={
+        "Konsumsi Energi (kkal/kap/hari)": "Energi",
+        "Konsumsi Protein (gram/kap/hari)": "Protein",
+        "Konsumsi Kalori": "Kalori"
+    })
+
+    # scikit-learn hanya dimuat saat heatmap ini dirender
+    from sklearn.preprocessing import MinMaxScaler
+
+    scaler = MinMaxScaler()
+    df_norm = df_radar.copy()
+    df_norm[["Energi", "Protein", "Kalori"]] = (
+        scaler.fit_transform(df_norm[["Energi", "Protein", "Kalori"]]) * 10
+    )
+    df_norm = df_norm.round(2)
+
+    # ================= HEATMAP =================
+    st.subheader("Heatmap Konsumsi Nutrisi per Kelompok IKP")
+
+
+    def plot_heatmap_nutrisi():
+        fig4, ax4 = plt.subplots(figsize=(8, 5))
+        sns.heatmap(
+            df_norm.set_index("Kelompok IKP")[["Energi", "Protein", "Kalori"]],
+            annot=True,
+            cmap="Greens",
+            vmin=0,
+            vmax=10,
+            ax=ax4
+        )
+        ax4.set_title("Konsumsi Nutrisi per Kelompok IKP")
+        return fig4
+
+    tampilkan_figure("heatmap_nutrisi", (), plot_heatmap_nutrisi)
+
+    # ================= TOP 10 PROVINSI PROTEIN TERENDAH =================
+    instrumen.bagian("Top 10 Protein Terendah")
+    st.subheader(f"Top 10 Provinsi dengan Konsumsi Protein Terendah (Tahun {tahun_pilih})")
+
+    top10_low_protein = cube_gizi.peringkat_frame(
+        "Konsumsi Protein (gram/kap/hari)", tahun_pilih, kolom_nama="PROVINSI"
+    )
+
+    def plot_top10_protein_terendah():
+        fig5, ax5 = plt.subplots(figsize=(10, 6))
+        sns.barplot(
+            data=top10_low_protein,
+            x="Konsumsi Protein (gram/kap/hari)",
+            y="PROVINSI",
+            hue="Kerentanan Area",
+            palette="Greens_r",
+            ax=ax5
+        )
+        ax5.set_title(
+            f"Top 10 Provinsi dengan Konsumsi Protein Terendah (Tahun {tahun_pilih})"
+        )
+        ax5.set_xlabel("Protein (gram/kap/hari)")
+        ax5.set_ylabel("Provinsi")
+        fig5.tight_layout()
+        return fig5
+
+    tampilkan_figure("top10_protein_terendah", (tahun_pilih,), plot_top10_protein_terendah)
+
+    # ============================================================
+    # KETERSEDIAAN VS KONSUMSI
+    # ============================================================
+    st.markdown("---")
+    instrumen.bagian("Ketersediaan vs Konsumsi")
+    st.header(f"Ketersediaan vs Konsumsi Gizi per Provinsi (Tahun {tahun_pilih})")
+
+    # pivot provinsi × metrik sudah tercache per tahun, tanpa reshape per rerun
+    banding = pivot_tahun(tahun_pilih)
+    pasangan = {
+        nutrien: (sedia, konsumsi, satuan)
+        for nutrien, (sedia, konsumsi, satuan) in PERBANDINGAN.items()
+        if {sedia, konsumsi} <= set(banding.columns)
+    }
+
+    if not pasangan:
+        st.info(f"Data ketersediaan per provinsi belum tersedia untuk tahun {tahun_pilih}.")
+    else:
+        status = status_tahun(next(iter(pasangan.values()))[0]).get(int(tahun_pilih))
+        if status and status != "Angka tetap":
+            st.caption(f"Ketersediaan tahun {tahun_pilih}: {status.lower()}.")
+
+        kolom_nutrien = st.columns(len(pasangan))
+        for col, (nutrien, (sedia, konsumsi, satuan)) in zip(kolom_nutrien, pasangan.items()):
+            with col:
+                st.subheader(f"{nutrien} ({satuan})")
+
+                def plot_sedia_konsumsi(sedia=sedia, konsumsi=konsumsi, satuan=satuan, nutrien=nutrien):
+                    df_pair = banding[["provinsi", sedia, konsumsi]].dropna()
+                    fig6, ax6 = plt.subplots(figsize=(6, 5))
+                    sns.scatterplot(data=df_pair, x=konsumsi, y=sedia, color="#2E8B57", ax=ax6)
+                    # garis ketersediaan = konsumsi; titik di bawahnya = defisit
+                    batas = [df_pair[[sedia, konsumsi]].min().min(), df_pair[[sedia, konsumsi]].max().max()]
+                    ax6.plot(batas, batas, linestyle="--", color="gray")
+                    for _, row in df_pair[df_pair[sedia] < df_pair[konsumsi]].iterrows():
+                        ax6.annotate(row["provinsi"], (row[konsumsi], row[sedia]), fontsize=7)
+                    ax6.set_xlabel(f"Konsumsi ({satuan})")
+                    ax6.set_ylabel(f"Ketersediaan ({satuan})")
+                    ax6.set_title(f"Ketersediaan vs Konsumsi {nutrien}")
+                    ax6.grid(True)
+                    return fig6
+
+                tampilkan_figure(f"sedia_konsumsi_{nutrien.lower()}", (tahun_pilih,), plot_sedia_konsumsi)
+
+        with st.expander(f"Lihat Rasio Ketersediaan / Konsumsi Tahun {tahun_pilih}"):
+            rasio = banding[["provinsi"]].assign(**{
+                f"Rasio {nutrien} (%)": (banding[sedia] / banding[konsumsi] * 100).round(1)
+                for nutrien, (sedia, konsumsi, _) in pasangan.items()
+            })
+            st.dataframe(rasio.reset_index(drop=True), hide_index=True, use_container_width=True)
@@ -0,0 +1,247 @@
+import matplotlib.pyplot as plt
+import seaborn as sns
+import streamlit as st
+
+import instrumen
+from dataset import load_cube_gizi, load_gizi_data, load_regresi_impor, versi_gizi
+from render import tampilkan_figure
+from skema import buang_level_kosong
+from volatilitas import JENDELA, load_volatilitas
+
+
+# ================================================================
+# SLIDE 5 — ANALISIS KERAWANAN PANGAN TERHADAP PRODUKSI DAN SUPPLY CHAIN
+# ================================================================
+def render():
+    st.title("Dashboard Analisis Kerawanan Pangan Berdasarkan Produksi dan Supply Chain")
+    st.markdown("---")
+    st.header("Pengaruh Produksi dan Supply Chain terhadap Ketahanan Pangan")
+
+    # ================= LOAD DATA =================
+    instrumen.bagian("Muat Data")
+    data = load_gizi_data()
+    versi = versi_gizi()
+    cube_gizi = load_cube_gizi(versi)
+    regresi_impor = load_regresi_impor(versi)
+
+    # ================= BARIS LENGKAP =================
+    # kolom sudah numerik lewat skema; frame bersama tidak diubah, dropna membuat frame baru
+    data = data.dropna(subset=["Produksi (ton)", "Import_Non_Migas", "IKP"])
+
+    # ================= PILIH TAHUN =================
+    tahun_list = sorted(data["TAHUN"].unique())
+    tahun_pilih = st.selectbox("Pilih Tahun Analisis:", tahun_list)
+
+    data_tahun = buang_level_kosong(data[data["TAHUN"] == tahun_pilih])
+
+    # ================= SCATTER PRODUKSI vs IKP =================
+    instrumen.bagian("Scatter Produksi vs IKP")
+    st.subheader(f"Hubungan Produksi Pangan dengan IKP Tahun {tahun_pilih}")
+
+    def plot_produksi_ikp():
+        fig1, ax1 = plt.subplots(figsize=(10,6))
+        sns.scatterplot(
+            data=data_tahun,
+            x="Produksi (ton)",
+            y="IKP",
+            hue="Kerentanan Area",
+            palette="Greens",
+            ax=ax1
+        )
+        ax1.set_xscale("log")
+        ax1.set_xlabel("Produksi (ton) [log scale]")
+        ax1.set_ylabel("IKP")
+        ax1.grid(True)
+        return fig1
+
+    tampilkan_figure("produksi_ikp", (tahun_pilih,), plot_produksi_ikp)
+
+    # ================= BOX PLOT PRODUKTIVITAS & LUAS PANEN =================
+    instrumen.bagian("Box Produktivitas & Luas Panen")
+    st.subheader(f"Produktivitas dan Luas Panen Berdasarkan Kerawanan ({tahun_pilih})")
+
+    def plot_produktivitas_luas_panen():
+        fig2, ax2 = plt.subplots(1, 2, figsize=(14,6))
+        sns.boxplot(
+            data=data_tahun,
+            x="Kerentanan Area",
+            y="Produktivitas (ku/ha)",
+            palette="Greens",
+            ax=ax2[0]
+        )
+        ax2[0].set_title("Produktivitas vs Kerawanan")
+
+        sns.boxplot(
+            data=data_tahun,
+            x="Kerentanan Area",
+            y="Luas Panen (ha)",
+            palette="Greens",
+            ax=ax2[1]
+        )
+        ax2[1].set_title("Luas Panen vs Kerawanan")
+
+        fig2.tight_layout()
+        return fig2
+
+    tampilkan_figure("produktivitas_luas_panen", (tahun_pilih,), plot_produktivitas_luas_panen)
+
+    # ================= TOP 10 PRODUKSI TERENDAH =================
+    instrumen.bagian("Top 10 Produksi Terendah")
+    st.subheader(f"Top 10 Provinsi dengan Produksi Padi Terendah ({tahun_pilih})")
+    top10_low = cube_gizi.peringkat_frame("Produksi (ton)", tahun_pilih, kolom_nama="PROVINSI")
+
+    def plot_top10_produksi_terendah():
+        fig3, ax3 = plt.subplots(figsize=(10,5))
+        sns.barplot(
+            data=top10_low,
+            x="Produksi (ton)",
+            y="PROVINSI",
+            hue="Kerentanan Area",
+            palette="YlGn",
+            ax=ax3
+        )
+        fig3.tight_layout()
+        return fig3
+
+    tampilkan_figure("top10_produksi_terendah", (tahun_pilih,), plot_top10_produksi_terendah)
+
+    # ================= SCATTER IMPOR vs IKP =================
+    instrumen.bagian("Scatter Impor vs IKP")
+    st.subheader(f"Pengaruh Ketergantungan Impor Non-Migas terhadap IKP ({tahun_pilih})")
+
+    def plot_impor_ikp():
+        fig4, ax4 = plt.subplots(figsize=(10,6))
+        sns.scatterplot(
+            data=data_tahun,
+            x="Import_Non_Migas",
+            y="IKP",
+            hue="Kerentanan Area",
+            palette="Greens",
+            ax=ax4
+        )
+        ax4.set_xlabel("Nilai Impor Non-Migas")
+        ax4.set_ylabel("IKP")
+        ax4.grid(True)
+        return fig4
+
+    tampilkan_figure("impor_ikp", (tahun_pilih,), plot_impor_ikp)
+
+    # ================= SCATTER + REGRESI IMPOR vs IKP =================
+    instrumen.bagian("Regresi Impor vs IKP")
+    st.subheader(f"Hubungan Impor Non-Migas vs IKP ({tahun_pilih})")
+
+    def plot_regresi_impor_ikp():
+        fig5, ax5 = plt.subplots(figsize=(9,6))
+        sns.scatterplot(
+            data=data_tahun,
+            x="Import_Non_Migas",
+            y="IKP",
+            hue="Kerentanan Area",
+            palette="Greens",
+            alpha=0.7,
+            ax=ax5
+        )
+        garis = regresi_impor.garis(tahun_pilih, "Import_Non_Migas")
+        if garis is not None:
+            xs, yhat, _, _ = garis
+            ax5.plot(xs, yhat, color="darkgreen", linewidth=2)
+        ax5.grid(True)
+        return fig5
+
+    tampilkan_figure("regresi_impor_ikp", (tahun_pilih,), plot_regresi_impor_ikp)
+
+    # ================= TOP 10 IMPOR TERTINGGI =================
+    instrumen.bagian("Top 10 Impor Tertinggi")
+    st.subheader(f"Top 10 Provinsi dengan Import Non-Migas Tertinggi ({tahun_pilih})")
+    top10_import = cube_gizi.peringkat_frame(
+        "Import_Non_Migas", tahun_pilih, terbesar=True, kolom_nama="PROVINSI"
+    )
+
+    def plot_top10_impor_tertinggi():
+        fig6, ax6 = plt.subplots(figsize=(10,6))
+        sns.barplot(
+            data=top10_import,
+            x="Import_Non_Migas",
+            y="PROVINSI",
+            hue="Kerentanan Area",
+            palette="Greens",
+            ax=ax6
+        )
+        fig6.tight_layout()
+        return fig6
+
+    tampilkan_figure("top10_impor_tertinggi", (tahun_pilih,), plot_top10_impor_tertinggi)
+
+    # ============================================================
+    # VOLATILITAS HARGA: KONSUMEN VS PRODUSEN
+    # ============================================================
+    st.markdown("---")
+    instrumen.bagian("Volatilitas Harga")
+    st.header("Volatilitas Harga Pangan di Rantai Pasok (Konsumen vs Produsen)")
+
+    # array CV + selisih, perubahan tahunan & peringkat sudah dihitung sekali per versi dataset
+    vol = load_volatilitas()
+
+    if int(tahun_pilih) not in vol.tahun:
+        st.info(f"Data koefisien variasi harga belum tersedia untuk tahun {tahun_pilih}.")
+    else:
+        df_vol = vol.frame_tahun(tahun_pilih)
+        pasangan = df_vol[df_vol["berpasangan"]].sort_values("cv_konsumen", ascending=False)
+
+        st.subheader(f"Koefisien Variasi Harga per Komoditas ({tahun_pilih})")
+
+        def plot_cv_konsumen_produsen():
+            df_plot = pasangan.melt(
+                id_vars="komoditas", value_vars=["cv_konsumen", "cv_produsen"],
+                var_name="Tingkat", value_name="CV (%)",
+            )
+            df_plot["Tingkat"] = df_plot["Tingkat"].map({"cv_konsumen": "Konsumen", "cv_produsen": "Produsen"})
+            fig7, ax7 = plt.subplots(figsize=(10, 6))
+            sns.barplot(
+                data=df_plot,
+                x="CV (%)",
+                y="komoditas",
+                hue="Tingkat",
+                palette={"Konsumen": "#2E8B57", "Produsen": "#F39C12"},
+                ax=ax7
+            )
+            ax7.set_ylabel("Komoditas")
+            ax7.set_title(f"Koefisien Variasi Harga Konsumen vs Produsen ({tahun_pilih})")
+            fig7.tight_layout()
+            return fig7
+
+        tampilkan_figure("cv_konsumen_produsen", (tahun_pilih,), plot_cv_konsumen_produsen)
+
+        st.subheader("Selisih Volatilitas Konsumen − Produsen per Tahun")
+        st.caption("Nilai negatif: harga di tingkat konsumen lebih stabil daripada di tingkat produsen.")
+
+        def plot_selisih_volatilitas():
+            # garis = komoditas berpasangan di tahun terpilih, urut CV konsumen tahun itu
+            selisih = vol.seri("selisih").loc[pasangan["komoditas"]]
+            fig8, ax8 = plt.subplots(figsize=(10, 5))
+            for komoditas, baris in selisih.iterrows():
+                ax8.plot(selisih.columns, baris.to_numpy(), marker="o", label=komoditas)
+            ax8.axhline(0, color="gray", linestyle="--", linewidth=1)
+            ax8.set_xticks(list(selisih.columns))
+            ax8.set_xlabel("Tahun")
+            ax8.set_ylabel("Selisih CV (poin persen)")
+            ax8.legend(fontsize=7, ncol=2)
+            ax8.grid(True)
+            fig8.tight_layout()
+            return fig8
+
+        tampilkan_figure("selisih_volatilitas", (tahun_pilih,), plot_selisih_volatilitas)
+
+        with st.expander(f"Lihat Tabel Volatilitas Tahun {tahun_pilih}"):
+            st.caption(f"Peringkat memakai rata-rata CV {JENDELA} tahun terakhir (1 = paling volatil).")
+            tabel = df_vol.drop(columns="berpasangan").rename(columns={
+                "komoditas": "Komoditas",
+                "cv_konsumen": "CV Konsumen (%)",
+                "perubahan_konsumen": "Δ Konsumen",
+                "peringkat_konsumen": "Peringkat Konsumen",
+                "cv_produsen": "CV Produsen (%)",
+                "perubahan_produsen": "Δ Produsen",
+                "peringkat_produsen": "Peringkat Produsen",
+                "selisih": "Selisih (K − P)",
+            })
+            st.dataframe(tabel.round(2), hide_index=True, use_container_width=True)
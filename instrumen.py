@@ -0,0 +1,336 @@
+import atexit
+import functools
+import json
+import os
+import resource
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+import streamlit as st
+
+# ================================================================
+# KONFIGURASI INSTRUMENTASI
+# ================================================================
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# log span per run (JSON lines) + metrik format teks Prometheus
+METRIK_DIR = os.environ.get("DASHBOARD_METRIK_DIR", os.path.join(BASE_DIR, ".cache", "metrik"))
+LOG_PATH = os.path.join(METRIK_DIR, "spans.jsonl")
+PROM_PATH = os.path.join(METRIK_DIR, "metrics.prom")
+
+# file metrik opt-in lewat DASHBOARD_METRIK=1 (span & counter tetap dihitung di memori)
+TULIS_METRIK = os.environ.get("DASHBOARD_METRIK", "0") == "1"
+
+# file ditulis paling sering sekali per interval (detik); baris log run di antaranya
+# ditampung dan ditulis sekaligus, sisa antrean ditulis saat proses berhenti
+INTERVAL_TULIS = float(os.environ.get("DASHBOARD_METRIK_INTERVAL", "10"))
+
+# log dipotong saat melewati ukuran ini (file lama disimpan sebagai .1)
+MAX_LOG_BYTES = 16 * 1024 * 1024
+
+# sidebar debug: ?debug=1 di URL atau DASHBOARD_DEBUG=1
+DEBUG_ENV = os.environ.get("DASHBOARD_DEBUG", "0") == "1"
+
+_HALAMAN = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def rss_mb():
+    # RSS saat ini (Linux); di OS lain jatuh ke puncak RSS
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * _HALAMAN / 1024 / 1024
+    except (OSError, ValueError, IndexError):
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+# ================================================================
+# COUNTER PROSES (DIPAKAI BERSAMA SEMUA SESI)
+# ================================================================
+_lock = threading.Lock()
+_antrean_log = []
+_tulis_terakhir = 0.0
+_span_total = defaultdict(lambda: {"n": 0, "detik": 0.0, "maks": 0.0})
+_cache = defaultdict(lambda: {"panggilan": 0, "miss": 0})
+_lru = {}
+
+
+def _catat_span(nama, detik):
+    with _lock:
+        s = _span_total[nama]
+        s["n"] += 1
+        s["detik"] += detik
+        s["maks"] = max(s["maks"], detik)
+
+
+def daftarkan_lru(nama, cache):
+    # LRUCache (render, figure) ikut dilaporkan lewat stats()
+    _lru[nama] = cache
+
+
+def statistik_cache():
+    with _lock:
+        loader = {k: dict(v, hit=v["panggilan"] - v["miss"]) for k, v in _cache.items()}
+    return loader, {nama: c.stats() for nama, c in _lru.items()}
+
+
+# ================================================================
+# SPAN PER RUN (PER SESI / THREAD SCRIPT)
+# ================================================================
+_run = threading.local()
+
+
+def _spans():
+    return getattr(_run, "spans", None)
+
+
+@contextmanager
+def span(nama):
+    # span di luar run (mis. benchmark, ekspor) tetap masuk counter proses
+    spans = _spans()
+    mulai, mem = time.perf_counter(), rss_mb()
+    kedalaman = getattr(_run, "kedalaman", 0)
+    _run.kedalaman = kedalaman + 1
+    try:
+        yield
+    finally:
+        _run.kedalaman = kedalaman
+        detik = time.perf_counter() - mulai
+        _catat_span(nama, detik)
+        if spans is not None:
+            spans.append({
+                "span": nama,
+                "mulai_ms": round((mulai - _run.mulai) * 1000, 2),
+                "ms": round(detik * 1000, 2),
+                "mem_mb": round(rss_mb() - mem, 2),
+                "level": kedalaman,
+            })
+
+
+def bagian(nama):
+    # penanda bagian halaman yang berurutan: menutup bagian sebelumnya,
+    # membuka yang baru (tanpa harus mengindentasi ulang isi halaman)
+    _tutup_bagian()
+    if _spans() is None:
+        return
+    cm = span(nama)
+    cm.__enter__()
+    _run.bagian = cm
+
+
+def _tutup_bagian():
+    cm = getattr(_run, "bagian", None)
+    if cm is not None:
+        _run.bagian = None
+        cm.__exit__(None, None, None)
+
+
+def mulai_run(label):
+    _run.spans = []
+    _run.bagian = None
+    _run.kedalaman = 0
+    _run.label = label
+    _run.mulai = time.perf_counter()
+    _run.mem = rss_mb()
+
+
+def selesai_run():
+    _tutup_bagian()
+    spans = _spans()
+    if spans is None:
+        return None
+    total = time.perf_counter() - _run.mulai
+    _catat_span(f"run {_run.label}", total)
+    hasil = {
+        "ts": round(time.time(), 3),
+        "run": _run.label,
+        "ms": round(total * 1000, 2),
+        "mem_mb": round(rss_mb() - _run.mem, 2),
+        "rss_mb": round(rss_mb(), 1),
+        # span dicatat saat selesai; diurutkan ulang menurut waktu mulai
+        "spans": sorted(spans, key=lambda s: (s["mulai_ms"], s["level"])),
+    }
+    _run.spans = None
+    if TULIS_METRIK:
+        _antre_metrik(hasil)
+    return hasil
+
+
+# ================================================================
+# FRAGMEN (RERUN PARSIAL)
+# ================================================================
+def fragmen(nama, **opsi):
+    # pengganti @st.fragment: saat rerun parsial app_eda.py tidak dijalankan,
+    # jadi fragmen membuka run sendiri ("fragmen <nama>") supaya tetap terukur
+    def dekor(fn):
+        @st.fragment(**opsi)
+        @functools.wraps(fn)
+        def inti(*args, **kwargs):
+            if _spans() is not None:
+                return fn(*args, **kwargs)
+            # data_store mengimpor instrumen, jadi diimpor saat dipakai
+            from data_store import versi_per_run
+
+            mulai_run(f"fragmen {nama}")
+            try:
+                with versi_per_run():
+                    return fn(*args, **kwargs)
+            finally:
+                selesai_run()
+
+        return inti
+
+    return dekor
+
+
+# ================================================================
+# CACHE LOADER DENGAN COUNTER HIT/MISS
+# ================================================================
+def tercache(cache, nama=None, **opsi):
+    # pengganti @st.cache_data / @st.cache_resource: badan fungsi hanya
+    # jalan saat miss, jadi hit = panggilan - miss
+    def dekor(fn):
+        label = nama or fn.__name__.lstrip("_")
+
+        @cache(**opsi)
+        @functools.wraps(fn)
+        def inti(*args, **kwargs):
+            with _lock:
+                _cache[label]["miss"] += 1
+            with span(f"muat {label}"):
+                return fn(*args, **kwargs)
+
+        @functools.wraps(fn)
+        def luar(*args, **kwargs):
+            with _lock:
+                _cache[label]["panggilan"] += 1
+            return inti(*args, **kwargs)
+
+        luar.clear = inti.clear
+        return luar
+
+    return dekor
+
+
+# ================================================================
+# KELUARAN: LOG JSON LINES & PROMETHEUS
+# ================================================================
+def _antre_metrik(hasil):
+    global _tulis_terakhir
+    baris = json.dumps(hasil, ensure_ascii=False) + "\n"
+    with _lock:
+        _antrean_log.append(baris)
+        sekarang = time.monotonic()
+        if sekarang - _tulis_terakhir < INTERVAL_TULIS:
+            return
+        _tulis_terakhir = sekarang
+    tulis_metrik()
+
+
+def tulis_metrik():
+    with _lock:
+        baris = _antrean_log[:]
+        _antrean_log.clear()
+    try:
+        if baris:
+            tulis_log(baris)
+        tulis_prometheus()
+    except OSError:
+        # metrik hanya alat bantu, dashboard tetap jalan
+        pass
+
+
+def tulis_log(baris):
+    os.makedirs(METRIK_DIR, exist_ok=True)
+    if os.path.exists(LOG_PATH) and os.path.getsize(LOG_PATH) > MAX_LOG_BYTES:
+        os.replace(LOG_PATH, LOG_PATH + ".1")
+    with _lock, open(LOG_PATH, "a", encoding="utf-8") as f:
+        f.writelines(baris)
+
+
+def _label(nilai):
+    return str(nilai).replace("\\", "\\\\").replace('"', '\\"').replace("\n", " ")
+
+
+def teks_prometheus():
+    loader, lru = statistik_cache()
+    with _lock:
+        spans = {k: dict(v) for k, v in _span_total.items()}
+
+    baris = [
+        "# HELP dashboard_span_seconds Durasi span instrumentasi.",
+        "# TYPE dashboard_span_seconds summary",
+    ]
+    for nama, s in sorted(spans.items()):
+        baris.append(f'dashboard_span_seconds_sum{{span="{_label(nama)}"}} {s["detik"]:.6f}')
+        baris.append(f'dashboard_span_seconds_count{{span="{_label(nama)}"}} {s["n"]}')
+    baris += ["# HELP dashboard_span_seconds_max Durasi span terlama.", "# TYPE dashboard_span_seconds_max gauge"]
+    for nama, s in sorted(spans.items()):
+        baris.append(f'dashboard_span_seconds_max{{span="{_label(nama)}"}} {s["maks"]:.6f}')
+
+    baris += ["# HELP dashboard_cache_calls_total Panggilan loader tercache.", "# TYPE dashboard_cache_calls_total counter"]
+    for nama, c in sorted(loader.items()):
+        baris.append(f'dashboard_cache_calls_total{{cache="{_label(nama)}"}} {c["panggilan"]}')
+    baris += ["# HELP dashboard_cache_misses_total Miss loader tercache.", "# TYPE dashboard_cache_misses_total counter"]
+    for nama, c in sorted(loader.items()):
+        baris.append(f'dashboard_cache_misses_total{{cache="{_label(nama)}"}} {c["miss"]}')
+
+    for kunci, jenis in (("hits", "counter"), ("misses", "counter"), ("evictions", "counter"),
+                         ("entries", "gauge"), ("bytes", "gauge")):
+        metrik = f"dashboard_lru_{kunci}" + ("_total" if jenis == "counter" else "")
+        baris += [f"# TYPE {metrik} {jenis}"]
+        for nama, s in sorted(lru.items()):
+            baris.append(f'{metrik}{{cache="{_label(nama)}"}} {s[kunci]}')
+
+    baris += ["# TYPE dashboard_rss_bytes gauge", f"dashboard_rss_bytes {int(rss_mb() * 1024 * 1024)}"]
+    return "\n".join(baris) + "\n"
+
+
+def tulis_prometheus():
+    # untuk textfile collector node_exporter: ditulis atomik
+    os.makedirs(METRIK_DIR, exist_ok=True)
+    tmp = f"{PROM_PATH}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(teks_prometheus())
+    os.replace(tmp, PROM_PATH)
+
+
+if TULIS_METRIK:
+    atexit.register(tulis_metrik)
+
+
+# ================================================================
+# SIDEBAR DEBUG (OPT-IN)
+# ================================================================
+def debug_aktif():
+    if DEBUG_ENV:
+        return True
+    try:
+        return st.query_params.get("debug") == "1"
+    except Exception:
+        return False
+
+
+def tampilkan_debug(hasil):
+    import pandas as pd
+
+    with st.sidebar.expander("🛠️ Debug: Profil Run", expanded=True):
+        st.caption(f"{hasil['run']} — {hasil['ms']:.0f} ms, Δ RSS {hasil['mem_mb']:+.1f} MB, RSS {hasil['rss_mb']:.0f} MB")
+        if hasil["spans"]:
+            spans = pd.DataFrame(hasil["spans"])
+            spans["span"] = ["· " * lv + s for lv, s in zip(spans["level"], spans["span"])]
+            st.dataframe(spans[["span", "ms", "mem_mb"]], hide_index=True, use_container_width=True)
+
+        loader, lru = statistik_cache()
+        if loader:
+            st.markdown("**Cache loader**")
+            st.dataframe(
+                pd.DataFrame(loader).T[["panggilan", "hit", "miss"]].sort_index(),
+                use_container_width=True,
+            )
+        if lru:
+            st.markdown("**Cache LRU**")
+            st.dataframe(pd.DataFrame(lru).T, use_container_width=True)
+        if TULIS_METRIK:
+            st.caption(f"Log: {LOG_PATH}\n\nPrometheus: {PROM_PATH}")
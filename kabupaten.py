@@ -0,0 +1,127 @@
+import hashlib
+import os
+
+import pandas as pd
+import streamlit as st
+
+from agregat import AggregateCube
+from data_store import DATASET_DIR, file_stamp, read_dataset
+from instrumen import tercache
+from provinsi import catat_tidak_cocok, nama_provinsi, normalisasi
+
+# ================================================================
+# DATA TINGKAT KABUPATEN/KOTA
+# ================================================================
+# File CSV panjang di Dataset/kabupaten/: satu baris per kabupaten/kota × tahun.
+# Kode kabupaten/kota = kode BPS 4 digit (2 digit pertama = kode provinsi).
+KABUPATEN_DIR = os.path.join(DATASET_DIR, "kabupaten")
+
+KOLOM_KODE = ("Kode Kabupaten/Kota", "kode_kabkota", "Kode Kab/Kota")
+KOLOM_NAMA = ("Kabupaten/Kota", "kabupaten_kota", "Kab/Kota")
+KOLOM_TAHUN = ("Tahun", "tahun", "TAHUN")
+
+# cara roll-up ke provinsi; metrik yang tidak disebut dijumlahkan
+AGREGASI_KABUPATEN = {
+    "IKP": "mean",
+    "produktivitas": "mean",
+    "prevalensi_balita_stunting": "mean",
+}
+
+
+def kode_provinsi_dari(kode_kabkota):
+    return kode_kabkota // 100
+
+
+def temukan_file_kabupaten():
+    if not os.path.isdir(KABUPATEN_DIR):
+        return []
+    return sorted(f"kabupaten/{f}" for f in os.listdir(KABUPATEN_DIR) if f.endswith(".csv"))
+
+
+def _kolom(df, kandidat, name):
+    for k in kandidat:
+        if k in df.columns:
+            return k
+    raise ValueError(f"Kolom {kandidat[0]} tidak ditemukan di {name}")
+
+
+def _frame_kabupaten(name):
+    df = read_dataset(name)
+    df = df.rename(columns={
+        _kolom(df, KOLOM_KODE, name): "kode_kabkota",
+        _kolom(df, KOLOM_TAHUN, name): "tahun",
+    })
+    nama = next((k for k in KOLOM_NAMA if k in df.columns), None)
+    df = df.rename(columns={nama: "kabupaten_kota"}) if nama else df.assign(kabupaten_kota=None)
+
+    metrik = [c for c in df.columns if c not in ("kode_kabkota", "kabupaten_kota", "tahun")]
+    for c in metrik:
+        df[c] = pd.to_numeric(df[c], errors="coerce")
+    return df
+
+
+# ================================================================
+# LOADER TERCACHE
+# ================================================================
+@tercache(st.cache_resource, show_spinner=False)
+def _load_data_kabupaten(stamps):
+    files = [name for name, _ in stamps]
+    if not files:
+        return None
+
+    df = pd.concat([_frame_kabupaten(name) for name in files], ignore_index=True)
+    df["kode_kabkota"] = pd.to_numeric(df["kode_kabkota"], errors="coerce")
+    df = df.dropna(subset=["kode_kabkota", "tahun"])
+    df["kode_kabkota"] = df["kode_kabkota"].astype("int16")
+    df["tahun"] = df["tahun"].astype(int)
+
+    # kode provinsi diturunkan dari kode kabupaten, dicek ke dimensi provinsi
+    df["kode_provinsi"] = kode_provinsi_dari(df["kode_kabkota"]).astype("int16")
+    dikenal = df["kode_provinsi"].isin(nama_provinsi().index)
+    if not dikenal.all():
+        catat_tidak_cocok("Data kabupaten/kota (kode provinsi)", df.loc[~dikenal, "kode_kabkota"].astype(str).unique())
+        df = df[dikenal]
+
+    # beberapa file boleh mengisi metrik berbeda untuk kabupaten × tahun yang sama
+    df = df.groupby(["kode_kabkota", "tahun"], as_index=False, sort=True).first()
+    df["kabupaten_kota"] = df.groupby("kode_kabkota")["kabupaten_kota"].transform("first")
+    df["kabupaten_kota"] = df["kabupaten_kota"].fillna(df["kode_kabkota"].astype(str)).map(normalisasi)
+    df["provinsi"] = df["kode_provinsi"].map(nama_provinsi())
+
+    awal = ["kode_kabkota", "kabupaten_kota", "kode_provinsi", "provinsi", "tahun"]
+    return df[awal + [c for c in df.columns if c not in awal]].reset_index(drop=True)
+
+
+def _stamps_kabupaten():
+    return tuple((name, file_stamp(name)) for name in temukan_file_kabupaten())
+
+
+def load_data_kabupaten():
+    # None jika belum ada file kabupaten/kota
+    return _load_data_kabupaten(_stamps_kabupaten())
+
+
+def versi_kabupaten():
+    return hashlib.sha1(repr(_stamps_kabupaten()).encode("utf-8")).hexdigest()[:16]
+
+
+def metrik_kabupaten(df):
+    return [c for c in df.columns if c not in ("kode_kabkota", "kabupaten_kota", "kode_provinsi", "provinsi", "tahun")]
+
+
+# ================================================================
+# KUBUS KABUPATEN/KOTA + ROLL-UP PROVINSI
+# ================================================================
+@tercache(st.cache_resource)
+def load_cube_kabupaten(versi):
+    # (kubus kabupaten/kota, kubus provinsi hasil roll-up) atau None
+    df = load_data_kabupaten()
+    if df is None or df.empty:
+        return None
+
+    cube = AggregateCube.dari_frame(
+        df, "tahun", metrik_kabupaten(df), "kabupaten_kota", kolom_kode="kode_kabkota"
+    )
+    # metrik & irisan baru di kubus kabupaten otomatis ikut ke kubus provinsi
+    cube_provinsi = cube.rollup(kode_provinsi_dari(cube.kode), nama_provinsi(), AGREGASI_KABUPATEN)
+    return cube, cube_provinsi
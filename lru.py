@@ -0,0 +1,56 @@
+import threading
+from collections import OrderedDict
+
+
+# ================================================================
+# CACHE LRU BERBATAS UKURAN (DIPAKAI BERSAMA SEMUA SESI)
+# ================================================================
+class LRUCache:
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entri = self._data.get(key)
+            if entri is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entri[0]
+
+    def put(self, key, data, ukuran=None):
+        # ukuran default len(data); objek non-bytes memberi ukuran sendiri
+        ukuran = len(data) if ukuran is None else ukuran
+        with self._lock:
+            if key in self._data:
+                self.total_bytes -= self._data.pop(key)[1]
+            self._data[key] = (data, ukuran)
+            self.total_bytes += ukuran
+            # buang entri paling lama tidak dipakai sampai muat
+            while self.total_bytes > self.max_bytes and len(self._data) > 1:
+                _, (_, lama) = self._data.popitem(last=False)
+                self.total_bytes -= lama
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.total_bytes = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                "entries": len(self._data),
+                "bytes": self.total_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
@@ -0,0 +1,147 @@
+import pandas as pd
+import streamlit as st
+
+from data_store import dataset_version, read_dataset
+from instrumen import tercache
+from provinsi import FILE_DIMENSI, nama_provinsi, pasang_kode
+from skema import LEVEL_STATUS
+
+# ================================================================
+# TABEL PANJANG METRIK NUTRISI (KETERSEDIAAN & KONSUMSI)
+# ================================================================
+# Satu baris per (metrik, provinsi, tahun). Semua file ketersediaan &
+# konsumsi disatukan sekali per versi dataset; pivot per tahun / per metrik
+# dibangun dari tabel ini dan ikut tercache (read-only, dipakai bersama).
+FILE_KETERSEDIAAN = ["Ketersediaan Energi.csv", "Ketersediaan Protein.csv", "Ketersediaan Lemak.csv"]
+FILE_KONSUMSI = ["Rata-rata Konsumsi Energi.csv", "Rata-rata Konsumsi Protein.csv"]
+FILE_KONSUMSI_JENIS = "Rata-rata Konsumsi per Jenis Pangan.csv"
+FILE_NUTRISI = FILE_KETERSEDIAAN + FILE_KONSUMSI + [FILE_KONSUMSI_JENIS]
+
+# baris Wilayah "Nasional" (dan file yang hanya berisi angka nasional)
+KODE_NASIONAL = 0
+
+KOLOM = ["metrik", "kode_provinsi", "tahun", "nilai", "status", "satuan"]
+
+# nutrien -> (metrik ketersediaan, metrik konsumsi, satuan) untuk slide 4
+PERBANDINGAN = {
+    "Energi": ("Ketersediaan Energi", "Konsumsi Energi", "kkal/kap/hari"),
+    "Protein": ("Ketersediaan Protein", "Konsumsi Protein", "gram/kap/hari"),
+}
+
+
+def versi_nutrisi():
+    return dataset_version(*FILE_NUTRISI, FILE_DIMENSI)
+
+
+# ================================================================
+# INGEST PER BENTUK FILE (TANPA LOOP PER BARIS)
+# ================================================================
+def _long_ketersediaan(name):
+    df = read_dataset(name)
+    nasional = df["Wilayah"] == "Nasional"
+    df = pd.concat([
+        df[nasional].assign(kode_provinsi=KODE_NASIONAL),
+        pasang_kode(df[~nasional], "Nama Provinsi", name),
+    ])
+    metrik = [c for c in df.columns if c.startswith("Ketersediaan")]
+    return df.melt(
+        id_vars=["kode_provinsi", "Tahun", "Keterangan", "Satuan"],
+        value_vars=metrik, var_name="metrik", value_name="nilai",
+    ).rename(columns={"Tahun": "tahun", "Keterangan": "status", "Satuan": "satuan"})
+
+
+def _long_konsumsi(name):
+    # satuan ada di nama kolom: "Konsumsi Energi (kkal/kap/hari)"
+    df = pasang_kode(read_dataset(name), "Nama Provinsi", name)
+    kolom = [c for c in df.columns if c.startswith("Konsumsi")]
+    satuan = {}
+    for k in kolom:
+        nama, _, unit = k.partition(" (")
+        satuan[nama] = unit.rstrip(")")
+    df = df.rename(columns={k: k.partition(" (")[0] for k in kolom})
+    long = df.melt(
+        id_vars=["kode_provinsi", "Tahun"], value_vars=list(satuan), var_name="metrik", value_name="nilai",
+    )
+    return long.rename(columns={"Tahun": "tahun"}).assign(satuan=long["metrik"].map(satuan), status=None)
+
+
+def _long_konsumsi_jenis(name):
+    # hanya angka nasional, satu metrik per komoditas
+    df = read_dataset(name)
+    return pd.DataFrame({
+        "metrik": "Konsumsi " + df["Komoditas"].astype(str),
+        "kode_provinsi": KODE_NASIONAL,
+        "tahun": df["Tahun"],
+        "nilai": df["konsumsi_pangan"],
+        "status": None,
+        "satuan": df["Satuan"].astype(str),
+    })
+
+
+def load_metrik_nutrisi():
+    return _load_metrik_nutrisi(versi_nutrisi())
+
+
+@tercache(st.cache_resource, show_spinner=False)
+def _load_metrik_nutrisi(versi):
+    frames = (
+        [_long_ketersediaan(name) for name in FILE_KETERSEDIAAN]
+        + [_long_konsumsi(name) for name in FILE_KONSUMSI]
+        + [_long_konsumsi_jenis(FILE_KONSUMSI_JENIS)]
+    )
+    df = pd.concat([f[KOLOM] for f in frames], ignore_index=True)
+
+    # 0 = belum ada angka (mis. provinsi baru Papua sebelum pemekaran)
+    nilai = pd.to_numeric(df["nilai"], errors="coerce")
+    df = df.assign(nilai=nilai.where(nilai > 0)).dropna(subset=["nilai"])
+
+    df = df.astype({
+        "metrik": "category",
+        "kode_provinsi": "int16",
+        "tahun": "int16",
+        "nilai": "float64",
+        "status": pd.CategoricalDtype(LEVEL_STATUS, ordered=True),
+        "satuan": "category",
+    })
+    return df.sort_values(["metrik", "kode_provinsi", "tahun"], kind="stable").reset_index(drop=True)
+
+
+# ================================================================
+# PIVOT TERCACHE
+# ================================================================
+def _lebar(df, index, kolom):
+    wide = df.pivot(index=index, columns=kolom, values="nilai")
+    wide.columns = [str(c) if kolom == "metrik" else int(c) for c in wide.columns]
+    return wide
+
+
+def pivot_tahun(tahun):
+    # provinsi × metrik untuk satu tahun (tanpa baris nasional)
+    return _pivot_tahun(versi_nutrisi(), int(tahun))
+
+
+@tercache(st.cache_resource, show_spinner=False)
+def _pivot_tahun(versi, tahun):
+    df = load_metrik_nutrisi()
+    irisan = df[(df["tahun"] == tahun) & (df["kode_provinsi"] != KODE_NASIONAL)]
+    wide = _lebar(irisan.assign(metrik=irisan["metrik"].astype(str)), "kode_provinsi", "metrik")
+    wide.insert(0, "provinsi", nama_provinsi().reindex(wide.index).to_numpy())
+    return wide
+
+
+def pivot_metrik(metrik):
+    # provinsi (kode 0 = nasional) × tahun untuk satu metrik
+    return _pivot_metrik(versi_nutrisi(), metrik)
+
+
+@tercache(st.cache_resource, show_spinner=False)
+def _pivot_metrik(versi, metrik):
+    df = load_metrik_nutrisi()
+    return _lebar(df[df["metrik"] == metrik], "kode_provinsi", "tahun")
+
+
+def status_tahun(metrik):
+    # status angka paling sementara per tahun, mis. {2023: "Angka sangat sementara"}
+    df = load_metrik_nutrisi()
+    df = df[(df["metrik"] == metrik) & df["status"].notna()]
+    return {int(t): str(s) for t, s in df.groupby("tahun", observed=True)["status"].max().items()}
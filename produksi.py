@@ -0,0 +1,184 @@
+import hashlib
+import json
+import os
+import re
+
+import pandas as pd
+import streamlit as st
+
+from bps import load_produksi_bps, temukan_file_bps
+from data_store import BASE_DIR, file_stamp, read_dataset, sekali_per_run
+from instrumen import tercache
+from provinsi import nama_provinsi, pasang_kode
+
+# ================================================================
+# TABEL PANJANG PRODUKSI (APPEND-ONLY PER SLICE KOMODITAS × TAHUN)
+# ================================================================
+PRODUKSI_DIR = os.path.join(BASE_DIR, ".cache", "produksi")
+MANIFEST_PATH = os.path.join(PRODUKSI_DIR, "manifest.json")
+
+# file lebar hasil cleaning manual; kolom tahun dideteksi otomatis
+SUMBER_WIDE = {
+    "padi": "Produksi_Padi_2020_2024_Clean.csv",
+    "jagung": "Produksi_Jagung_2020_2024_Clean.csv",
+}
+
+POLA_TAHUN = re.compile(r"\d{4}")
+
+KOLOM = ["kode_provinsi", "provinsi", "tahun", "komoditas", "produksi"]
+
+
+def kolom_tahun(df):
+    return [c for c in df.columns if POLA_TAHUN.fullmatch(str(c))]
+
+
+def _kunci(komoditas, tahun):
+    return f"{komoditas}:{tahun}"
+
+
+def _pisah(kunci):
+    komoditas, tahun = kunci.split(":")
+    return komoditas, int(tahun)
+
+
+def _path_slice(kunci):
+    return os.path.join(PRODUKSI_DIR, kunci.replace(":", "-") + ".parquet")
+
+
+def _sidik(df):
+    nilai = pd.util.hash_pandas_object(df, index=False).to_numpy()
+    return hashlib.sha1(nilai.tobytes()).hexdigest()[:16]
+
+
+def _baca_manifest():
+    try:
+        with open(MANIFEST_PATH, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {"sumber": {}, "slice": {}}
+
+
+def _tulis_atomik(path, tulis):
+    tmp = f"{path}.{os.getpid()}.tmp"
+    tulis(tmp)
+    os.replace(tmp, path)
+
+
+def _tulis_manifest(manifest):
+    def tulis(path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+
+    _tulis_atomik(MANIFEST_PATH, tulis)
+
+
+def _simpan_slice(manifest, kunci, sumber, df):
+    sidik = _sidik(df)
+    lama = manifest["slice"].get(kunci)
+    if lama and lama["sidik"] == sidik and os.path.exists(_path_slice(kunci)):
+        return False
+    _tulis_atomik(_path_slice(kunci), lambda p: df.to_parquet(p, index=False))
+    manifest["slice"][kunci] = {"sumber": sumber, "sidik": sidik}
+    return True
+
+
+# ================================================================
+# SLICE DARI TIAP SUMBER
+# ================================================================
+def _slice_wide(komoditas, name):
+    wide = read_dataset(name).rename(columns={"Provinsi": "provinsi"})
+    wide = pasang_kode(wide, "provinsi", name)
+    for kolom in kolom_tahun(wide):
+        df = wide[["kode_provinsi", "provinsi", kolom]].rename(columns={kolom: "produksi"})
+        df.insert(2, "tahun", int(kolom))
+        df.insert(3, "komoditas", komoditas)
+        yield _kunci(komoditas, kolom), df[KOLOM]
+
+
+def _slice_bps(tahun_wide):
+    bps = load_produksi_bps()
+    for (komoditas, tahun), df in bps.groupby(["komoditas", "tahun"], sort=True):
+        # file lebar (sudah dibersihkan manual) diutamakan untuk tahun yang sama
+        if (komoditas, tahun) in tahun_wide:
+            continue
+        yield _kunci(komoditas, tahun), df[KOLOM].reset_index(drop=True)
+
+
+def _stamp_sumber():
+    stamps = {name: list(file_stamp(name)) for name in SUMBER_WIDE.values()}
+    for name, _, _ in temukan_file_bps():
+        stamps[name] = list(file_stamp(name))
+    return stamps
+
+
+# ================================================================
+# SINKRONISASI INKREMENTAL
+# ================================================================
+def sinkron_produksi():
+    os.makedirs(PRODUKSI_DIR, exist_ok=True)
+    manifest = _baca_manifest()
+    stamps = _stamp_sumber()
+    sumber_wide = set(SUMBER_WIDE.values())
+
+    # slice (komoditas, tahun) yang sudah dipegang file lebar
+    tahun_wide = {_pisah(k) for k, v in manifest["slice"].items() if v["sumber"] in sumber_wide}
+    ditulis = []
+
+    for komoditas, name in SUMBER_WIDE.items():
+        # sumber yang tidak berubah dilewati tanpa dibaca sama sekali
+        if manifest["sumber"].get(name) == stamps[name]:
+            continue
+        for kunci, df in _slice_wide(komoditas, name):
+            tahun_wide.add(_pisah(kunci))
+            if _simpan_slice(manifest, kunci, name, df):
+                ditulis.append(kunci)
+        manifest["sumber"][name] = stamps[name]
+
+    bps_berubah = any(
+        manifest["sumber"].get(name) != stamp
+        for name, stamp in stamps.items() if name not in sumber_wide
+    )
+    if bps_berubah:
+        for kunci, df in _slice_bps(tahun_wide):
+            if _simpan_slice(manifest, kunci, "BPS", df):
+                ditulis.append(kunci)
+        manifest["sumber"].update(stamps)
+
+    # slice lama tidak pernah dihapus: riwayat yang sudah ada dibiarkan
+    if ditulis or bps_berubah:
+        _tulis_manifest(manifest)
+
+    return manifest, ditulis
+
+
+@tercache(st.cache_resource, show_spinner=False)
+def _load_produksi_long(stamps):
+    manifest, _ = sinkron_produksi()
+    # slice yang sudah ada tidak diolah ulang, cukup dibaca dari Parquet
+    frames = {kunci: pd.read_parquet(_path_slice(kunci)) for kunci in sorted(manifest["slice"])}
+    df = pd.concat(frames.values(), ignore_index=True)
+    # tahun ringkas seperti kolom Tahun file lain di skema.py (slice lama bisa int64)
+    df["tahun"] = df["tahun"].astype("int16")
+
+    # nama tampilan mengikuti file lebar; provinsi baru memakai nama kanonik
+    nama = {}
+    for kunci, frame in frames.items():
+        if manifest["slice"][kunci]["sumber"] in SUMBER_WIDE.values():
+            nama.update(zip(frame["kode_provinsi"], frame["provinsi"]))
+    kanonik = nama_provinsi()
+    df["provinsi"] = [nama.get(k) or kanonik.get(k, "").title() for k in df["kode_provinsi"]]
+    return df
+
+
+def load_produksi_long():
+    stamps = tuple(sorted((name, tuple(stamp)) for name, stamp in _stamp_sumber().items()))
+    return _load_produksi_long(stamps)
+
+
+def _hitung_versi_produksi():
+    return hashlib.sha1(repr(sorted(_stamp_sumber().items())).encode("utf-8")).hexdigest()[:16]
+
+
+def versi_produksi():
+    # listdir folder BPS + stat semua sumber cukup sekali per run
+    return sekali_per_run("produksi", _hitung_versi_produksi)
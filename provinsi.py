@@ -0,0 +1,123 @@
+import logging
+import re
+
+import pandas as pd
+import streamlit as st
+
+from data_store import file_stamp, read_dataset
+from instrumen import tercache
+
+logger = logging.getLogger(__name__)
+
+# ================================================================
+# DIMENSI PROVINSI
+# ================================================================
+# Kunci utama: "Kode Provinsi" dari Indeks Ketahanan Pangan.csv (kode BPS).
+# Empat provinsi baru Papua belum ada di file IKP, jadi ditambahkan manual.
+PROVINSI_BARU = {
+    92: "PAPUA BARAT DAYA",
+    95: "PAPUA SELATAN",
+    96: "PAPUA TENGAH",
+    97: "PAPUA PEGUNUNGAN",
+}
+
+# Ejaan lain yang dipakai dataset (sudah dinormalisasi, titik diabaikan)
+ALIAS = {
+    "KEP BANGKA BELITUNG": "KEPULAUAN BANGKA BELITUNG",
+    "BANGKA BELITUNG": "KEPULAUAN BANGKA BELITUNG",
+    "KEP RIAU": "KEPULAUAN RIAU",
+    "DAERAH ISTIMEWA YOGYAKARTA": "DI YOGYAKARTA",
+    "NTB": "NUSA TENGGARA BARAT",
+    "NTT": "NUSA TENGGARA TIMUR",
+    "KOTA JAMBI": "JAMBI",
+}
+
+FILE_DIMENSI = "Indeks Ketahanan Pangan.csv"
+
+# Baris agregat nasional bukan provinsi, dibuang tanpa dilaporkan
+BUKAN_PROVINSI = {"INDONESIA", "NASIONAL", "TOTAL"}
+
+# Nama yang gagal dicocokkan, per sumber data
+_tidak_cocok = {}
+
+
+def normalisasi(nama):
+    nama = str(nama).upper().replace("_", " ")
+    return re.sub(r"\s+", " ", nama).strip()
+
+
+def load_dim_provinsi():
+    return _load_dim_provinsi(file_stamp(FILE_DIMENSI))
+
+
+@tercache(st.cache_resource, show_spinner=False)
+def _load_dim_provinsi(stamp):
+    # dipakai bersama semua sesi (read-only); dibangun ulang saat file IKP berubah
+    df_ikp = read_dataset(FILE_DIMENSI)
+
+    dim = (
+        df_ikp[["Kode Provinsi", "PROVINSI"]]
+        .drop_duplicates("Kode Provinsi")
+        .rename(columns={"Kode Provinsi": "kode_provinsi", "PROVINSI": "provinsi"})
+    )
+    baru = pd.DataFrame(
+        {"kode_provinsi": list(PROVINSI_BARU), "provinsi": list(PROVINSI_BARU.values())}
+    )
+    dim = pd.concat([dim, baru], ignore_index=True)
+    dim["provinsi"] = dim["provinsi"].map(normalisasi)
+    dim["kode_provinsi"] = dim["kode_provinsi"].astype("int16")
+
+    return dim.sort_values("kode_provinsi").reset_index(drop=True)
+
+
+def alias_index():
+    return _alias_index(file_stamp(FILE_DIMENSI))
+
+
+@tercache(st.cache_resource, show_spinner=False)
+def _alias_index(stamp):
+    dim = load_dim_provinsi()
+    index = dict(zip(dim["provinsi"], dim["kode_provinsi"].astype(int)))
+    for alias, nama in ALIAS.items():
+        index[alias] = index[nama]
+    return index
+
+
+def nama_provinsi():
+    dim = load_dim_provinsi()
+    return pd.Series(dim["provinsi"].values, index=dim["kode_provinsi"].values)
+
+
+# ================================================================
+# PASANG KODE PROVINSI KE FRAME
+# ================================================================
+def pasang_kode(df, kolom, sumber):
+    index = alias_index()
+
+    # normalisasi cukup sekali per nama unik, bukan per baris
+    peta = {}
+    gagal = []
+    for nama in pd.unique(df[kolom].dropna()):
+        kunci = normalisasi(nama)
+        kode = index.get(kunci, index.get(kunci.replace(".", "")))
+        peta[nama] = kode
+        if kode is None and kunci not in BUKAN_PROVINSI:
+            gagal.append(nama)
+
+    if gagal:
+        catat_tidak_cocok(sumber, gagal)
+
+    kode = df[kolom].map(peta)
+    df = df[kode.notna()].copy()
+    df["kode_provinsi"] = kode[kode.notna()].astype("int16")
+    return df
+
+
+def catat_tidak_cocok(sumber, nama_list):
+    nama_list = sorted(set(_tidak_cocok.get(sumber, [])) | {str(n) for n in nama_list})
+    _tidak_cocok[sumber] = nama_list
+    logger.warning("Provinsi tidak cocok di %s: %s", sumber, ", ".join(nama_list))
+
+
+def laporan_tidak_cocok():
+    return dict(_tidak_cocok)
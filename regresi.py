@@ -0,0 +1,182 @@
+import numpy as np
+import pandas as pd
+
+# ================================================================
+# KONFIGURASI REGRESI
+# ================================================================
+# tingkat kepercayaan pita (sama dengan default ci=95 seaborn)
+LEVEL_CI = 0.95
+
+# jumlah titik garis/pita yang disimpan per pasangan
+TITIK_GARIS = 50
+
+
+# ================================================================
+# OLS SEDERHANA y = a + b·x UNTUK BANYAK PASANGAN SEKALIGUS
+# ================================================================
+def fit_ols(x, y):
+    # x, y: array (k, n); NaN di salah satu sisi = titik diabaikan
+    x = np.atleast_2d(np.asarray(x, dtype=float))
+    y = np.atleast_2d(np.asarray(y, dtype=float))
+    mask = ~(np.isnan(x) | np.isnan(y))
+    xz = np.where(mask, x, 0.0)
+    yz = np.where(mask, y, 0.0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        n = mask.sum(axis=1)
+        x_mean = xz.sum(axis=1) / n
+        y_mean = yz.sum(axis=1) / n
+        dx = np.where(mask, x - x_mean[:, None], 0.0)
+        dy = np.where(mask, y - y_mean[:, None], 0.0)
+
+        sxx = (dx * dx).sum(axis=1)
+        sxy = (dx * dy).sum(axis=1)
+        syy = (dy * dy).sum(axis=1)
+
+        slope = sxy / sxx
+        intercept = y_mean - slope * x_mean
+        sse = np.maximum(syy - slope * sxy, 0.0)
+        # varians residu dengan derajat bebas n - 2
+        s2 = np.where(n > 2, sse / (n - 2), np.nan)
+        r2 = 1.0 - sse / syy
+        r = sxy / np.sqrt(sxx * syy)
+
+    # x tanpa titik valid diberi NaN supaya min/max tidak gagal
+    x_nan = np.where(mask, x, np.nan)
+    kosong = n == 0
+    x_nan[kosong] = 0.0
+    x_min = np.where(kosong, np.nan, np.nanmin(x_nan, axis=1))
+    x_max = np.where(kosong, np.nan, np.nanmax(x_nan, axis=1))
+
+    return {
+        "n": n,
+        "slope": slope,
+        "intercept": intercept,
+        "x_mean": x_mean,
+        "sxx": sxx,
+        "s2": s2,
+        "r2": r2,
+        "r": r,
+        "x_min": x_min,
+        "x_max": x_max,
+    }
+
+
+def spearman(x, y):
+    # Pearson atas peringkat (rata-rata untuk nilai kembar) per baris
+    x = np.atleast_2d(np.asarray(x, dtype=float))
+    y = np.atleast_2d(np.asarray(y, dtype=float))
+    mask = ~(np.isnan(x) | np.isnan(y))
+    xr = pd.DataFrame(np.where(mask, x, np.nan)).rank(axis=1).to_numpy()
+    yr = pd.DataFrame(np.where(mask, y, np.nan)).rank(axis=1).to_numpy()
+    return fit_ols(xr, yr)["r"]
+
+
+def _t_kritis(level, df):
+    # scipy sudah terpasang lewat scikit-learn; dimuat hanya saat fitting
+    from scipy.special import stdtrit
+
+    df = np.asarray(df, dtype=float)
+    with np.errstate(invalid="ignore"):
+        return np.where(df > 0, stdtrit(np.maximum(df, 1), 0.5 + level / 2), np.nan)
+
+
+def garis_ols(fit, level=LEVEL_CI, titik=TITIK_GARIS):
+    # garis prediksi + pita kepercayaan rata-rata (analitik, tanpa bootstrap)
+    u = np.linspace(0.0, 1.0, titik)
+    xs = fit["x_min"][:, None] + (fit["x_max"] - fit["x_min"])[:, None] * u
+    yhat = fit["intercept"][:, None] + fit["slope"][:, None] * xs
+
+    t = _t_kritis(level, fit["n"] - 2)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        se = np.sqrt(
+            fit["s2"][:, None]
+            * (1.0 / fit["n"][:, None] + (xs - fit["x_mean"][:, None]) ** 2 / fit["sxx"][:, None])
+        )
+    lebar = t[:, None] * se
+    return xs, yhat, yhat - lebar, yhat + lebar
+
+
+# ================================================================
+# TABEL REGRESI (DIHITUNG SEKALI PER VERSI DATASET)
+# ================================================================
+class RegressionTable:
+    # satu baris per kunci (kelompok, kolom_x); garis & pita sudah jadi
+
+    def __init__(self, kunci, fit, level=LEVEL_CI, titik=TITIK_GARIS):
+        self.kunci = list(kunci)
+        self.fit = fit
+        self.level = level
+        self.xs, self.yhat, self.lo, self.hi = garis_ols(fit, level, titik)
+        self._index = {k: i for i, k in enumerate(self.kunci)}
+        self.kelompok = list(dict.fromkeys(k[0] for k in self.kunci))
+        self.faktor = list(dict.fromkeys(k[1] for k in self.kunci))
+
+    @classmethod
+    def dari_frame(cls, df, kolom_kelompok, kolom_x, kolom_y, level=LEVEL_CI, titik=TITIK_GARIS):
+        # to_numpy dulu: kolom kelompok boleh bertipe category
+        nilai_kelompok = df[kolom_kelompok].to_numpy()
+        kelompok = np.sort(pd.unique(nilai_kelompok))
+        gi = np.searchsorted(kelompok, nilai_kelompok)
+
+        # posisi baris di dalam kelompoknya -> matriks (kelompok, n) berisi NaN
+        urut = np.argsort(gi, kind="stable")
+        awal = np.searchsorted(gi[urut], np.arange(len(kelompok)))
+        posisi = np.empty(len(gi), dtype=int)
+        posisi[urut] = np.arange(len(gi)) - awal[gi[urut]]
+        lebar = int(posisi.max()) + 1 if len(gi) else 0
+
+        def matriks(kolom):
+            arr = np.full((len(kelompok), lebar), np.nan)
+            arr[gi, posisi] = pd.to_numeric(df[kolom], errors="coerce").to_numpy(dtype=float)
+            return arr
+
+        y = matriks(kolom_y)
+        x = np.stack([matriks(k) for k in kolom_x], axis=1).reshape(-1, lebar)
+        y = np.repeat(y[:, None, :], len(kolom_x), axis=1).reshape(-1, lebar)
+
+        kunci = [(g.item() if hasattr(g, "item") else g, k) for g in kelompok for k in kolom_x]
+        fit = fit_ols(x, y)
+        fit["spearman"] = spearman(x, y)
+        return cls(kunci, fit, level, titik)
+
+    # ================= LOOKUP =================
+    def i(self, kelompok, kolom_x):
+        return self._index.get((kelompok, kolom_x))
+
+    def koef(self, kelompok, kolom_x):
+        i = self.i(kelompok, kolom_x)
+        if i is None:
+            return None
+        return {nama: arr[i].item() for nama, arr in self.fit.items()}
+
+    def garis(self, kelompok, kolom_x):
+        # None jika pasangan tidak ada atau titik valid < 2
+        i = self.i(kelompok, kolom_x)
+        if i is None or not np.isfinite(self.fit["slope"][i]):
+            return None
+        return self.xs[i], self.yhat[i], self.lo[i], self.hi[i]
+
+    # ================= PERINGKAT FAKTOR =================
+    def peringkat(self, kelompok):
+        # semua faktor untuk satu kelompok, diurutkan menurut |Pearson r|
+        idx = [self._index[(kelompok, f)] for f in self.faktor]
+        df = pd.DataFrame({
+            "faktor": self.faktor,
+            "pearson": self.fit["r"][idx],
+            "spearman": self.fit["spearman"][idx],
+            "slope": self.fit["slope"][idx],
+            "r2": self.fit["r2"][idx],
+            "n": self.fit["n"][idx],
+        })
+        urut = np.argsort(-np.nan_to_num(np.abs(df["pearson"].to_numpy()), nan=-1.0), kind="stable")
+        return df.iloc[urut].reset_index(drop=True)
+
+    def matriks(self, metrik="r"):
+        # kelompok × faktor, untuk heatmap
+        arr = self.fit[metrik]
+        return pd.DataFrame(
+            [[arr[self._index[(g, f)]] for f in self.faktor] for g in self.kelompok],
+            index=self.kelompok,
+            columns=self.faktor,
+        )
@@ -0,0 +1,84 @@
+import io
+from contextlib import contextmanager
+
+import matplotlib.pyplot as plt
+import streamlit as st
+
+from data_store import versi_run
+from instrumen import daftarkan_lru, span
+from lru import LRUCache
+
+# ================================================================
+# KONFIGURASI RENDER
+# ================================================================
+# batas total byte gambar di cache (dipakai bersama semua sesi)
+MAX_CACHE_BYTES = 64 * 1024 * 1024
+
+# sama dengan default st.pyplot
+DPI = 200
+
+# st.image mendekode, mengecilkan & meng-encode ulang PNG yang lebih lebar dari
+# lebar konten maksimum Streamlit (2 × 730 px) di SETIAP rerun, juga saat cache hit;
+# gambar lebar dirasterisasi dengan DPI lebih kecil supaya tidak melewati batas ini
+LEBAR_MAKS_PX = 2 * 730
+PAD_INCHES = 0.1
+
+
+render_cache = LRUCache(MAX_CACHE_BYTES)
+daftarkan_lru("render", render_cache)
+
+# daftar (chart_id, fmt, bytes) sesuai urutan tampil; hanya aktif saat ekspor.
+# sengaja bukan thread-local: AppTest menjalankan skrip di thread lain
+_perekam = None
+
+
+# ================================================================
+# RENDER FIGURE -> BYTES
+# ================================================================
+def _dpi(fig):
+    # lebar hasil bbox "tight" (inci) -> DPI terbesar yang masih <= LEBAR_MAKS_PX
+    lebar = fig.get_tightbbox(fig.canvas.get_renderer()).width + 2 * PAD_INCHES
+    return min(DPI, int((LEBAR_MAKS_PX - 1) / lebar))
+
+
+def render_bytes(chart_id, kunci, build, fmt="png"):
+    key = (chart_id, kunci, fmt, versi_run())
+    data = render_cache.get(key)
+    if data is not None:
+        return data
+
+    with span(f"build {chart_id}"):
+        fig = build()
+    try:
+        buf = io.BytesIO()
+        with span(f"rasterisasi {chart_id}"):
+            fig.savefig(buf, format=fmt, bbox_inches="tight", pad_inches=PAD_INCHES, dpi=_dpi(fig))
+    finally:
+        # figure langsung dilepas setelah dirasterisasi
+        plt.close(fig)
+
+    data = buf.getvalue()
+    render_cache.put(key, data)
+    return data
+
+
+@contextmanager
+def rekam_gambar():
+    global _perekam
+    _perekam, sebelum = [], _perekam
+    try:
+        yield _perekam
+    finally:
+        _perekam = sebelum
+
+
+def tampilkan_figure(chart_id, kunci, build, fmt="png"):
+    data = render_bytes(chart_id, kunci, build, fmt)
+    if _perekam is not None:
+        _perekam.append((chart_id, fmt, data))
+    # serialisasi ke pesan Streamlit (media file + protobuf) diukur terpisah
+    with span(f"kirim {chart_id}"):
+        if fmt == "svg":
+            st.image(data.decode("utf-8"))
+        else:
+            st.image(data)
@@ -0,0 +1,217 @@
+import numpy as np
+import pandas as pd
+
+# ================================================================
+# SKEMA TIPE DATA PER FILE DATASET
+# ================================================================
+# Diterapkan saat parsing (sebelum snapshot Parquet ditulis), jadi frame
+# tercache langsung ringkas: teks berulang -> category, tahun -> int16,
+# ukuran kecil (indeks, persen) -> float32. Nilai besar (ton, rupiah, ha)
+# tetap float64 supaya angka yang ditampilkan tidak berubah.
+LEVEL_KERENTANAN = [
+    "Sangat Rentan", "Rentan", "Agak Rentan", "Agak Tahan", "Tahan", "Sangat Tahan",
+]
+
+# status angka BPS/Bapanas, dari yang paling final
+LEVEL_STATUS = ["Angka tetap", "Angka sementara", "Angka sangat sementara"]
+
+# "kategori" = level diambil dari data; list = level tetap (berurutan)
+SKEMA = {
+    "Analisis_gizi_dan_kesehata_keluarga.csv": {
+        "kolom": {
+            "TAHUN": "int16",
+            "PROVINSI": "kategori",
+            "IKP": "float32",
+            "Kelompok IKP": "int8",
+            "Kerentanan Area": LEVEL_KERENTANAN,
+            "prevalensi_balita_stunting": "float32",
+            "satuan": "kategori",
+            "Konsumsi Energi (kkal/kap/hari)": "int16",
+            "Konsumsi Protein (gram/kap/hari)": "float32",
+            "Konsumsi Kalori": "float32",
+            "Produktivitas (ku/ha)": "float32",
+        },
+    },
+    "Sosial Budaya - Dataset Utama.csv": {
+        "kolom": {
+            "TAHUN": "int16",
+            "Kerentanan Area": LEVEL_KERENTANAN,
+            "IKP": "float32",
+            "P0": "float32",
+            "RLS": "float32",
+            "RTL": "float32",
+            "1": "float32",
+            "2-3": "float32",
+            "4-5": "float32",
+            "≥6": "float32",
+            "KPM": "int32",
+            "Wirausaha": "int32",
+            "Usaha Kecil": "int32",
+            "Usaha Besar": "int32",
+            "Karyawan/Formal": "int32",
+            "Lepas Pertanian": "int32",
+            "Lepas Non-Pertanian": "int32",
+            "Pekerja Keluarga": "int32",
+        },
+        # angka desimal berformat "66,22" (koma) di kolom-kolom ini saja
+        "desimal_koma": ["IKP", "P0", "RLS", "RTL", "1", "2-3", "4-5", "≥6"],
+    },
+    "Indeks Ketahanan Pangan.csv": {
+        "kolom": {
+            "NO": "int16",
+            "TAHUN": "int16",
+            "Kode Provinsi": "int16",
+            "IKP": "float32",
+            "Kelompok IKP": "int8",
+            "Kerentanan Area": LEVEL_KERENTANAN,
+        },
+    },
+    "Pasar_34_provinsi.csv": {
+        # provinsi tanpa data ditulis "-" -> NaN
+        "numerik": ["Pasar Tradisional", "Pusat Perbelanjaan", "Toko Swalayan", "Jumlah"],
+    },
+    "merged_disaster_flood_drought.csv": {
+        "kolom": {
+            "Total_Flood": "int32",
+            "Total_Drought": "int32",
+            "Total_Disaster": "int32",
+        },
+    },
+    **{
+        f"Ketersediaan {gizi}.csv": {
+            "kolom": {
+                "Wilayah": "kategori",
+                "Tahun": "int16",
+                "Satuan": "kategori",
+                "Keterangan": LEVEL_STATUS,
+            },
+            "numerik": [
+                f"Ketersediaan {gizi} Nabati", f"Ketersediaan {gizi} Hewani", f"Ketersediaan {gizi}",
+            ],
+        }
+        for gizi in ("Energi", "Protein", "Lemak")
+    },
+    "Rata-rata Konsumsi Energi.csv": {
+        "kolom": {"Tahun": "int16"},
+        "numerik": ["Konsumsi Energi (kkal/kap/hari)"],
+    },
+    "Rata-rata Konsumsi Protein.csv": {
+        # angka ditulis dengan spasi di kiri/kanan ("  59.10 ")
+        "kolom": {"Tahun": "int16"},
+        "numerik": ["Konsumsi Protein (gram/kap/hari)"],
+    },
+    "Rata-rata Konsumsi per Jenis Pangan.csv": {
+        "kolom": {
+            "Kelompok Bahan Pangan": "kategori",
+            "Komoditas": "kategori",
+            "Satuan": "kategori",
+            "Tahun": "int16",
+        },
+        "numerik": ["konsumsi_pangan"],
+    },
+    **{
+        f"Koefisien Variasi Harga Pangan Tingkat {tingkat}.csv": {
+            "kolom": {"Tahun": "int16"},
+            # "0.50% " (2021–2023) dan "2,25%" (2024) di kolom yang sama
+            "persen": ["CV"],
+        }
+        for tingkat in ("Konsumen", "Produsen")
+    },
+    "Produksi_Padi_2020_2024_Clean.csv": {
+        "kolom": {f"IKP {t}": "kategori" for t in range(2020, 2025)},
+    },
+    "Produksi_Jagung_2020_2024_Clean.csv": {
+        "kolom": {f"IKP {t}": "kategori" for t in range(2020, 2025)},
+    },
+}
+
+
+def skema_untuk(name):
+    return SKEMA.get(name, {})
+
+
+# ================================================================
+# PENERAPAN SKEMA
+# ================================================================
+def _desimal_koma(teks):
+    # "66,22" -> 66.22 langsung saat parsing, tanpa kolom string perantara
+    teks = teks.strip().replace(",", ".")
+    try:
+        return float(teks) if teks else np.nan
+    except ValueError:
+        return np.nan
+
+
+def _tipe_baca(tipe):
+    # integer dibaca sebagai tipe nullable: sel kosong tidak menggagalkan load
+    # (diturunkan lagi ke int numpy di terapkan_skema jika kolomnya lengkap)
+    if isinstance(tipe, list) or tipe == "kategori":
+        return "category"
+    if tipe.startswith("int"):
+        return tipe.capitalize()
+    return tipe
+
+
+def opsi_read_csv(skema):
+    # tipe yang aman langsung diparse oleh read_csv (tanpa salinan string)
+    desimal_koma = set(skema.get("desimal_koma", ()))
+    khusus = desimal_koma | set(skema.get("numerik", ())) | set(skema.get("persen", ()))
+    dtype = {}
+    for kolom, tipe in skema.get("kolom", {}).items():
+        if kolom not in khusus:
+            dtype[kolom] = _tipe_baca(tipe)
+    opsi = {}
+    if dtype:
+        opsi["dtype"] = dtype
+    if desimal_koma:
+        opsi["converters"] = {k: _desimal_koma for k in sorted(desimal_koma)}
+    return opsi
+
+
+def terapkan_skema(df, skema):
+    kolom = skema.get("kolom", {})
+
+    for k in skema.get("desimal_koma", ()):
+        if k in df.columns:
+            nilai = df[k]
+            if not pd.api.types.is_numeric_dtype(nilai):
+                # frame tidak dibaca lewat opsi_read_csv (converter belum jalan)
+                nilai = nilai.astype(str).map(_desimal_koma)
+            df[k] = nilai.astype(kolom.get(k, "float64"))
+
+    for k in skema.get("numerik", ()):
+        if k in df.columns:
+            nilai = df[k]
+            if not pd.api.types.is_numeric_dtype(nilai):
+                # teks: spasi pengapit dibuang dulu, sisa yang bukan angka -> NaN
+                nilai = nilai.astype(str).str.strip()
+            df[k] = pd.to_numeric(nilai, errors="coerce").astype(kolom.get(k, "float64"))
+
+    for k in skema.get("persen", ()):
+        if k in df.columns:
+            # nilai tetap dalam persen: "0.50% " -> 0.5, "2,25%" -> 2.25
+            nilai = df[k].astype(str).str.strip().str.rstrip("%").str.replace(",", ".", regex=False)
+            df[k] = pd.to_numeric(nilai, errors="coerce").astype(kolom.get(k, "float64"))
+
+    for k, tipe in kolom.items():
+        if k in df.columns and isinstance(tipe, str) and tipe.startswith("int") and df[k].dtype != tipe:
+            # Int16 nullable -> int16 numpy jika tidak ada sel kosong; jika ada, tetap nullable
+            if not df[k].isna().any():
+                df[k] = df[k].astype(tipe)
+
+    for k, tipe in kolom.items():
+        if isinstance(tipe, list) and k in df.columns:
+            # level tetap di depan; label tak dikenal tidak dibuang, ditaruh di belakang
+            lain = sorted(set(df[k].dropna().astype(str)) - set(tipe))
+            df[k] = df[k].astype(pd.CategoricalDtype(tipe + lain, ordered=True))
+
+    return df
+
+
+def buang_level_kosong(df):
+    # setelah difilter (mis. per tahun), level category yang tidak muncul
+    # dibuang supaya tidak tampil sebagai slot/legenda kosong di seaborn
+    kategori = df.select_dtypes("category").columns
+    if len(kategori) == 0:
+        return df
+    return df.assign(**{k: df[k].cat.remove_unused_categories() for k in kategori})
@@ -0,0 +1,25 @@
+import os
+import shutil
+import sys
+
+import pytest
+
+# modul dashboard berada di root repo (tanpa paket), jadi root ditaruh di sys.path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import data_store  # noqa: E402
+
+
+@pytest.fixture
+def dataset_sementara(tmp_path, monkeypatch):
+    # folder Dataset & snapshot sementara; dimensi provinsi tetap dari file IKP asli
+    import streamlit as st
+
+    dataset = tmp_path / "Dataset"
+    dataset.mkdir()
+    shutil.copy(os.path.join(data_store.DATASET_DIR, "Indeks Ketahanan Pangan.csv"), dataset)
+    monkeypatch.setattr(data_store, "DATASET_DIR", str(dataset))
+    monkeypatch.setattr(data_store, "SNAPSHOT_DIR", str(tmp_path / "snapshot"))
+    st.cache_resource.clear()
+    yield dataset
+    st.cache_resource.clear()
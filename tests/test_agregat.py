@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from agregat import AggregateCube, _indeks_peringkat
+
+
+@pytest.fixture
+def arr():
+    # 40 wilayah × 5 tahun, banyak nilai kembar & NaN; satu tahun kosong seluruhnya
+    rng = np.random.default_rng(7)
+    arr = rng.integers(0, 6, size=(40, 5)).astype(float)
+    arr[rng.random(arr.shape) < 0.2] = np.nan
+    arr[:, 4] = np.nan
+    return arr
+
+
+def test_posisi_sama_dengan_rank_pandas(arr):
+    indeks = _indeks_peringkat(arr)
+    df = pd.DataFrame(arr)
+    # argsort stabil: nilai kembar diurutkan menurut baris, sama dengan method="first"
+    naik = df.rank(method="first", na_option="keep").to_numpy()
+    turun = df.rank(method="first", ascending=False, na_option="keep").to_numpy()
+    np.testing.assert_array_equal(indeks["posisi_naik"], naik)
+    np.testing.assert_array_equal(indeks["posisi_turun"], turun)
+    np.testing.assert_array_equal(indeks["n_valid"], df.notna().sum().to_numpy())
+
+
+def test_persentil_sama_dengan_rank_max(arr):
+    indeks = _indeks_peringkat(arr)
+    df = pd.DataFrame(arr)
+    harapan = (df.rank(method="max", na_option="keep") / df.notna().sum() * 100).to_numpy()
+    np.testing.assert_allclose(indeks["persentil"], harapan)
+
+
+def test_urutan_nan_di_belakang(arr):
+    indeks = _indeks_peringkat(arr)
+    for y in range(arr.shape[1]):
+        n = indeks["n_valid"][y]
+        urut = arr[indeks["naik"][:n, y], y]
+        assert not np.isnan(urut).any()
+        assert (np.diff(urut) >= 0).all()
+        assert np.isnan(arr[indeks["naik"][n:, y], y]).all()
+
+
+def test_kubus_posisi_dan_urutan(arr):
+    kode = np.arange(11, 11 + arr.shape[0])
+    cube = AggregateCube(kode, [f"P{k}" for k in kode], [2020, 2021, 2022, 2023, 2024], {"produksi": arr})
+    s = pd.Series(arr[:, 1])
+    np.testing.assert_array_equal(cube.posisi("produksi", 2021), s.rank(method="first").to_numpy())
+    np.testing.assert_array_equal(
+        cube.posisi("produksi", 2021, terbesar=True), s.rank(method="first", ascending=False).to_numpy()
+    )
+    harapan = s.sort_values(kind="stable").index[:10].to_numpy()
+    np.testing.assert_array_equal(cube.urutan("produksi", 2021), harapan)
+    assert len(cube.urutan("produksi", 2024)) == 0
+
+
+def test_dari_frame_baris_ganda_seperti_groupby_max():
+    df = pd.DataFrame({
+        "kode_provinsi": [11, 11, 12, 12, 12, 13],
+        "provinsi": ["A", "A", "B", "B", "B", "C"],
+        "tahun": [2020, 2020, 2020, 2021, 2021, 2021],
+        "produksi": [5.0, 9.0, 1.0, np.nan, 4.0, 2.0],
+    })
+    cube = AggregateCube.dari_frame(df, "tahun", ["produksi"], "provinsi")
+    harapan = df.groupby(["kode_provinsi", "tahun"])["produksi"].max().unstack()
+    np.testing.assert_array_equal(cube.values[0], harapan.to_numpy())
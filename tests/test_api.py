@@ -0,0 +1,93 @@
+import json
+import threading
+import urllib.error
+import urllib.request
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+import analitik
+import api
+
+
+@pytest.fixture(scope="module")
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), api.Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def minta(url, metode="GET", **header):
+    # (status, header, body json atau None); status non-2xx tidak dilempar
+    req = urllib.request.Request(url, method=metode, headers=header)
+    try:
+        with urllib.request.urlopen(req, timeout=120) as r:
+            body = r.read()
+            return r.status, r.headers, json.loads(body) if body else None
+    except urllib.error.HTTPError as e:
+        body = e.read()
+        return e.code, e.headers, json.loads(body) if body else None
+
+
+def test_200_dengan_etag_lalu_304(server):
+    status, header, body = minta(server + "/api/produksi/terendah?tahun=2024&komoditas=padi&n=3")
+    assert status == 200
+    assert header["Content-Type"].startswith("application/json")
+    assert len(body["data"]) == 3
+    nilai = [baris["produksi_padi"] for baris in body["data"]]
+    assert nilai == sorted(nilai)
+
+    tag = header["ETag"]
+    status, header, body = minta(server + "/api/produksi/terendah?tahun=2024&komoditas=padi&n=3", **{"If-None-Match": tag})
+    assert (status, body) == (304, None)
+    assert header["ETag"] == tag
+    # ETag lemah dan daftar ETag juga dikenali
+    status, _, _ = minta(server + "/api/produksi/terendah?tahun=2024&komoditas=padi&n=3", **{"If-None-Match": f'"x", W/{tag}'})
+    assert status == 304
+
+
+def test_etag_ikut_versi_dataset_dan_query(server, monkeypatch):
+    _, header, _ = minta(server + "/api/produksi/kpi")
+    _, lain, _ = minta(server + "/api/produksi/tren")
+    assert header["ETag"] != lain["ETag"]
+
+    monkeypatch.setattr(analitik, "versi", lambda: "versi-baru")
+    status, baru, body = minta(server + "/api/produksi/kpi", **{"If-None-Match": header["ETag"]})
+    assert status == 200 and body is not None
+    assert baru["ETag"] != header["ETag"]
+
+
+def test_head_tanpa_body(server):
+    status, header, body = minta(server + "/api/produksi/tren", metode="HEAD")
+    assert status == 200 and body is None
+    assert int(header["Content-Length"]) > 0
+
+
+@pytest.mark.parametrize("path, status", [
+    ("/api/tidak-ada", 404),
+    ("/api/produksi/kpi?foo=1", 400),
+    ("/api/produksi/terendah?tahun=2024&komoditas=kedelai", 400),
+    ("/api/produksi/terendah?tahun=abc", 400),
+    ("/api/produksi/terendah?tahun=2024&n=0", 400),
+    ("/api/produksi/terendah?tahun=2024&n=-3", 400),
+    ("/api/produksi/terendah?tahun=1990", 404),
+    ("/api/gizi/stunting?tahun=2024&n=0", 400),
+])
+def test_status_galat(server, path, status):
+    kode, header, body = minta(server + path)
+    assert kode == status
+    assert header["Content-Type"].startswith("application/json")
+    assert "error" in body
+
+
+def test_galat_tak_terduga_jadi_500_json(server, monkeypatch):
+    def rusak():
+        return 1 / 0
+
+    monkeypatch.setitem(api.RUTE, "/api/versi", (rusak, ()))
+    status, _, body = minta(server + "/api/versi")
+    assert status == 500
+    assert body == {"error": "galat internal server"}
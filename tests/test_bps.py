@@ -0,0 +1,69 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import bps
+from data_store import dataset_path
+
+
+FILE_BPS = bps.temukan_file_bps() if os.path.isdir(bps.DATASET_DIR) else []
+
+
+@pytest.mark.skipif(not FILE_BPS, reason="file mentah BPS tidak ada di Dataset/")
+def test_nama_file_dikenali():
+    for name, komoditas, tahun in FILE_BPS:
+        assert komoditas in ("padi", "jagung")
+        assert 2000 < tahun < 2100
+
+
+@pytest.mark.parametrize("info", FILE_BPS, ids=lambda i: i[0])
+def test_parser_sama_dengan_read_csv(info):
+    name, komoditas, tahun = info
+    df = bps.parse_file_bps(name, komoditas, tahun)
+
+    # pembanding: pandas membaca file utuh, baris judul dicari dengan cara yang sama
+    mentah = pd.read_csv(dataset_path(name), header=None, dtype=str, encoding="utf-8-sig", keep_default_na=False)
+    judul = next(i for i, row in mentah.iterrows() if sum(bps._kolom_metrik(c) is not None for c in row) == 3)
+    posisi = {bps._kolom_metrik(c): j for j, c in enumerate(mentah.iloc[judul]) if bps._kolom_metrik(c)}
+    data = mentah.iloc[judul + 1:]
+    data = data[data[0].str.strip() != ""]
+    data = data.iloc[:data[0].str.strip().str.lower().eq("catatan").to_numpy().argmax() or len(data)]
+
+    assert list(df.columns) == bps.KOLOM
+    assert (df["tahun"] == tahun).all() and (df["komoditas"] == komoditas).all()
+    assert df["provinsi"].tolist() == data[0].str.strip().tolist()
+    for kolom, j in posisi.items():
+        harapan = pd.to_numeric(data[j].str.strip(), errors="coerce").to_numpy(dtype=float)
+        np.testing.assert_array_equal(df[kolom].to_numpy(dtype=float), harapan)
+
+
+def test_parser_header_bertingkat_dan_catatan(tmp_path, monkeypatch):
+    isi = (
+        "﻿38 Provinsi,,,\n"
+        ',"Luas Panen, Produksi, dan Produktivitas Jagung Menurut Provinsi",,\n'
+        ",Luas Panen (ha),Produktivitas (ku/ha),Produksi (ton)\n"
+        ",2024,2024,2024\n"
+        "ACEH,10090.26,51.78,52249.4\n"
+        "RIAU,-,…,1139.41\n"
+        " PAPUA ,990.34,39.52,\n"
+        ",,,\n"
+        "Catatan,angka sementara,,\n"
+    )
+    name = "Luas Panen, Produksi, dan Produktivitas Jagung Menurut Provinsi, 2024.csv"
+    (tmp_path / name).write_text(isi, encoding="utf-8")
+    monkeypatch.setattr(bps, "dataset_path", lambda n: os.path.join(tmp_path, n))
+
+    df = bps.parse_file_bps(name, "jagung", 2024)
+    assert df["provinsi"].tolist() == ["ACEH", "RIAU", "PAPUA"]
+    np.testing.assert_array_equal(df["luas_panen"], [10090.26, np.nan, 990.34])
+    np.testing.assert_array_equal(df["produktivitas"], [51.78, np.nan, 39.52])
+    np.testing.assert_array_equal(df["produksi"], [52249.4, 1139.41, np.nan])
+
+
+def test_parser_tanpa_header_ditolak(tmp_path, monkeypatch):
+    (tmp_path / "x.csv").write_text("a,b,c\n1,2,3\n", encoding="utf-8")
+    monkeypatch.setattr(bps, "dataset_path", lambda n: os.path.join(tmp_path, n))
+    with pytest.raises(ValueError):
+        bps.parse_file_bps("x.csv", "padi", 2024)
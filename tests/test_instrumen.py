@@ -0,0 +1,94 @@
+import json
+
+import pytest
+import streamlit as st
+
+import instrumen
+from lru import LRUCache
+
+
+@pytest.fixture
+def metrik_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(instrumen, "TULIS_METRIK", True)
+    monkeypatch.setattr(instrumen, "METRIK_DIR", str(tmp_path))
+    monkeypatch.setattr(instrumen, "LOG_PATH", str(tmp_path / "spans.jsonl"))
+    monkeypatch.setattr(instrumen, "PROM_PATH", str(tmp_path / "metrics.prom"))
+    monkeypatch.setattr(instrumen, "_tulis_terakhir", 0.0)
+    monkeypatch.setattr(instrumen, "_antrean_log", [])
+    return tmp_path
+
+
+def _run(label):
+    instrumen.mulai_run(label)
+    instrumen.bagian("A")
+    with instrumen.span("A.1"):
+        pass
+    instrumen.bagian("B")
+    return instrumen.selesai_run()
+
+
+def _baris_log(folder):
+    path = folder / "spans.jsonl"
+    return path.read_text(encoding="utf-8").splitlines() if path.exists() else []
+
+
+def test_span_bersarang_dan_bagian_berurutan(monkeypatch):
+    monkeypatch.setattr(instrumen, "TULIS_METRIK", False)
+    hasil = _run("uji")
+    assert hasil["run"] == "uji"
+    assert [(s["span"], s["level"]) for s in hasil["spans"]] == [("A", 0), ("A.1", 1), ("B", 0)]
+    assert hasil["ms"] >= max(s["ms"] for s in hasil["spans"])
+    # di luar run: span hanya masuk counter proses
+    assert instrumen.selesai_run() is None
+
+
+def test_tercache_menghitung_hit_dan_miss():
+    @instrumen.tercache(st.cache_resource, nama="uji_loader")
+    def muat(x):
+        return x * 2
+
+    muat.clear()
+    assert [muat(1), muat(1), muat(2), muat(1)] == [2, 2, 4, 2]
+    loader, _ = instrumen.statistik_cache()
+    # badan fungsi hanya jalan untuk x=1 dan x=2
+    assert loader["uji_loader"] == {"panggilan": 4, "miss": 2, "hit": 2}
+
+
+def test_teks_prometheus():
+    cache = LRUCache(1024)
+    cache.put("a", b"x" * 10)
+    cache.get("a")
+    instrumen.daftarkan_lru("uji_lru", cache)
+    with instrumen.span('nama "aneh"'):
+        pass
+    teks = instrumen.teks_prometheus()
+    assert 'dashboard_span_seconds_count{span="nama \\"aneh\\""}' in teks
+    assert 'dashboard_lru_hits_total{cache="uji_lru"} 1' in teks
+    assert "# TYPE dashboard_rss_bytes gauge" in teks
+
+
+def test_file_metrik_ditampung_per_interval(metrik_dir, monkeypatch):
+    monkeypatch.setattr(instrumen, "INTERVAL_TULIS", 3600)
+    for i in range(3):
+        _run(f"run {i}")
+    # run pertama langsung ditulis, sisanya menunggu interval berikutnya
+    assert len(_baris_log(metrik_dir)) == 1
+    assert (metrik_dir / "metrics.prom").exists()
+
+    instrumen.tulis_metrik()
+    baris = _baris_log(metrik_dir)
+    assert [json.loads(b)["run"] for b in baris] == ["run 0", "run 1", "run 2"]
+
+
+def test_interval_nol_menulis_tiap_run(metrik_dir, monkeypatch):
+    monkeypatch.setattr(instrumen, "INTERVAL_TULIS", 0)
+    for i in range(3):
+        _run(f"run {i}")
+    assert len(_baris_log(metrik_dir)) == 3
+
+
+def test_file_metrik_mati_tanpa_opt_in(tmp_path, monkeypatch):
+    monkeypatch.setattr(instrumen, "TULIS_METRIK", False)
+    monkeypatch.setattr(instrumen, "METRIK_DIR", str(tmp_path / "metrik"))
+    _run("tanpa file")
+    assert not (tmp_path / "metrik").exists()
@@ -0,0 +1,85 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import kabupaten
+from agregat import AggregateCube, rollup_array
+from provinsi import nama_provinsi
+
+
+@pytest.fixture
+def frame():
+    # 6 kabupaten/kota di 3 provinsi × 3 tahun, dengan sel kosong
+    rng = np.random.default_rng(5)
+    kode = np.array([1101, 1102, 1171, 1201, 1202, 5101])
+    df = pd.DataFrame({
+        "kode_kabkota": np.repeat(kode, 3),
+        "kabupaten_kota": np.repeat([f"K{k}" for k in kode], 3),
+        "tahun": np.tile([2022, 2023, 2024], len(kode)),
+        "produksi": rng.uniform(10, 100, 18),
+        "IKP": rng.uniform(50, 90, 18),
+    })
+    df.loc[[1, 4, 7], "produksi"] = np.nan
+    # provinsi 51 hanya punya satu kabupaten, kosong di 2023
+    df.loc[(df["kode_kabkota"] == 5101) & (df["tahun"] == 2023), ["produksi", "IKP"]] = np.nan
+    df["kode_provinsi"] = kabupaten.kode_provinsi_dari(df["kode_kabkota"])
+    return df
+
+
+def _harapan(df, metrik, agregasi):
+    grup = df.groupby(["kode_provinsi", "tahun"])[metrik]
+    hasil = grup.mean() if agregasi == "mean" else grup.sum(min_count=1)
+    return hasil.unstack().to_numpy()
+
+
+def _kubus(df):
+    cube = AggregateCube.dari_frame(df, "tahun", ["produksi", "IKP"], "kabupaten_kota", kolom_kode="kode_kabkota")
+    induk = cube.rollup(kabupaten.kode_provinsi_dari(cube.kode), None, kabupaten.AGREGASI_KABUPATEN)
+    return cube, induk
+
+
+def test_rollup_array_sama_dengan_groupby():
+    arr = np.array([[1.0, np.nan], [2.0, np.nan], [4.0, 3.0]])
+    np.testing.assert_array_equal(rollup_array(arr, [0, 0, 1], 2), [[3.0, np.nan], [4.0, 3.0]])
+    np.testing.assert_array_equal(rollup_array(arr, [0, 0, 1], 2, "mean"), [[1.5, np.nan], [4.0, 3.0]])
+
+
+def test_rollup_provinsi_jumlah_dan_rata_rata(frame):
+    cube, induk = _kubus(frame)
+    np.testing.assert_array_equal(induk.kode, [11, 12, 51])
+    np.testing.assert_allclose(induk.values[induk.m("produksi")], _harapan(frame, "produksi", "sum"))
+    # IKP dirata-rata, bukan dijumlahkan
+    np.testing.assert_allclose(induk.values[induk.m("IKP")], _harapan(frame, "IKP", "mean"))
+    # total nasional sama dari tingkat mana pun
+    np.testing.assert_allclose(induk.total_per_tahun("produksi"), cube.total_per_tahun("produksi"))
+
+
+def test_metrik_dan_irisan_baru_ikut_naik(frame):
+    cube, induk = _kubus(frame)
+    cube.perbarui_irisan("produksi", 2024, np.ones(len(cube.kode)))
+    np.testing.assert_array_equal(induk.irisan("produksi", 2024), [3.0, 2.0, 1.0])
+
+    cube.tambah_metrik("luas", np.full((len(cube.kode), 3), 2.0))
+    np.testing.assert_array_equal(induk.irisan("luas", 2022), [6.0, 4.0, 2.0])
+
+
+def test_load_cube_kabupaten_dari_file(frame, dataset_sementara, monkeypatch):
+    folder = dataset_sementara / "kabupaten"
+    monkeypatch.setattr(kabupaten, "KABUPATEN_DIR", str(folder))
+    assert kabupaten.load_cube_kabupaten(kabupaten.versi_kabupaten()) is None
+
+    # dua file mengisi metrik berbeda; kode provinsi 99 tidak dikenal -> dibuang
+    folder.mkdir()
+    produksi = frame[["kode_kabkota", "kabupaten_kota", "tahun", "produksi"]]
+    asing = pd.DataFrame({"kode_kabkota": [9901], "kabupaten_kota": ["X"], "tahun": [2022], "produksi": [5.0]})
+    pd.concat([produksi, asing]).rename(columns={
+        "kode_kabkota": "Kode Kabupaten/Kota", "kabupaten_kota": "Kabupaten/Kota", "tahun": "Tahun",
+    }).to_csv(folder / "produksi.csv", index=False)
+    frame[["kode_kabkota", "tahun", "IKP"]].to_csv(folder / "ikp.csv", index=False)
+
+    cube, induk = kabupaten.load_cube_kabupaten(kabupaten.versi_kabupaten())
+    np.testing.assert_array_equal(cube.kode, [1101, 1102, 1171, 1201, 1202, 5101])
+    np.testing.assert_array_equal(induk.kode, [11, 12, 51])
+    np.testing.assert_allclose(induk.values[induk.m("produksi")], _harapan(frame, "produksi", "sum"))
+    np.testing.assert_allclose(induk.values[induk.m("IKP")], _harapan(frame, "IKP", "mean"))
+    assert list(induk.nama) == list(nama_provinsi().reindex([11, 12, 51]))
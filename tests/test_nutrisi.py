@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import nutrisi
+from data_store import dataset_path
+from skema import LEVEL_STATUS
+
+
+def _mentah(name):
+    # pembanding: CSV dibaca polos dengan pandas, tanpa skema & tanpa cache
+    return pd.read_csv(dataset_path(name), skipinitialspace=True)
+
+
+@pytest.fixture(scope="module")
+def metrik():
+    return nutrisi.load_metrik_nutrisi()
+
+
+def test_tabel_panjang_unik_dan_positif(metrik):
+    assert list(metrik.columns) == nutrisi.KOLOM
+    assert not metrik.duplicated(["metrik", "kode_provinsi", "tahun"]).any()
+    assert (metrik["nilai"] > 0).all()
+    assert metrik["tahun"].dtype == np.int16
+    assert list(metrik["status"].cat.categories) == LEVEL_STATUS
+
+
+def test_pivot_tahun_sama_dengan_file_ketersediaan():
+    mentah = _mentah("Ketersediaan Energi.csv")
+    mentah = mentah[(mentah["Wilayah"] != "Nasional") & (mentah["Tahun"] == 2022)]
+    wide = nutrisi.pivot_tahun(2022)
+
+    assert nutrisi.KODE_NASIONAL not in wide.index
+    assert wide.columns[0] == "provinsi"
+    aceh = mentah.loc[mentah["Nama Provinsi"].str.upper() == "ACEH"]
+    for kolom in ("Ketersediaan Energi", "Ketersediaan Energi Nabati", "Ketersediaan Energi Hewani"):
+        assert wide.loc[11, kolom] == pytest.approx(float(aceh[kolom].iloc[0]))
+    # satu baris per provinsi yang punya angka di tahun itu
+    assert wide["Ketersediaan Energi"].notna().sum() == (mentah["Ketersediaan Energi"] > 0).sum()
+
+
+def test_pivot_metrik_provinsi_dan_nasional():
+    mentah = _mentah("Rata-rata Konsumsi Protein.csv")
+    aceh = mentah[mentah["Kode Provinsi"] == 11].set_index("Tahun")["Konsumsi Protein (gram/kap/hari)"]
+    wide = nutrisi.pivot_metrik("Konsumsi Protein")
+    np.testing.assert_allclose(wide.loc[11, aceh.index].to_numpy(dtype=float), aceh.to_numpy(dtype=float))
+    assert all(isinstance(c, int) for c in wide.columns)
+
+    nasional = _mentah("Ketersediaan Protein.csv")
+    nasional = nasional[nasional["Wilayah"] == "Nasional"].set_index("Tahun")["Ketersediaan Protein"]
+    wide = nutrisi.pivot_metrik("Ketersediaan Protein")
+    np.testing.assert_allclose(wide.loc[nutrisi.KODE_NASIONAL, nasional.index].to_numpy(dtype=float), nasional.to_numpy(dtype=float))
+
+
+def test_konsumsi_per_jenis_nasional():
+    mentah = _mentah(nutrisi.FILE_KONSUMSI_JENIS)
+    beras = mentah[mentah["Komoditas"] == "Beras"].set_index("Tahun")["konsumsi_pangan"]
+    wide = nutrisi.pivot_metrik("Konsumsi Beras")
+    assert list(wide.index) == [nutrisi.KODE_NASIONAL]
+    np.testing.assert_allclose(wide.loc[0, beras.index].to_numpy(dtype=float), beras.to_numpy(dtype=float))
+
+
+def test_status_tahun_paling_sementara():
+    mentah = _mentah("Ketersediaan Energi.csv")
+    urutan = {s: i for i, s in enumerate(LEVEL_STATUS)}
+    harapan = mentah.groupby("Tahun")["Keterangan"].agg(lambda s: max(s, key=urutan.get)).to_dict()
+    assert nutrisi.status_tahun("Ketersediaan Energi") == harapan
@@ -0,0 +1,108 @@
+import os
+
+import pytest
+
+import bps
+import data_store
+import produksi
+
+FILE_BPS = "Luas Panen, Produktivitas, dan Produksi Padi Menurut Provinsi, {}.csv"
+
+
+def _tulis_wide(folder, name, tahun):
+    # Aceh 100, 101, ... ; Bali 5, 6, ... per kolom tahun
+    baris = ["Provinsi," + ",".join(str(t) for t in tahun)]
+    for nama, awal in (("Aceh", 100), ("Bali", 5)):
+        baris.append(nama + "," + ",".join(str(awal + i) for i in range(len(tahun))))
+    (folder / name).write_text("\n".join(baris) + "\n", encoding="utf-8")
+
+
+def _tulis_bps(folder, tahun, produksi_aceh):
+    isi = (
+        "Provinsi,Luas Panen (ha),Produktivitas (ku/ha),Produksi (ton)\n"
+        f"Aceh,10,50,{produksi_aceh}\n"
+        "Bali,20,60,120\n"
+        "INDONESIA,30,55,999\n"
+    )
+    (folder / FILE_BPS.format(tahun)).write_text(isi, encoding="utf-8")
+
+
+@pytest.fixture
+def folder(dataset_sementara, tmp_path, monkeypatch):
+    _tulis_wide(dataset_sementara, produksi.SUMBER_WIDE["padi"], [2020, 2021])
+    _tulis_wide(dataset_sementara, produksi.SUMBER_WIDE["jagung"], [2020])
+    monkeypatch.setattr(bps, "DATASET_DIR", str(dataset_sementara))
+    monkeypatch.setattr(produksi, "PRODUKSI_DIR", str(tmp_path / "produksi"))
+    monkeypatch.setattr(produksi, "MANIFEST_PATH", str(tmp_path / "produksi" / "manifest.json"))
+    return dataset_sementara
+
+
+def _mtime(kunci):
+    return os.stat(produksi._path_slice(kunci)).st_mtime_ns
+
+
+def test_sinkron_pertama_menulis_semua_slice(folder):
+    _tulis_bps(folder, 2022, 300)
+    manifest, ditulis = produksi.sinkron_produksi()
+    assert sorted(ditulis) == ["jagung:2020", "padi:2020", "padi:2021", "padi:2022"]
+    assert manifest["slice"]["padi:2021"]["sumber"] == produksi.SUMBER_WIDE["padi"]
+    assert manifest["slice"]["padi:2022"]["sumber"] == "BPS"
+    assert os.path.exists(produksi.MANIFEST_PATH)
+
+
+def test_sumber_tidak_berubah_tidak_ditulis_ulang(folder):
+    _tulis_bps(folder, 2022, 300)
+    produksi.sinkron_produksi()
+    sebelum = os.stat(produksi.MANIFEST_PATH).st_mtime_ns
+
+    _, ditulis = produksi.sinkron_produksi()
+    assert ditulis == []
+    assert os.stat(produksi.MANIFEST_PATH).st_mtime_ns == sebelum
+
+
+def test_tahun_baru_hanya_menambah_slice_baru(folder):
+    _tulis_bps(folder, 2022, 300)
+    produksi.sinkron_produksi()
+    lama = {k: _mtime(k) for k in ("padi:2020", "padi:2021", "padi:2022")}
+
+    _tulis_bps(folder, 2023, 400)
+    manifest, ditulis = produksi.sinkron_produksi()
+    assert ditulis == ["padi:2023"]
+    assert {k: _mtime(k) for k in lama} == lama
+    assert set(manifest["slice"]) == {"jagung:2020", "padi:2020", "padi:2021", "padi:2022", "padi:2023"}
+
+
+def test_file_lebar_diutamakan_untuk_tahun_yang_sama(folder):
+    # file BPS 2021 bertabrakan dengan kolom 2021 di file lebar
+    _tulis_bps(folder, 2021, 777)
+    manifest, _ = produksi.sinkron_produksi()
+    assert manifest["slice"]["padi:2021"]["sumber"] == produksi.SUMBER_WIDE["padi"]
+
+    df = produksi.load_produksi_long()
+    aceh = df[(df["komoditas"] == "padi") & (df["tahun"] == 2021) & (df["kode_provinsi"] == 11)]
+    assert aceh["produksi"].tolist() == [101]
+
+
+def test_tabel_panjang_dan_versi(folder):
+    _tulis_bps(folder, 2022, 300)
+    versi = produksi.versi_produksi()
+    df = produksi.load_produksi_long()
+    assert list(df.columns) == produksi.KOLOM
+    # baris INDONESIA (agregat nasional) tidak ikut sebagai provinsi
+    assert set(df["kode_provinsi"]) == {11, 51}
+    assert df.groupby(["komoditas", "tahun"]).size().to_dict() == {
+        ("jagung", 2020): 2, ("padi", 2020): 2, ("padi", 2021): 2, ("padi", 2022): 2,
+    }
+    assert df.loc[(df["tahun"] == 2022) & (df["kode_provinsi"] == 11), "produksi"].tolist() == [300]
+
+    _tulis_bps(folder, 2023, 400)
+    assert produksi.versi_produksi() != versi
+
+
+def test_versi_dihitung_sekali_per_run(folder, monkeypatch):
+    panggilan = []
+    asli = produksi._stamp_sumber
+    monkeypatch.setattr(produksi, "_stamp_sumber", lambda: panggilan.append(1) or asli())
+    with data_store.versi_per_run():
+        versi = {produksi.versi_produksi() for _ in range(3)}
+    assert len(versi) == 1 and len(panggilan) == 1
@@ -0,0 +1,80 @@
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats
+
+from regresi import RegressionTable, fit_ols, garis_ols
+
+
+def _acak(k=6, n=30, seed=3):
+    rng = np.random.default_rng(seed)
+    x = rng.normal(size=(k, n))
+    y = 2.5 * x + rng.normal(scale=0.7, size=(k, n)) + np.arange(k)[:, None]
+    x[rng.random(x.shape) < 0.15] = np.nan
+    y[rng.random(y.shape) < 0.15] = np.nan
+    return x, y
+
+
+def test_fit_ols_sama_dengan_linregress():
+    x, y = _acak()
+    fit = fit_ols(x, y)
+    for i in range(len(x)):
+        m = ~(np.isnan(x[i]) | np.isnan(y[i]))
+        ref = stats.linregress(x[i, m], y[i, m])
+        assert fit["n"][i] == m.sum()
+        assert fit["slope"][i] == pytest.approx(ref.slope)
+        assert fit["intercept"][i] == pytest.approx(ref.intercept)
+        assert fit["r"][i] == pytest.approx(ref.rvalue)
+        assert fit["r2"][i] == pytest.approx(ref.rvalue ** 2)
+
+
+def test_pita_kepercayaan_sama_dengan_rumus_scipy():
+    x, y = _acak(k=1)
+    fit = fit_ols(x, y)
+    xs, yhat, lo, hi = garis_ols(fit, level=0.95, titik=7)
+
+    m = ~(np.isnan(x[0]) | np.isnan(y[0]))
+    xv, yv = x[0, m], y[0, m]
+    ref = stats.linregress(xv, yv)
+    n = len(xv)
+    sisa = yv - (ref.intercept + ref.slope * xv)
+    s = np.sqrt((sisa ** 2).sum() / (n - 2))
+    se = s * np.sqrt(1 / n + (xs[0] - xv.mean()) ** 2 / ((xv - xv.mean()) ** 2).sum())
+    t = stats.t.ppf(0.975, n - 2)
+    np.testing.assert_allclose(yhat[0], ref.intercept + ref.slope * xs[0])
+    np.testing.assert_allclose(hi[0] - yhat[0], t * se)
+    np.testing.assert_allclose(yhat[0] - lo[0], t * se)
+
+
+def test_pasangan_kurang_dari_dua_titik_tanpa_garis():
+    x = np.array([[1.0, np.nan, np.nan], [np.nan, np.nan, np.nan]])
+    y = np.array([[2.0, 3.0, np.nan], [1.0, 2.0, 3.0]])
+    fit = fit_ols(x, y)
+    np.testing.assert_array_equal(fit["n"], [1, 0])
+    assert np.isnan(fit["slope"]).all()
+
+
+def test_tabel_regresi_dari_frame():
+    rng = np.random.default_rng(11)
+    df = pd.DataFrame({
+        "provinsi": pd.Categorical(rng.choice(["Aceh", "Bali", "Papua"], size=90)),
+        "p0": rng.normal(size=90),
+        "rls": rng.normal(size=90),
+    })
+    df["ikp"] = 60 - 3 * df["p0"] + rng.normal(size=90)
+    df.loc[rng.random(90) < 0.1, "rls"] = np.nan
+
+    tabel = RegressionTable.dari_frame(df, "provinsi", ["p0", "rls"], "ikp")
+    for (prov, faktor) in tabel.kunci:
+        bagian = df[df["provinsi"] == prov].dropna(subset=[faktor, "ikp"])
+        ref = stats.linregress(bagian[faktor], bagian["ikp"])
+        koef = tabel.koef(prov, faktor)
+        assert koef["n"] == len(bagian)
+        assert koef["slope"] == pytest.approx(ref.slope)
+        assert koef["r"] == pytest.approx(ref.rvalue)
+        assert koef["spearman"] == pytest.approx(stats.spearmanr(bagian[faktor], bagian["ikp"]).statistic)
+
+    # faktor diurutkan menurut |r|; p0 dibuat berkorelasi kuat
+    assert tabel.peringkat("Bali")["faktor"].iloc[0] == "p0"
+    assert tabel.matriks().shape == (3, 2)
+    assert tabel.koef("Jawa", "p0") is None
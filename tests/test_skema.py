@@ -0,0 +1,88 @@
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from data_store import dataset_path
+from skema import LEVEL_KERENTANAN, SKEMA, opsi_read_csv, skema_untuk, terapkan_skema
+
+
+def _baca(teks, skema):
+    df = pd.read_csv(io.StringIO(teks), **opsi_read_csv(skema))
+    return terapkan_skema(df, skema)
+
+
+def test_opsi_read_csv():
+    skema = {
+        "kolom": {"TAHUN": "int16", "IKP": "float32", "Kelas": LEVEL_KERENTANAN, "Nama": "kategori"},
+        "desimal_koma": ["IKP"],
+    }
+    opsi = opsi_read_csv(skema)
+    # integer dibaca nullable; kolom desimal koma lewat converter, bukan dtype
+    assert opsi["dtype"] == {"TAHUN": "Int16", "Kelas": "category", "Nama": "category"}
+    assert list(opsi["converters"]) == ["IKP"]
+    assert opsi_read_csv({}) == {}
+    assert skema_untuk("tidak ada.csv") == {}
+
+
+def test_integer_dengan_sel_kosong_tidak_gagal():
+    skema = {"kolom": {"TAHUN": "int16", "KPM": "int32"}}
+    df = _baca("TAHUN,KPM\n2023,5\n2024,\n", skema)
+    # kolom lengkap kembali ke int numpy, kolom bolong tetap nullable
+    assert df["TAHUN"].dtype == np.int16
+    assert df["KPM"].dtype == "Int32"
+    assert df["KPM"].isna().tolist() == [False, True]
+
+
+def test_desimal_koma_numerik_dan_persen():
+    skema = {
+        "kolom": {"TAHUN": "int16", "IKP": "float32", "Harga": "float64", "Naik": "float32"},
+        "desimal_koma": ["IKP"],
+        "numerik": ["Harga"],
+        "persen": ["Naik"],
+    }
+    teks = 'TAHUN,IKP,Harga,Naik\n2023,"66,22", 1500 ,0.50% \n2024,"70,5",-,"2,25%"\n2025,,0,0%\n'
+    df = _baca(teks, skema)
+    assert df["TAHUN"].dtype == np.int16
+    assert df["IKP"].dtype == np.float32
+    assert df["Naik"].dtype == np.float32
+    np.testing.assert_allclose(df["IKP"], np.array([66.22, 70.5, np.nan], dtype=np.float32))
+    np.testing.assert_array_equal(df["Harga"], [1500.0, np.nan, 0.0])
+    np.testing.assert_allclose(df["Naik"], np.array([0.5, 2.25, 0.0], dtype=np.float32))
+
+
+def test_level_tetap_berurutan_label_asing_di_belakang():
+    skema = {"kolom": {"Kelas": LEVEL_KERENTANAN}}
+    df = _baca("No,Kelas\n1,Tahan\n2,Z Baru\n3,Sangat Rentan\n4,\n", skema)
+    tipe = df["Kelas"].dtype
+    assert tipe.ordered
+    assert list(tipe.categories) == LEVEL_KERENTANAN + ["Z Baru"]
+    assert df["Kelas"].min() == "Sangat Rentan"
+    assert df["Kelas"].isna().sum() == 1
+
+
+@pytest.mark.parametrize("name", sorted(SKEMA))
+def test_skema_dataset_tidak_mengubah_nilai(name):
+    # nilai setelah skema sama dengan read_csv polos (toleransi presisi float32)
+    try:
+        polos = pd.read_csv(dataset_path(name))
+    except FileNotFoundError:
+        pytest.skip(f"{name} tidak ada di Dataset/")
+    skema = skema_untuk(name)
+    df = terapkan_skema(pd.read_csv(dataset_path(name), **opsi_read_csv(skema)), skema)
+
+    assert list(df.columns) == list(polos.columns)
+    khusus = set(skema.get("desimal_koma", ())) | set(skema.get("numerik", ())) | set(skema.get("persen", ()))
+    for kolom in khusus & set(df.columns):
+        assert pd.api.types.is_numeric_dtype(df[kolom])
+    for kolom, tipe in skema.get("kolom", {}).items():
+        if kolom not in df.columns:
+            continue
+        if isinstance(tipe, list) or tipe == "kategori":
+            assert isinstance(df[kolom].dtype, pd.CategoricalDtype)
+            assert df[kolom].astype(object).where(df[kolom].notna()).tolist() == polos[kolom].where(polos[kolom].notna()).tolist()
+        else:
+            assert df[kolom].dtype == np.dtype(tipe)
+            if kolom not in khusus:
+                np.testing.assert_allclose(df[kolom].to_numpy(dtype=float), polos[kolom].to_numpy(dtype=float), rtol=1e-6)
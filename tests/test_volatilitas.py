@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import volatilitas
+from data_store import dataset_path
+from volatilitas import JENDELA, TINGKAT, VolatilitasHarga
+
+
+@pytest.fixture
+def frame():
+    # 6 komoditas × 4 tahun per tingkat, nilai kembar & sel kosong; "Garam" hanya di konsumen
+    rng = np.random.default_rng(9)
+    komoditas = ["Beras", "Cabai", "Bawang Merah", "Daging Sapi", "Gula", "Garam"]
+    baris = []
+    for tingkat in TINGKAT:
+        for k in komoditas:
+            if tingkat == "produsen" and k == "Garam":
+                continue
+            label = "Sapi (Hidup)" if (tingkat, k) == ("produsen", "Daging Sapi") else k
+            for tahun in (2021, 2022, 2023, 2024):
+                baris.append((tingkat, tahun, k, label, float(rng.integers(1, 8))))
+    df = pd.DataFrame(baris, columns=["tingkat", "tahun", "komoditas", "label", "cv"])
+    df.loc[rng.choice(len(df), 6, replace=False), "cv"] = np.nan
+    return df
+
+
+def _lebar(df, tingkat):
+    return df[df["tingkat"] == tingkat].pivot(index="komoditas", columns="tahun", values="cv")
+
+
+def test_selisih_dan_perubahan_sama_dengan_pandas(frame):
+    vol = VolatilitasHarga.dari_frame(frame)
+    konsumen = _lebar(frame, "konsumen").reindex(vol.komoditas)
+    produsen = _lebar(frame, "produsen").reindex(vol.komoditas)
+
+    np.testing.assert_array_equal(vol.seri("selisih").to_numpy(), (konsumen - produsen).to_numpy())
+    np.testing.assert_array_equal(vol.seri("perubahan", "konsumen").to_numpy(), konsumen.diff(axis=1).to_numpy())
+    np.testing.assert_array_equal(vol.seri("cv", "produsen").to_numpy(), produsen.to_numpy())
+
+
+def test_rata_bergerak_dan_peringkat_sama_dengan_pandas(frame):
+    vol = VolatilitasHarga.dari_frame(frame)
+    for tingkat in TINGKAT:
+        lebar = _lebar(frame, tingkat).reindex(vol.komoditas)
+        rata = lebar.T.rolling(JENDELA, min_periods=1).mean().T
+        np.testing.assert_allclose(vol.seri("rata_bergerak", tingkat).to_numpy(), rata.to_numpy())
+        # 1 = paling volatil; nilai kembar mengikuti urutan komoditas
+        peringkat = rata.rank(ascending=False, method="first", na_option="keep")
+        np.testing.assert_array_equal(vol.seri("peringkat", tingkat).to_numpy(), peringkat.to_numpy())
+
+
+def test_pasangan_dan_label_produsen(frame):
+    vol = VolatilitasHarga.dari_frame(frame)
+    berpasangan = dict(zip(vol.komoditas, vol.berpasangan))
+    assert not berpasangan["Garam"]
+    assert all(v for k, v in berpasangan.items() if k != "Garam")
+    assert vol.nama_tingkat("produsen", "Daging Sapi") == "Sapi (Hidup)"
+    assert vol.nama_tingkat("konsumen", "Daging Sapi") == "Daging Sapi"
+
+    df = vol.frame_tahun(2023)
+    assert df["selisih"].isna().tolist() == np.isnan(vol.selisih[:, vol.t(2023)]).tolist()
+    assert df.loc[df["komoditas"] == "Garam", "selisih"].isna().all()
+
+
+def test_file_cv_asli():
+    vol = volatilitas.load_volatilitas()
+    mentah = pd.read_csv(dataset_path(volatilitas.FILE_HARGA["konsumen"]), skiprows=1)
+    mentah["Komoditas"] = mentah["Komoditas"].str.strip().replace(volatilitas.ALIAS_KOMODITAS)
+    mentah["CV"] = pd.to_numeric(mentah["CV"].str.strip().str.rstrip("%").str.replace(",", "."), errors="coerce")
+    harapan = mentah.pivot(index="Komoditas", columns="Tahun", values="CV")
+
+    cv = vol.seri("cv", "konsumen").reindex(harapan.index)
+    np.testing.assert_allclose(cv[harapan.columns].to_numpy(), harapan.to_numpy(), rtol=1e-6)
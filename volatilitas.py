@@ -0,0 +1,162 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from data_store import dataset_version, read_dataset
+from instrumen import tercache
+
+# ================================================================
+# KONFIGURASI VOLATILITAS HARGA
+# ================================================================
+# koefisien variasi (CV, %) harga bulanan per komoditas per tahun;
+# urutan di sini = urutan sumbu tingkat di array
+FILE_HARGA = {
+    "konsumen": "Koefisien Variasi Harga Pangan Tingkat Konsumen.csv",
+    "produsen": "Koefisien Variasi Harga Pangan Tingkat Produsen.csv",
+}
+TINGKAT = list(FILE_HARGA)
+
+# singkatan yang dipakai file konsumen
+ALIAS_KOMODITAS = {
+    "Bamer": "Bawang Merah",
+    "Baput": "Bawang Putih",
+    "Migor Curah": "Minyak Goreng Curah",
+}
+
+# produk tingkat produsen -> padanannya di tingkat konsumen (rantai pasok yang sama)
+PADANAN_PRODUSEN = {
+    "Sapi (Hidup)": "Daging Sapi",
+    "Ayam Ras (Hidup)": "Daging Ayam",
+}
+
+# jendela (tahun) rata-rata bergerak untuk peringkat volatilitas
+JENDELA = 2
+
+
+def versi_harga():
+    return dataset_version(*FILE_HARGA.values())
+
+
+# ================================================================
+# PARSING FILE CV
+# ================================================================
+def _baca_cv(tingkat):
+    # baris pertama file kosong (",,,"), header di baris kedua, kolom pertama kosong;
+    # persen "0.50% " / "2,25%" sudah jadi angka lewat skema
+    df = read_dataset(FILE_HARGA[tingkat], skiprows=1)
+    label = df["Komoditas"].astype(str).str.strip()
+    komoditas = label.replace(ALIAS_KOMODITAS)
+    if tingkat == "produsen":
+        komoditas = komoditas.replace(PADANAN_PRODUSEN)
+    return pd.DataFrame({
+        "tingkat": tingkat,
+        "tahun": df["Tahun"].to_numpy(),
+        "komoditas": komoditas.to_numpy(),
+        "label": label.to_numpy(),
+        "cv": df["CV"].to_numpy(dtype=float),
+    })
+
+
+# ================================================================
+# ARRAY CV (TINGKAT × KOMODITAS × TAHUN) + STATISTIK TURUNAN
+# ================================================================
+def _peringkat(arr):
+    # peringkat di sumbu komoditas, 1 = paling volatil; NaN tetap NaN
+    kunci = np.where(np.isnan(arr), -np.inf, arr)
+    urut = np.argsort(-kunci, axis=1, kind="stable")
+    rank = np.empty(arr.shape, dtype=float)
+    nomor = np.arange(1, arr.shape[1] + 1, dtype=float)[None, :, None]
+    np.put_along_axis(rank, urut, np.broadcast_to(nomor, arr.shape), axis=1)
+    return np.where(np.isnan(arr), np.nan, rank)
+
+
+class VolatilitasHarga:
+
+    def __init__(self, komoditas, tahun, cv, label=None):
+        self.komoditas = np.asarray(komoditas, dtype=object)
+        self.tahun = np.asarray(tahun)
+        self.cv = cv
+        # nama asli per tingkat, mis. {("produsen", "Daging Sapi"): "Sapi (Hidup)"}
+        self.label = label or {}
+        self._index_tahun = {int(t): i for i, t in enumerate(self.tahun)}
+        self._index_komoditas = {k: i for i, k in enumerate(self.komoditas)}
+        self._hitung()
+
+    @classmethod
+    def dari_frame(cls, df):
+        # df panjang: tingkat, tahun, komoditas, label, cv
+        komoditas = pd.unique(df["komoditas"])
+        tahun = np.sort(pd.unique(df["tahun"]))
+        i = pd.Categorical(df["tingkat"], categories=TINGKAT).codes
+        k = pd.Categorical(df["komoditas"], categories=komoditas).codes
+        t = np.searchsorted(tahun, df["tahun"].to_numpy())
+
+        cv = np.full((len(TINGKAT), len(komoditas), len(tahun)), np.nan)
+        cv[i, k, t] = df["cv"].to_numpy(dtype=float)
+
+        beda = df[df["label"] != df["komoditas"]].drop_duplicates(["tingkat", "komoditas"])
+        label = dict(zip(zip(beda["tingkat"], beda["komoditas"]), beda["label"]))
+        return cls(komoditas, tahun, cv, label)
+
+    def _hitung(self):
+        # semua statistik dalam satu lintasan array, tanpa loop per komoditas/tahun
+        cv = self.cv
+        ada = ~np.isnan(cv)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            # selisih konsumen - produsen (poin persen), NaN jika salah satu kosong
+            self.selisih = cv[0] - cv[1]
+
+            # perubahan dari tahun sebelumnya (poin persen); tahun pertama NaN
+            self.perubahan = np.concatenate(
+                [np.full(cv.shape[:2] + (1,), np.nan), np.diff(cv, axis=2)], axis=2
+            )
+
+            # rata-rata bergerak JENDELA tahun lewat selisih jumlah kumulatif
+            jumlah = np.cumsum(np.where(ada, cv, 0.0), axis=2)
+            cacah = np.cumsum(ada, axis=2)
+            jumlah[..., JENDELA:] -= jumlah[..., :-JENDELA].copy()
+            cacah[..., JENDELA:] -= cacah[..., :-JENDELA].copy()
+            self.rata_bergerak = np.where(cacah > 0, jumlah / cacah, np.nan)
+
+        self.peringkat = _peringkat(self.rata_bergerak)
+        # komoditas yang tercatat di kedua tingkat
+        self.berpasangan = ada.any(axis=2).all(axis=0)
+
+    # ================= AKSES =================
+    def t(self, tahun):
+        return self._index_tahun[int(tahun)]
+
+    def nama_tingkat(self, tingkat, komoditas):
+        return self.label.get((tingkat, komoditas), komoditas)
+
+    def frame_tahun(self, tahun):
+        # satu baris per komoditas untuk satu tahun
+        j = self.t(tahun)
+        df = pd.DataFrame({"komoditas": self.komoditas})
+        for i, tingkat in enumerate(TINGKAT):
+            df[f"cv_{tingkat}"] = self.cv[i, :, j]
+            df[f"perubahan_{tingkat}"] = self.perubahan[i, :, j]
+            df[f"peringkat_{tingkat}"] = self.peringkat[i, :, j]
+        df["selisih"] = self.selisih[:, j]
+        df["berpasangan"] = self.berpasangan
+        return df
+
+    def seri(self, nama, tingkat=None):
+        # komoditas × tahun untuk satu statistik ("cv", "selisih", "perubahan", ...)
+        arr = getattr(self, nama)
+        if tingkat is not None:
+            arr = arr[TINGKAT.index(tingkat)]
+        return pd.DataFrame(arr, index=self.komoditas, columns=[int(t) for t in self.tahun])
+
+
+# ================================================================
+# LOADER TERCACHE
+# ================================================================
+def load_volatilitas():
+    return _load_volatilitas(versi_harga())
+
+
+@tercache(st.cache_resource, show_spinner=False)
+def _load_volatilitas(versi):
+    df = pd.concat([_baca_cv(tingkat) for tingkat in TINGKAT], ignore_index=True)
+    return VolatilitasHarga.dari_frame(df)